@@ -0,0 +1,39 @@
+"""
+Measure evaluation times of Padé and Taylor kernels on the built-in int and gmpy2 integer backends by decimals, and
+report the smallest decimals from which the gmpy2 backend is consistently faster (the crossover point).
+"""
+
+import timeit
+
+from expapprox.approximators import PadeApproximator, TaylorApproximator
+from expapprox.utils import fixed_range
+
+# (fixed-point conversion of Taylor constants is limited to float range)
+DECIMALS = [10, 20, 30, 50, 75, 100, 150, 200]
+CONFIGURATIONS = [(PadeApproximator, 7), (TaylorApproximator, 16)]
+
+
+def evaluation_time(approximator) -> float:
+    """Minimal mean time (in microseconds) of evaluating fixed-point inputs."""
+    xs = list(fixed_range("-0.35", "0.35", "0.01", approximator.decimals))
+    return min(timeit.repeat(lambda: [approximator.approx(x) for x in xs], number=50, repeat=7)) / (50 * len(xs)) * 1e6
+
+
+def main():
+    for cls, order in CONFIGURATIONS:
+        print(f"{cls.__name__} (order {order})")
+        print(f"{'decimals':>10}{'int [us]':>12}{'gmpy2 [us]':>12}{'speedup':>10}")
+        crossover = None
+        for decimals in DECIMALS:
+            int_time = evaluation_time(cls(decimals, order))
+            gmpy2_time = evaluation_time(cls(decimals, order, backend="gmpy2"))
+            if gmpy2_time >= int_time:
+                crossover = None
+            elif crossover is None:
+                crossover = decimals
+            print(f"{decimals:>10}{int_time:>12.2f}{gmpy2_time:>12.2f}{int_time / gmpy2_time:>10.2f}")
+        print(f"crossover: {crossover} decimals\n")
+
+
+if __name__ == "__main__":
+    main()
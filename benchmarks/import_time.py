@@ -0,0 +1,43 @@
+"""
+Measure import times (median of cumulative -X importtime over fresh interpreters) of the integer evaluation core and
+whether mpmath is loaded by importing it and evaluating an approximation.
+"""
+import statistics
+import subprocess
+import sys
+
+RUNS = 20
+STATEMENTS = {
+    "expapprox.approximator": "import expapprox.approximator",
+    "expapprox.approximators": "import expapprox.approximators",
+    "expapprox.approximators.pade": "import expapprox.approximators.pade",
+    "mpmath": "import mpmath",
+}
+EVALUATION = (
+    "import sys; from expapprox.approximators import BitShiftPadeApproximator as A; "
+    "a = A(16, 3); a.approx(a.to_fixed(1.5)); print('mpmath' in sys.modules)"
+)
+
+
+def import_time(module: str, statement: str) -> float:
+    """Cumulative import time (in milliseconds) of module in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True
+    )
+    for line in result.stderr.splitlines():
+        _, _, cumulative, name = (part.strip() for part in line.replace(":", "|", 1).split("|"))
+        if name == module:
+            return int(cumulative) / 1000
+    raise RuntimeError(f"Module {module} not imported")
+
+
+def main():
+    for module, statement in STATEMENTS.items():
+        times = [import_time(module, statement) for _ in range(RUNS)]
+        print(f"{module:<32}{statistics.median(times):>8.1f} ms")
+    loaded = subprocess.run([sys.executable, "-c", EVALUATION], capture_output=True, text=True, check=True).stdout
+    print(f"mpmath loaded by construction and evaluation: {loaded.strip()}")
+
+
+if __name__ == "__main__":
+    main()
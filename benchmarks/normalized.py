@@ -0,0 +1,30 @@
+"""
+Report the effect of normalized coefficients of Padé and Taylor approximators on the peak bit width of intermediaries
+(max bits) and on the maximal relative errors over the remainder domain of bit-shifted approximators.
+"""
+
+from expapprox.approximators import PadeApproximator, TaylorApproximator
+from expapprox.utils import float_range
+
+DECIMALS = 16
+CONFIGURATIONS = [(PadeApproximator, [2, 3, 5, 7]), (TaylorApproximator, [4, 8, 12, 16])]
+XS = float_range(-0.35, 0.35, 0.005)
+
+
+def main():
+    print(f"{DECIMALS} decimals, inputs in [-0.35, 0.35]")
+    print(f"{'approximator':<20}{'order':>6}{'bits':>8}{'normalized':>12}{'error':>12}{'normalized':>12}")
+    for cls, orders in CONFIGURATIONS:
+        for order in orders:
+            approximator = cls(DECIMALS, order)
+            normalized_approximator = cls(DECIMALS, order, normalized=True)
+            error = max(approximator.benchmark(XS))
+            normalized_error = max(normalized_approximator.benchmark(XS))
+            print(
+                f"{cls.__name__:<20}{order:>6}{approximator.max_bits(XS):>8}"
+                f"{normalized_approximator.max_bits(XS):>12}{error:>12.2e}{normalized_error:>12.2e}"
+            )
+
+
+if __name__ == "__main__":
+    main()
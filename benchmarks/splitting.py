@@ -0,0 +1,71 @@
+"""
+Measure evaluation times of the binary-splitting approximator (on the built-in int and gmpy2 integer backends) against
+the normalized Taylor kernel (on gmpy2, at the order precise to the decimals) and the mpmath reference at the same
+precision by decimals, on inputs in [-log(2)/2, log(2)/2] (to which the Taylor kernel is restricted), and of the
+number of lookup tables at fixed decimals.
+"""
+
+import math
+import timeit
+
+import mpmath
+
+from expapprox.approximators import BinarySplittingApproximator, TaylorApproximator
+from expapprox.utils import fixed_range
+
+DECIMALS = [50, 100, 500, 1000, 2000, 5000, 10000, 20000]
+# (beyond which the Taylor kernel takes seconds per evaluation)
+MAX_TAYLOR_DECIMALS = 5000
+TABLES = [0, 1, 2, 4, 8, 12, 16]
+TABLES_DECIMALS = 5000
+
+
+def evaluation_time(fn, xs: list) -> float:
+    """Minimal mean time (in microseconds) of evaluating inputs."""
+    return min(timeit.repeat(lambda: [fn(x) for x in xs], number=1, repeat=3)) / len(xs) * 1e6
+
+
+def inputs(decimals: int) -> list[int]:
+    return list(fixed_range("-0.34", "0.34", "0.05", decimals))
+
+
+def taylor_order(decimals: int) -> int:
+    """Smallest order s.t. the truncation error on [-log(2)/2, log(2)/2] is below the last decimal."""
+    order = 1
+    while (order + 1) * math.log10(math.log(2) / 2) - math.lgamma(order + 2) / math.log(10) > -decimals - 1:
+        order += 1
+    return order
+
+
+def main():
+    print(
+        f"{'decimals':>10}{'int [us]':>14}{'gmpy2 [us]':>14}{'Taylor [us]':>14}{'mpmath [us]':>14}"
+        f"{'vs Taylor':>11}{'vs mpmath':>11}"
+    )
+    for decimals in DECIMALS:
+        xs = inputs(decimals)
+        int_time = evaluation_time(BinarySplittingApproximator(decimals, backend="int").approx, xs)
+        gmpy2_time = evaluation_time(BinarySplittingApproximator(decimals, backend="gmpy2").approx, xs)
+        taylor_time = math.nan
+        if decimals <= MAX_TAYLOR_DECIMALS:
+            taylor = TaylorApproximator(decimals, taylor_order(decimals), backend="gmpy2", normalized=True)
+            taylor_time = evaluation_time(taylor.approx, xs)
+        with mpmath.workdps(decimals):
+            identity = mpmath.mpf(10) ** decimals
+            mpfs = [mpmath.mpf(x) / identity for x in xs]
+            mpmath_time = evaluation_time(mpmath.exp, mpfs)
+        print(
+            f"{decimals:>10}{int_time:>14.1f}{gmpy2_time:>14.1f}{taylor_time:>14.1f}{mpmath_time:>14.1f}"
+            f"{taylor_time / gmpy2_time:>11.2f}{mpmath_time / gmpy2_time:>11.2f}"
+        )
+
+    print(f"\n{TABLES_DECIMALS} decimals (gmpy2)")
+    print(f"{'tables':>10}{'time [us]':>14}")
+    xs = inputs(TABLES_DECIMALS)
+    for tables in TABLES:
+        approximator = BinarySplittingApproximator(TABLES_DECIMALS, tables, backend="gmpy2")
+        print(f"{tables:>10}{evaluation_time(approximator.approx, xs):>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
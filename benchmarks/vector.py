@@ -0,0 +1,42 @@
+"""
+Measure evaluation times of bit-shifted Padé approximators on Python ints (scalar) and on NumPy arrays of two-limb
+integers (vectorized), validating that outputs are bit-identical.
+"""
+
+import random
+import timeit
+
+import numpy as np
+
+from expapprox.approximators import BitShiftPadeApproximator
+from expapprox.vector import VectorizedBitShiftPadeApproximator
+
+SIZE = 100_000
+CONFIGURATIONS = [
+    BitShiftPadeApproximator(16, 1),
+    BitShiftPadeApproximator(16, 3),
+    BitShiftPadeApproximator(16, 3, normalized=True),
+    BitShiftPadeApproximator(12, 4, normalized=True),
+]
+
+
+def main():
+    print(f"{'approximator':<66}{'scalar [us]':>12}{'vector [us]':>12}{'speedup':>10}")
+    for approximator in CONFIGURATIONS:
+        vectorized = VectorizedBitShiftPadeApproximator(approximator)
+        random.seed(0)
+        identity = approximator.identity
+        xs = [random.randint(-40 * identity, 40 * identity) for _ in range(SIZE)]
+        array = np.array(xs)
+        if vectorized.approx(array).to_ints() != [approximator.approx(x) for x in xs]:
+            raise RuntimeError(f"Vectorized outputs differ for {approximator!r}")
+        scalar_time = min(timeit.repeat(lambda: [approximator.approx(x) for x in xs], number=1, repeat=5)) / SIZE
+        vector_time = min(timeit.repeat(lambda: vectorized.approx(array), number=1, repeat=5)) / SIZE
+        print(
+            f"{approximator!r:<66}{scalar_time * 1e6:>12.3f}{vector_time * 1e6:>12.3f}"
+            f"{scalar_time / vector_time:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
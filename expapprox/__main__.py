@@ -0,0 +1,3 @@
+from expapprox.cli import main
+
+main()
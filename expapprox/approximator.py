@@ -1,15 +1,25 @@
 import math
+import sys
 import typing
 from abc import ABC, abstractmethod
 
-import mpmath
-
 from expapprox import errors
-from expapprox.tracker import IntegerTracker
+from expapprox.tracker import FixedWidthTracker, IntegerTracker, Overflow
 
 # mpmath float alias - actual type is dynamic and not handled properly by pyright etc.
 mpf = float
 
+# relative errors above threshold are computed from built-in float reference values (when available)
+FLOAT_REFERENCE_THRESHOLD = 1e-10
+# additional decimals of mpmath reference values beyond the magnitude of the relative error
+GUARD_DECIMALS = 5
+# precision (in bits) of built-in floats and the default precision of mpmath floats
+DOUBLE_PRECISION = 53
+# maximal decimals s.t. the identity is exactly representable by a built-in float (10^22 = 2^22 * 5^22 < 2^75)
+MAX_FLOAT_DECIMALS = 22
+
+# NOTE: mpmath is imported lazily s.t. the (integer) evaluation core can be imported without it
+
 
 class Approximator(ABC):
     """Base class for approximators."""
@@ -18,7 +28,7 @@ class Approximator(ABC):
 
     def _fields(self) -> list[str]:
         """Get fields used in string representation."""
-        return [""]
+        return []
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({', '.join(self._fields())})"
@@ -33,7 +43,7 @@ class Approximator(ABC):
         try:
             return self(x)
         except:
-            return mpmath.nan
+            return math.nan
 
     @classmethod
     @abstractmethod
@@ -41,9 +51,51 @@ class Approximator(ABC):
         """Compute reference value."""
         raise NotImplementedError
 
-    def benchmark(self, xs: typing.Sequence[float]) -> list[float]:
+    @classmethod
+    def ref_float(cls, x: float) -> float | None:
+        """Compute reference value as built-in float (None if unavailable)."""
+        return None
+
+    @staticmethod
+    def relative_error(approx: mpf, ref: mpf) -> float:
+        """Compute the relative error for an approximation compared to a reference value."""
+        return relative_error(approx, ref)
+
+    def benchmark(self, xs: typing.Sequence[float], adaptive: bool = False) -> list[float]:
         """Compute relative errors (from reference values) for sequence of inputs."""
-        return [relative_error(self.try_call(x), self.ref(x)) for x in xs]
+        if adaptive:
+            return [self.adaptive_error(x) for x in xs]
+        return [self.relative_error(self.try_call(x), self.ref(x)) for x in xs]
+
+    def adaptive_error(self, x: float) -> float:
+        """
+        Compute relative error from reference value at the lowest sufficient precision: built-in float reference values
+        for errors far above machine epsilon, else mpmath reference values with guard decimals beyond the magnitude of
+        the error (escalating until the error is resolved or below twice the current mpmath decimals).
+        """
+        approx = self.try_call(x)
+        if not math.isfinite(approx):
+            return math.nan
+        ref = self.ref_float(x)
+        error = 0.0
+        if ref is not None and math.isfinite(ref) and ref != 0:
+            # (built-in float arithmetic only, as approximation and reference are accurate up to a few units in last place)
+            error = abs((float(approx) - ref) / ref)
+            if error > FLOAT_REFERENCE_THRESHOLD:
+                return error
+        import mpmath
+
+        max_decimals = 2 * mpmath.mp.dps + GUARD_DECIMALS
+        decimals = min(max_decimals, GUARD_DECIMALS + (-math.floor(math.log10(error)) if error > 0 else mpmath.mp.dps))
+        while True:
+            with mpmath.workdps(decimals):
+                ref = self.ref(x)
+                # (only the difference requires mpmath arithmetic)
+                error = abs(float(approx - ref) / float(ref)) if ref != 0 else self.relative_error(approx, ref)
+            # error is resolved if above the precision of the reference value (with guard decimals)
+            if error > 10 ** (GUARD_DECIMALS - decimals) or decimals >= max_decimals:
+                return error
+            decimals = min(max_decimals, 2 * decimals)
 
 
 class FixedPointApproximator(Approximator, ABC):
@@ -68,6 +120,8 @@ class FixedPointApproximator(Approximator, ABC):
     @property
     def workdps(self):
         """Context manager for mpmath decimals."""
+        import mpmath
+
         return mpmath.workdps(self.decimals)
 
     @abstractmethod
@@ -75,18 +129,56 @@ class FixedPointApproximator(Approximator, ABC):
         """Approximate function value from fixed-point number as fixed-point number."""
         raise NotImplementedError
 
+    def domain(self) -> tuple[int | None, int | None]:
+        """Valid fixed-point input interval as inclusive lower and upper bounds (None if unbounded)."""
+        return None, None
+
+    def in_domain(self, x: int) -> bool:
+        """Check if fixed-point number is within the valid input interval."""
+        lower, upper = self.domain()
+        return (lower is None or lower <= x) and (upper is None or x <= upper)
+
     def to_float(self, x: int) -> mpf:
         """Convert fixed-point number to mpmath float."""
+        import mpmath
+
         return mpmath.mpf(x) / self.identity
 
     def to_fixed(self, x: int | float) -> int:
         """Convert number to fixed-point representation."""
+        # built-in float multiplication rounds exactly like mpmath floats at double precision
+        if type(x) in (int, float) and self.decimals <= MAX_FLOAT_DECIMALS and _double_precision():
+            return math.floor(float(x) * self.identity)
+        import mpmath
+
         # using mpmath float for intermediary multiplication before flooring
         return math.floor(mpmath.mpf(x) * self.identity)
 
-    def benchmark(self, xs: typing.Sequence[float]) -> list[float]:
+    def benchmark(self, xs: typing.Sequence[float], adaptive: bool = False) -> list[float]:
+        with self.workdps:
+            return super().benchmark(xs, adaptive)
+
+    def benchmark_fixed(self, xs: typing.Iterable[int]) -> list[float]:
+        """Compute relative errors (from reference values) for sequence of fixed-point inputs."""
         with self.workdps:
-            return super().benchmark(xs)
+            return [self.relative_error(self.try_approx(x), self.ref(self.to_float(x))) for x in xs]
+
+    def try_call(self, x: int | float) -> mpf:
+        try:
+            fixed = self.to_fixed(x)
+        except:
+            return math.nan
+        return self.try_approx(fixed)
+
+    def try_approx(self, x: int) -> mpf:
+        """Return function value approximation from fixed-point number as mpmath float or NaN on error."""
+        # mask inputs outside of the valid domain without raising
+        if not self.in_domain(x):
+            return math.nan
+        try:
+            return self.to_float(self.approx(x))
+        except:
+            return math.nan
 
     def max_bits(self, xs: typing.Sequence[float]) -> int:
         """Track the maximal number of bits used for sequence of inputs."""
@@ -96,6 +188,41 @@ class FixedPointApproximator(Approximator, ABC):
                 self.approx(tracker.int(self.to_fixed(x)))
             return tracker.bits
 
+    def max_bits_fixed(self, xs: typing.Iterable[int]) -> int:
+        """Track the maximal number of bits used for sequence of fixed-point inputs."""
+        with IntegerTracker() as tracker:
+            for x in xs:
+                self.approx(tracker.int(x))
+            return tracker.bits
+
+    def first_overflow(
+        self, xs: typing.Sequence[float], width: int, unsigned: bool = False
+    ) -> tuple[int, Overflow] | None:
+        """Find the first fixed-point input (and operation) overflowing integers of a word size (None if all fit)."""
+        return self.first_overflow_fixed((self.to_fixed(x) for x in xs), width, unsigned)
+
+    def first_overflow_fixed(
+        self, xs: typing.Iterable[int], width: int, unsigned: bool = False
+    ) -> tuple[int, Overflow] | None:
+        """Find the first input (and operation) overflowing integers of a word size for sequence of fixed-point inputs."""
+        with FixedWidthTracker(width, unsigned) as tracker:
+            for x in xs:
+                # skip inputs outside of the valid domain
+                if not self.in_domain(x):
+                    continue
+                try:
+                    self.approx(tracker.int(x))
+                except errors.IntegerOverflowError:
+                    return x, typing.cast(Overflow, tracker.first_overflow)
+        return None
+
+    def mean_operations(self, xs: typing.Sequence[float]) -> float:
+        """Track the mean number of integer operations used for sequence of inputs."""
+        with IntegerTracker() as tracker:
+            for x in xs:
+                self.approx(tracker.int(self.to_fixed(x)))
+            return tracker.operations / len(xs)
+
 
 class ExponentialApproximator(Approximator, ABC):
     """Base class for approximator of the exponential function."""
@@ -104,8 +231,20 @@ class ExponentialApproximator(Approximator, ABC):
 
     @classmethod
     def ref(cls, x: float) -> mpf:
+        import mpmath
+
         return mpmath.exp(x)
 
+    @classmethod
+    def ref_float(cls, x: float) -> float | None:
+        # only built-in numbers are exactly representable by built-in floats
+        if not isinstance(x, (int, float)):
+            return None
+        try:
+            return math.exp(x)
+        except OverflowError:
+            return None
+
 
 class FixedPointExponentialApproximator(FixedPointApproximator, ExponentialApproximator, ABC):
     """Base class for fixed-point approximator of the exponential function."""
@@ -113,6 +252,12 @@ class FixedPointExponentialApproximator(FixedPointApproximator, ExponentialAppro
     __slots__ = ()
 
 
+def _double_precision() -> bool:
+    """Check if mpmath floats (if imported) are at double precision."""
+    mpmath = sys.modules.get("mpmath")
+    return mpmath is None or mpmath.mp.prec == DOUBLE_PRECISION
+
+
 def relative_error(approx: mpf, ref: mpf) -> float:
     """Compute the relative error for an approximation compared to a reference value."""
     # handle NaN values
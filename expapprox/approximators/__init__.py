@@ -1,2 +1,33 @@
-from expapprox.approximators.pade import BitShiftPadeApproximator, PadeApproximator
-from expapprox.approximators.taylor import TaylorApproximator
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from expapprox.approximators.pade import BitShiftPadeApproximator, PadeApproximator
+    from expapprox.approximators.splitting import BinarySplittingApproximator
+    from expapprox.approximators.squaring import BitShiftSquaringPadeApproximator, SquaringPadeApproximator
+    from expapprox.approximators.table import TableApproximator
+    from expapprox.approximators.taylor import TaylorApproximator
+
+# approximators are imported lazily (on first access) from their modules
+_MODULES = {
+    "BitShiftPadeApproximator": "pade",
+    "PadeApproximator": "pade",
+    "BinarySplittingApproximator": "splitting",
+    "BitShiftSquaringPadeApproximator": "squaring",
+    "SquaringPadeApproximator": "squaring",
+    "TableApproximator": "table",
+    "TaylorApproximator": "taylor",
+}
+__all__ = list(_MODULES)
+
+
+def __getattr__(name: str):
+    try:
+        module = _MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f"{__name__}.{module}"), name)
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -1,36 +1,134 @@
+import math
 from abc import ABC
 
-import mpmath
-
+from expapprox import errors
 from expapprox.approximator import FixedPointExponentialApproximator
 
+# additional internal decimals covering rounding errors of remainder approximators (a few units in last place)
+INTERNAL_GUARD_DECIMALS = 2
+
 
 class BitShiftApproximator(FixedPointExponentialApproximator, ABC):
     """Base class for bit-shifted fixed-point approximator of the exponential function."""
 
-    __slots__ = ("remainder_approximator", "log2", "log2half")
+    __slots__ = ("remainder_approximator", "log2", "log2half", "underflow", "internal_decimals", "internal_identity")
     remainder_approximator: FixedPointExponentialApproximator
 
-    def __init__(self, decimals: int):
+    def __init__(self, decimals: int, internal_decimals: int | None = None):
         super().__init__(decimals)
+        # working precision of the remainder approximator (the output precision by default)
+        if internal_decimals is None:
+            internal_decimals = decimals
+        if internal_decimals < 0:
+            raise errors.ApproximatorError(f"Invalid internal decimals {internal_decimals}; must be 0 or greater")
+        self.internal_decimals = internal_decimals
+        self.internal_identity = 10**internal_decimals
         # precompute log(2) up to appropriate fixed-point precision
-        with self.workdps:
-            self.log2 = self.to_fixed(mpmath.log(2))
-            self.log2half = self.log2 // 2
+        self.log2 = fixed_log2(self.identity)
+        self.log2half = self.log2 // 2
+        # largest fixed-point input s.t. the approximation is shifted to zero (set once remainder approximator is set)
+        self.underflow: int | None = None
 
     def _fields(self):
-        return self.remainder_approximator._fields()
+        fields = self.remainder_approximator._fields()
+        if self.internal_decimals == self.decimals:
+            return fields
+        # remainder approximator is constructed at internal decimals
+        return [*super()._fields(), *fields[1:], f"internal_decimals={self.internal_decimals}"]
+
+    def _find_underflow(self) -> int:
+        """Find the largest fixed-point input s.t. the approximation is shifted to zero."""
+        # bound exp(remainder) (with a factor 2 margin) from the extremal remainders
+        remainders = [-self.log2half, self.log2 - self.log2half - 1]
+        value = max(self.remainder_approximator.approx(self._to_internal(r)) for r in remainders)
+        # (rounded up to output precision)
+        shift = (2 * -(-value * self.identity // self.internal_identity)).bit_length()
+        # quotient <= -shift <=> x + log(2)/2 < (1 - shift) * log(2)
+        return (1 - shift) * self.log2 - self.log2half - 1
 
     def approx(self, x: int) -> int:
-        # find integer quotient s.t. remainder is between -0.5*log(2) and 0.5*log(2)
+        # short-circuit inputs underflowing to zero
+        if self.underflow is not None and x <= self.underflow:
+            return 0
+        quotient, remainder = self._reduce(x)
+        # compute exp(remainder) via remainder approximator (at internal precision)
+        preshifted = self.remainder_approximator.approx(self._to_internal(remainder))
+        return self._shift(preshifted, quotient)
+
+    def _reduce(self, x: int) -> tuple[int, int]:
+        """Find integer quotient s.t. remainder is between -0.5*log(2) and 0.5*log(2)."""
         quotient = (x + self.log2half) // self.log2
         remainder = x - quotient * self.log2
-        # compute exp(remainder) via remainder approximator
-        preshifted = self.remainder_approximator.approx(remainder)
-        # bitshift by quotient
-        if x <= 0:
+        return quotient, remainder
+
+    def _shift(self, preshifted: int, quotient: int) -> int:
+        """Bitshift approximation of exp(remainder) (at internal precision) by quotient."""
+        if self.internal_identity != self.identity:
+            # rescale to output precision upon bitshifting (with a single flooring)
+            preshifted *= self.identity
+            if quotient < 0:
+                return preshifted // (self.internal_identity << -quotient)
+            return (preshifted << quotient) // self.internal_identity
+        if quotient < 0:
             # exp(remainder) // 2^quotient
             return preshifted >> abs(quotient)
-        else:
-            # exp(remainder) * 2^quotient
-            return preshifted << quotient
+        # exp(remainder) * 2^quotient
+        return preshifted << quotient
+
+    def _to_internal(self, x: int) -> int:
+        """Rescale fixed-point number to internal precision (floored)."""
+        if self.internal_identity == self.identity:
+            return x
+        x *= self.internal_identity
+        x //= self.identity
+        return x
+
+
+def choose_internal_decimals(decimals: int, upper: float | None = None, error: float | None = None) -> int:
+    """
+    Choose internal decimals of a bit-shifted approximator s.t. rounding errors of exp(remainder) are below one unit in
+    the last place of outputs up to exp(upper) and below a relative error bound (each if given, and the output decimals
+    if neither is given).
+    """
+    candidates = []
+    if upper is not None:
+        # outputs below exp(upper) have -upper / log(10) fewer significant decimals
+        candidates.append(decimals + math.ceil(upper / math.log(10)))
+    if error is not None:
+        if not 0 < error < 1:
+            raise errors.ApproximatorError(f"Invalid error bound {error}; must be between 0 and 1")
+        candidates.append(math.ceil(-math.log10(error)))
+    if not candidates:
+        return decimals
+    # (enough decimals for both constraints)
+    return max(0, max(candidates) + INTERNAL_GUARD_DECIMALS)
+
+
+def fixed_log2(identity: int) -> int:
+    """Compute log(2) floored to fixed-point number (with given identity) by integer arithmetic."""
+    # log(2) = 2 * atanh(1/3) = sum of 2 / (3 * (2k + 1) * 9^k) over k >= 0, s.t. the tail of terms beyond k is below
+    # 3 / (4 * (2k + 1) * 9^k) (i.e. below 1 / identity for 9^k > identity)
+    terms = identity.bit_length() // 3 + 2
+    while True:
+        t, b, q = _split_log2(0, terms)
+        denominator = 3 * b * q
+        tail = 4 * (2 * terms + 1) * 9**terms
+        lower = 2 * identity * t // denominator
+        upper = identity * (2 * t * tail + 3 * denominator) // (denominator * tail)
+        if lower == upper:
+            return lower
+        terms *= 2
+
+
+def _split_log2(lower: int, upper: int) -> tuple[int, int, int]:
+    """
+    Binary splitting of the sum of 1 / ((2k + 1) * 9^(k - lower)) for lower <= k < upper as T / (B * Q), with B the
+    product of 2k + 1 and Q = 9^(upper - lower - 1).
+    """
+    if upper - lower == 1:
+        return 1, 2 * lower + 1, 1
+    middle = (lower + upper) // 2
+    t_lower, b_lower, q_lower = _split_log2(lower, middle)
+    t_upper, b_upper, q_upper = _split_log2(middle, upper)
+    power = 9 ** (upper - middle)
+    return t_lower * b_upper * power + t_upper * b_lower, b_lower * b_upper, q_lower * power
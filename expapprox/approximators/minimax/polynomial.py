@@ -2,8 +2,10 @@ import mpmath
 
 from expapprox import errors
 from expapprox.approximator import ExponentialApproximator
+from expapprox.approximators.minimax.remez import DEFAULT_DIGITS, Interval, minimax_polynomial
 
 # minimax polynomial coefficients computed via MATLAB chebfun package (see coeff.m)
+# (other orders, intervals and precisions are generated by the Remez algorithm, see remez.py)
 MINIMAX_POLY = {
     1: (
         "1.0201394465967895",
@@ -48,18 +50,30 @@ MINIMAX_POLY = {
 
 
 class MinimaxPolynomialApproximator(ExponentialApproximator):
-    """Order-N minimax polynomial approximator of the exponential function on [-log(2)/2, log(2)/2]."""
+    """
+    Order-N minimax polynomial approximator of the exponential function on [-log(2)/2, log(2)/2] (or another interval),
+    with coefficients to given decimal precision generated by the Remez algorithm unless tabulated.
+    """
 
-    __slots__ = ("order", "coefficients")
+    __slots__ = ("order", "interval", "digits", "coefficients")
 
     def __call__(self, x: int | float) -> float:
         return mpmath.polyval(self.coefficients, x)
 
-    def __init__(self, order: int):
-        if order not in MINIMAX_POLY:
-            raise errors.ApproximatorError(f"Invalid order {order}; no minimax coefficients available")
+    def __init__(self, order: int, interval: Interval | None = None, digits: int | None = None):
+        if order < 1:
+            raise errors.ApproximatorError(f"Invalid order {order}; must be 1 or greater")
         self.order = order
-        self.coefficients = [mpmath.mpf(x) for x in MINIMAX_POLY[order]]
+        self.interval = interval
+        self.digits = digits
+        if interval is None and digits is None and order in MINIMAX_POLY:
+            coefficients = MINIMAX_POLY[order]
+        else:
+            coefficients = minimax_polynomial(order, interval, DEFAULT_DIGITS if digits is None else digits)
+        self.coefficients = [mpmath.mpf(x) for x in coefficients]
 
     def _fields(self):
-        return [*super()._fields(), f"order={self.order}"]
+        fields = [*super()._fields(), f"order={self.order}"]
+        if self.interval is not None:
+            fields.append(f"interval={self.interval!r}")
+        return fields if self.digits is None else [*fields, f"digits={self.digits}"]
@@ -2,8 +2,10 @@ import mpmath
 
 from expapprox import errors
 from expapprox.approximator import ExponentialApproximator
+from expapprox.approximators.minimax.remez import DEFAULT_DIGITS, Interval, minimax_rational
 
 # minimax rational coefficients computed via MATLAB chebfun package (see coeff.m)
+# (other orders, intervals and precisions are generated by the Remez algorithm, see remez.py)
 MINIMAX_RATIONAL = {
     1: (
         (
@@ -100,21 +102,35 @@ MINIMAX_RATIONAL = {
 
 
 class MinimaxRationalApproximator(ExponentialApproximator):
-    """Order-N minimax rational approximator of the exponential function on [-log(2)/2, log(2)/2]."""
+    """
+    Order-N minimax rational approximator of the exponential function on [-log(2)/2, log(2)/2] (or another interval),
+    with coefficients to given decimal precision generated by the Remez algorithm unless tabulated.
+    """
 
-    __slots__ = ("order", "p_coefficients", "q_coefficients")
+    __slots__ = ("order", "interval", "digits", "p_coefficients", "q_coefficients")
 
     def __call__(self, x: int | float) -> float:
         p = mpmath.polyval(self.p_coefficients, x)
         q = mpmath.polyval(self.q_coefficients, x)
         return p / q
 
-    def __init__(self, order: int):
-        if order not in MINIMAX_RATIONAL:
-            raise errors.ApproximatorError(f"Invalid order {order}; no minimax coefficients available")
+    def __init__(self, order: int, interval: Interval | None = None, digits: int | None = None):
+        if order < 1:
+            raise errors.ApproximatorError(f"Invalid order {order}; must be 1 or greater")
         self.order = order
-        self.p_coefficients = [mpmath.mpf(x) for x in MINIMAX_RATIONAL[order][0]]
-        self.q_coefficients = [mpmath.mpf(x) for x in MINIMAX_RATIONAL[order][1]]
+        self.interval = interval
+        self.digits = digits
+        if interval is None and digits is None and order in MINIMAX_RATIONAL:
+            p_coefficients, q_coefficients = MINIMAX_RATIONAL[order]
+        else:
+            p_coefficients, q_coefficients = minimax_rational(
+                order, interval, DEFAULT_DIGITS if digits is None else digits
+            )
+        self.p_coefficients = [mpmath.mpf(x) for x in p_coefficients]
+        self.q_coefficients = [mpmath.mpf(x) for x in q_coefficients]
 
     def _fields(self):
-        return [*super()._fields(), f"order={self.order}"]
+        fields = [*super()._fields(), f"order={self.order}"]
+        if self.interval is not None:
+            fields.append(f"interval={self.interval!r}")
+        return fields if self.digits is None else [*fields, f"digits={self.digits}"]
@@ -0,0 +1,282 @@
+"""
+Minimax polynomial and rational coefficients of the exponential function by the Remez exchange algorithm on mpmath
+floats (in place of the MATLAB chebfun script coeff.m), cached on disk per configuration.
+"""
+
+import hashlib
+import json
+import os
+import typing
+
+import mpmath
+
+from expapprox import errors
+
+# default decimal precision of generated coefficients
+DEFAULT_DIGITS = 30
+# additional working decimals guarding against cancellation in the power basis (in addition to 2 per order)
+GUARD_DIGITS = 10
+# maximal number of exchanges
+MAX_ITERATIONS = 64
+# environment variable overriding the cache directory
+CACHE_DIR_VARIABLE = "EXPAPPROX_CACHE_DIR"
+
+Interval = tuple[typing.Any, typing.Any]
+
+
+def minimax_polynomial(
+    order: int, interval: Interval | None = None, digits: int = DEFAULT_DIGITS, cache: bool = True
+) -> tuple[str, ...]:
+    """
+    Compute the coefficients (in descending order) of the order-N polynomial minimizing the maximal absolute error of
+    the exponential function on an interval (by default [-log(2)/2, log(2)/2]) to given decimal precision.
+    """
+    return _cached("polynomial", order, interval, digits, cache)  # type: ignore[return-value]
+
+
+def minimax_rational(
+    order: int, interval: Interval | None = None, digits: int = DEFAULT_DIGITS, cache: bool = True
+) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """
+    Compute the coefficients (in descending order, normalized to a leading numerator coefficient of 1) of the
+    numerator and denominator of the order-[N/N] rational function minimizing the maximal absolute error of the
+    exponential function on an interval (by default [-log(2)/2, log(2)/2]) to given decimal precision.
+    """
+    return _cached("rational", order, interval, digits, cache)  # type: ignore[return-value]
+
+
+def cache_dir() -> str:
+    """Directory of cached coefficients (overridden by the EXPAPPROX_CACHE_DIR environment variable)."""
+    return os.environ.get(CACHE_DIR_VARIABLE) or os.path.join(os.path.expanduser("~"), ".cache", "expapprox", "remez")
+
+
+def _cached(kind: str, order: int, interval: Interval | None, digits: int, cache: bool) -> tuple:
+    if order < 1:
+        raise errors.ApproximatorError(f"Invalid order {order}; must be 1 or greater")
+    if digits < 1:
+        raise errors.ApproximatorError(f"Invalid digits {digits}; must be 1 or greater")
+    with mpmath.workdps(digits + GUARD_DIGITS + 2 * order):
+        lower, upper = _interval(interval)
+        if not lower < upper:
+            raise errors.ApproximatorError(f"Invalid interval {interval}; must be non-empty")
+        # key of configuration (with endpoints at working precision)
+        key = {
+            "kind": kind,
+            "order": order,
+            "interval": (
+                None if interval is None else [mpmath.nstr(lower, mpmath.mp.dps), mpmath.nstr(upper, mpmath.mp.dps)]
+            ),
+            "digits": digits,
+        }
+        digest = hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()[:16]
+        path = os.path.join(cache_dir(), f"{kind}-{order}-{digest}.json")
+        if cache:
+            try:
+                with open(path) as f:
+                    record = json.load(f)
+                if record["key"] == key:
+                    return _from_json(record["coefficients"])
+            except (OSError, ValueError, KeyError):
+                pass
+        # working decimals resolving the levelled error to the requested digits (relative to the error, whose magnitude
+        # relative to the exponential function is estimated on the initial reference)
+        _, level = _solve(kind, order, _chebyshev_points(lower, upper, _reference_size(kind, order)))
+        dps = mpmath.mp.dps
+        if level:
+            dps += max(0, int(mpmath.ceil(mpmath.log10(mpmath.exp(upper) / abs(level)))))
+    with mpmath.workdps(dps):
+        lower, upper = _interval(interval)
+        # maximal error is minimal up to the precision (once levels on the reference are equal up to it relative to them)
+        tolerance = mpmath.mpf(10) ** -digits
+        coefficients = _format(_remez(kind, order, lower, upper, tolerance), digits)
+    if cache:
+        _write(path, {"key": key, "coefficients": coefficients})
+    return coefficients
+
+
+def _interval(interval: Interval | None) -> tuple[mpmath.mpf, mpmath.mpf]:
+    if interval is None:
+        half_log2 = mpmath.log(2) / 2
+        return -half_log2, half_log2
+    lower, upper = interval
+    return mpmath.mpf(lower), mpmath.mpf(upper)
+
+
+def _format(coefficients: typing.Any, digits: int) -> typing.Any:
+    if isinstance(coefficients, (list, tuple)):
+        return tuple(_format(c, digits) for c in coefficients)
+    return mpmath.nstr(coefficients, digits, min_fixed=-mpmath.inf, max_fixed=mpmath.inf)
+
+
+def _from_json(coefficients: list) -> tuple:
+    return tuple(_from_json(c) if isinstance(c, list) else c for c in coefficients)
+
+
+def _write(path: str, record: dict):
+    # write atomically s.t. concurrent readers never see partial records (failing silently if not writable)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "w") as f:
+            json.dump(record, f, indent=2)
+        os.replace(temporary, path)
+    except OSError:
+        pass
+
+
+def _reference_size(kind: str, order: int) -> int:
+    # N + 2 points for polynomials and 2N + 2 points for rational functions
+    return order + 2 if kind == "polynomial" else 2 * order + 2
+
+
+def _remez(kind: str, order: int, lower, upper, tolerance) -> typing.Any:
+    # reference on which the error equioscillates (initially Chebyshev extrema)
+    reference = _chebyshev_points(lower, upper, _reference_size(kind, order))
+    for _ in range(MAX_ITERATIONS):
+        coefficients, level = _solve(kind, order, reference)
+        if kind == "polynomial":
+            p, q = coefficients, [mpmath.mpf(1)]
+        else:
+            p, q = coefficients
+            # denominator must not vanish on the interval
+            if any(_polyval(q, x) <= 0 for x in _chebyshev_points(lower, upper, 8 * order + 8)):
+                raise errors.ApproximatorError(f"Remez algorithm found poles in interval for order {order}")
+        p_derivative, q_derivative = _derivative(p), _derivative(q)
+
+        def error(x):
+            return mpmath.exp(x) - _polyval(p, x) / _polyval(q, x)
+
+        def error_derivative(x):
+            p_value, q_value = _polyval(p, x), _polyval(q, x)
+            numerator = _polyval(p_derivative, x) * q_value - p_value * _polyval(q_derivative, x)
+            return mpmath.exp(x) - numerator / q_value**2
+
+        reference, spread = _exchange(error, error_derivative, reference, lower, upper)
+        if spread <= tolerance * abs(level):
+            if kind == "polynomial":
+                return p
+            # normalize leading numerator coefficient to 1
+            return [c / p[0] for c in p], [c / p[0] for c in q]
+    raise errors.ApproximatorError(f"Remez algorithm did not converge for order {order}")
+
+
+def _solve(kind: str, order: int, reference: list) -> tuple[typing.Any, typing.Any]:
+    """Coefficients (in descending order) and levelled error of the approximation equioscillating on a reference."""
+    # (singular systems raise division errors in mpmath)
+    try:
+        if kind == "polynomial":
+            return _solve_polynomial(order, reference)
+        return _solve_rational(order, reference)
+    except ZeroDivisionError as e:
+        raise errors.ApproximatorError(f"Remez algorithm found singular system for order {order}") from e
+
+
+def _solve_polynomial(order: int, reference: list) -> tuple[list, typing.Any]:
+    # solve p(x_i) + (-1)^i * E = exp(x_i) for coefficients of p and levelled error E
+    matrix = mpmath.matrix([[x**j for j in range(order + 1)] + [(-1) ** i] for i, x in enumerate(reference)])
+    solution = mpmath.lu_solve(matrix, mpmath.matrix([mpmath.exp(x) for x in reference]))
+    return [solution[j] for j in reversed(range(order + 1))], solution[order + 1]
+
+
+def _solve_rational(order: int, reference: list) -> tuple[tuple[list, list], typing.Any]:
+    # solve p(x_i) = (exp(x_i) + (-1)^i * E) * q(x_i), i.e. V a = (F + E S) V b for Vandermonde matrix V, diagonal
+    # matrices F and S of exponentials and alternating signs and coefficients a and b of p and q, by eliminating a by
+    # the N + 1 null vectors w of V^T (weights of divided differences over N + 2 consecutive points) s.t.
+    # W^T F V b = -E W^T S V b is an eigenvalue problem of E
+    values = [mpmath.exp(x) for x in reference]
+    vandermonde = mpmath.matrix([[x**j for j in range(order + 1)] for x in reference])
+    weights = []
+    for k in range(order + 1):
+        window = range(k, k + order + 2)
+        weights.append({i: 1 / mpmath.fprod(reference[i] - reference[m] for m in window if m != i) for i in window})
+    f_matrix, s_matrix = mpmath.matrix(order + 1, order + 1), mpmath.matrix(order + 1, order + 1)
+    for k, w in enumerate(weights):
+        for j in range(order + 1):
+            f_matrix[k, j] = mpmath.fsum(w_i * values[i] * vandermonde[i, j] for i, w_i in w.items())
+            s_matrix[k, j] = mpmath.fsum(w_i * (-1) ** i * vandermonde[i, j] for i, w_i in w.items())
+    eigenvalues, eigenvectors = mpmath.eig(mpmath.inverse(s_matrix) * f_matrix)
+    # levelled error of smallest magnitude among real eigenvalues with denominators of constant sign on the reference
+    candidates = []
+    for i, eigenvalue in enumerate(eigenvalues):
+        if abs(mpmath.im(eigenvalue)) > mpmath.sqrt(mpmath.eps) * abs(eigenvalue):
+            continue
+        # (eigenvectors of real eigenvalues are real up to a complex scale)
+        vector = [eigenvectors[j, i] for j in range(order + 1)]
+        scale = max(vector, key=abs)
+        b = [mpmath.re(c / scale) for c in vector]
+        q_values = [mpmath.fsum(c * x**j for j, c in enumerate(b)) for x in reference]
+        if all(q > 0 for q in q_values) or all(q < 0 for q in q_values):
+            candidates.append((abs(eigenvalue), -mpmath.re(eigenvalue), b, q_values))
+    if not candidates:
+        raise errors.ApproximatorError(f"Remez algorithm found poles on reference for order {order}")
+    _, level, b, q_values = min(candidates, key=lambda candidate: candidate[0])
+    # (normalized to positive denominators)
+    sign = mpmath.sign(q_values[0])
+    rhs = mpmath.matrix([sign * (y + (-1) ** i * level) * q for i, (y, q) in enumerate(zip(values, q_values))])
+    a = mpmath.qr_solve(vandermonde, rhs)[0]
+    p = [a[j] for j in reversed(range(order + 1))]
+    q = [sign * b[j] for j in reversed(range(order + 1))]
+    return (p, q), level
+
+
+def _chebyshev_points(lower, upper, n: int) -> list:
+    """Extrema of the Chebyshev polynomial of degree n - 1 on an interval (in ascending order)."""
+    middle, radius = (lower + upper) / 2, (upper - lower) / 2
+    return [middle - radius * mpmath.cospi(mpmath.mpf(i) / (n - 1)) for i in range(n)]
+
+
+def _polyval(coefficients: list, x):
+    """Evaluate polynomial with coefficients in descending order by Horner's scheme."""
+    value = coefficients[0]
+    for c in coefficients[1:]:
+        value = value * x + c
+    return value
+
+
+def _derivative(coefficients: list) -> list:
+    """Coefficients (in descending order) of derivative of polynomial."""
+    degree = len(coefficients) - 1
+    return [(degree - i) * c for i, c in enumerate(coefficients[:-1])] or [mpmath.mpf(0)]
+
+
+def _exchange(error, derivative, reference: list, lower, upper) -> tuple[list, typing.Any]:
+    """
+    Exchange reference for the extrema of the error between its roots (which separate the alternating reference) and
+    return the new reference with the spread of the magnitudes of the error on it.
+    """
+    roots = [_bracketed_root(error, left, right) for left, right in zip(reference, reference[1:])]
+    bounds = [lower, *roots, upper]
+    extrema = []
+    for left, right in zip(bounds, bounds[1:]):
+        # extremum is either at a root of the derivative or at an endpoint of the interval
+        candidates = [left, right]
+        if mpmath.sign(derivative(left)) * mpmath.sign(derivative(right)) < 0:
+            candidates.append(_bracketed_root(derivative, left, right))
+        extrema.append(max(candidates, key=lambda x: abs(error(x))))
+    levels = [abs(error(x)) for x in extrema]
+    return extrema, max(levels) - min(levels)
+
+
+def _bracketed_root(f, left, right):
+    """Root of function with opposite signs at the endpoints of an interval."""
+    if f(left) == 0:
+        return left
+    if f(right) == 0:
+        return right
+    return mpmath.findroot(f, (left, right), solver="anderson", verify=False)
+
+
+def main(max_order: int = 6, digits: int = 16):
+    """Print minimax coefficients on [-log(2)/2, log(2)/2] as dicts of order |-> tuple of coefficients."""
+    print("MINIMAX_POLY = {")
+    for order in range(1, max_order + 1):
+        print(f"    {order}: {minimax_polynomial(order, digits=digits)},")
+    print("}")
+    print("MINIMAX_RATIONAL = {")
+    for order in range(1, max_order + 1):
+        print(f"    {order}: {minimax_rational(order, digits=digits)},")
+    print("}")
+
+
+if __name__ == "__main__":
+    main()
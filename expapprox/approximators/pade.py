@@ -3,56 +3,201 @@ import math
 from expapprox import errors
 from expapprox.approximator import FixedPointExponentialApproximator
 from expapprox.approximators.bshift import BitShiftApproximator
+from expapprox.backend import integer_type, resolve_backend
+
+# maximal number of fixed-point inputs evaluated (from the first input where the rounded denominator may be
+# non-positive) to find the first failing input
+CRITICAL_POINT_SCAN = 1 << 12
 
 
 class PadeApproximator(FixedPointExponentialApproximator):
-    """Order-[N/N] Padé fixed-point approximator of the exponential function."""
+    """
+    Order-[N/N] Padé fixed-point approximator of the exponential function (optionally with coefficients normalized to
+    fixed-point fractions of the constant term, reducing the bit width of intermediaries by log2((2N)!/N!) bits).
+    """
 
-    __slots__ = ("order", "coefficients", "constant")
+    __slots__ = (
+        "order",
+        "normalized",
+        "coefficients",
+        "constant",
+        "critical_point",
+        "backend",
+        "integer",
+        "backend_constants",
+    )
 
-    def __init__(self, decimals: int, order: int):
+    def __init__(self, decimals: int, order: int, backend: str = "int", normalized: bool = False):
         super().__init__(decimals)
         if order < 1:
             raise errors.ApproximatorError("Invalid order {order}; must be 1 or greater")
         self.order = order
-        self.coefficients = coefficients(order)
-        self.constant = self.coefficients[0] * self.identity
+        self.normalized = normalized
+        if normalized:
+            # coefficients c_n / c_0 rounded to fixed-point numbers (s.t. the constant term is the identity)
+            self.coefficients = normalized_coefficients(order, self.identity)
+            if not all(self.coefficients):
+                raise errors.ApproximatorError(
+                    f"Insufficient decimals {decimals} for normalized coefficients of order {order}"
+                )
+            self.constant = self.identity
+        else:
+            self.coefficients = coefficients(order)
+            self.constant = self.coefficients[0] * self.identity
+        # integer backend with constants converted once (for evaluating built-in int inputs)
+        self.backend = resolve_backend(backend, decimals)
+        self.integer = integer_type(self.backend)
+        self.backend_constants = (
+            self.integer(self.identity),
+            self.integer(self.constant),
+            [self.integer(c) for c in self.coefficients],
+        )
+        # smallest non-negative fixed-point input s.t. evaluation fails (or may fail beyond the scanned inputs) - all
+        # inputs below it are valid (None if unbounded)
+        self.critical_point = self._find_critical_point()
 
     def _fields(self):
-        return [*super()._fields(), f"order={self.order}"]
+        fields = [*super()._fields(), f"order={self.order}"]
+        if self.backend != "int":
+            fields.append(f"backend={self.backend!r}")
+        return [*fields, "normalized=True"] if self.normalized else fields
+
+    def domain(self) -> tuple[int | None, int | None]:
+        return None, (None if self.critical_point is None else self.critical_point - 1)
 
     def approx(self, x: int) -> int:
+        # short-circuit inputs at or above the critical point
+        if self.critical_point is not None and x >= self.critical_point:
+            raise errors.ApproximatorDomainError("Exceeded critical point")
+        # evaluate built-in ints on integer backend (and tracked integers as is)
+        if self.integer is not int and type(x) is int:
+            return int(self._approx(self.integer(x), *self.backend_constants))
+        return self._approx(x, self.identity, self.constant, self.coefficients)
+
+    def _approx(self, x: int, identity: int, constant: int, coefficients: list[int]) -> int:
+        even_accumulator, odd_accumulator = self._accumulators(x, identity, constant, coefficients)
+        # validate non-zero denominator
+        if even_accumulator <= odd_accumulator:
+            raise errors.ApproximatorDomainError("Exceeded critical point")
+        # compute numerator and denominator from accumulators
+        numerator = even_accumulator + odd_accumulator
+        denominator = even_accumulator - odd_accumulator
+        # rescale numerator for fixed-point division
+        numerator *= identity
+        return numerator // denominator
+
+    def approx_pair(self, x: int) -> tuple[int, int]:
+        """Approximate exp(x) and exp(-x) from a single pass of the accumulators."""
+        self._validate_pair(x)
+        if self.integer is not int and type(x) is int:
+            positive, negative = self._approx_pair(self.integer(x), *self.backend_constants)
+            return int(positive), int(negative)
+        return self._approx_pair(x, self.identity, self.constant, self.coefficients)
+
+    def approx_hyperbolic(self, x: int) -> tuple[int, int]:
+        """Approximate cosh(x) and sinh(x) from a single pass of the accumulators."""
+        self._validate_pair(x)
+        if self.integer is not int and type(x) is int:
+            cosh, sinh = self._approx_hyperbolic(self.integer(x), *self.backend_constants)
+            return int(cosh), int(sinh)
+        return self._approx_hyperbolic(x, self.identity, self.constant, self.coefficients)
+
+    def _validate_pair(self, x: int):
+        # short-circuit inputs s.t. either sign is at or above the critical point
+        if self.critical_point is not None and abs(x) >= self.critical_point:
+            raise errors.ApproximatorDomainError("Exceeded critical point")
+
+    def _approx_pair(self, x: int, identity: int, constant: int, coefficients: list[int]) -> tuple[int, int]:
+        even_accumulator, odd_accumulator = self._accumulators(x, identity, constant, coefficients)
+        # validate non-zero numerator and denominator
+        if even_accumulator <= abs(odd_accumulator):
+            raise errors.ApproximatorDomainError("Exceeded critical point")
+        # exp(-x) swaps numerator and denominator
+        numerator = even_accumulator + odd_accumulator
+        denominator = even_accumulator - odd_accumulator
+        return (numerator * identity) // denominator, (denominator * identity) // numerator
+
+    def _approx_hyperbolic(self, x: int, identity: int, constant: int, coefficients: list[int]) -> tuple[int, int]:
+        even_accumulator, odd_accumulator = self._accumulators(x, identity, constant, coefficients)
+        if even_accumulator <= abs(odd_accumulator):
+            raise errors.ApproximatorDomainError("Exceeded critical point")
+        # cosh(x) = (E^2 + O^2) / (E^2 - O^2) and sinh(x) = 2EO / (E^2 - O^2) for the even and odd sums E and O
+        even_square = even_accumulator * even_accumulator
+        odd_square = odd_accumulator * odd_accumulator
+        denominator = even_square - odd_square
+        cosh = ((even_square + odd_square) * identity) // denominator
+        sinh = ((2 * even_accumulator * odd_accumulator) * identity) // denominator
+        return cosh, sinh
+
+    def _accumulators(
+        self, x: int, identity: int | None = None, constant: int | None = None, coefficients: list[int] | None = None
+    ) -> tuple[int, int]:
+        """Compute the sums of even- and odd power terms of the numerator (with given or built-in int constants)."""
+        identity = self.identity if identity is None else identity
+        constant = self.constant if constant is None else constant
+        coefficients = self.coefficients if coefficients is None else coefficients
         # initialize even accumulator to c_0 (constant term)
-        even_accumulator = x.__class__(self.constant)
+        even_accumulator = x.__class__(constant)
         # initialize odd accumulator to c_1 * x
         odd_accumulator = x
-        odd_accumulator *= self.coefficients[1]
+        odd_accumulator *= coefficients[1]
+        if self.normalized:
+            odd_accumulator //= identity
         # accumulate even- and odd power terms
         # NOTE: can (should!) be unrolled in practice (where order etc. is fixed)
         x_pow = x
-        for i, c in enumerate(self.coefficients[2:]):
+        for i, c in enumerate(coefficients[2:]):
             # multiply to get next order and rescale
             x_pow *= x
-            x_pow //= self.identity
+            x_pow //= identity
             # compute term and add to corresponding accumulator
             x_term = x_pow
+            if self.normalized:
+                # rescale product with fixed-point coefficient
+                x_term *= c
+                x_term //= identity
             # NOTE: skipping final coefficient (== 1) can be hardcoded for fixed configuration
-            if i < self.order - 2:
+            elif i < self.order - 2:
                 x_term *= c
             # NOTE: even/odd branching can be hardcoded upon loop unrolling for fixed configuration
             if i % 2:
                 odd_accumulator += x_term
             else:
                 even_accumulator += x_term
-        # validate non-zero denominator
-        if even_accumulator <= odd_accumulator:
-            raise errors.ApproximatorDomainError("Exceeded critical point")
-        # compute numerator and denominator from accumulators
-        numerator = even_accumulator + odd_accumulator
-        denominator = even_accumulator - odd_accumulator
-        # rescale numerator for fixed-point division
-        numerator *= self.identity
-        return numerator // denominator
+        return even_accumulator, odd_accumulator
+
+    def _find_critical_point(self) -> int | None:
+        """Find the smallest non-negative fixed-point input s.t. evaluation fails (None if there is none)."""
+        # (denominators of negative inputs are numerators of their absolute values, well above the rounding errors)
+        # smallest input s.t. the (rounded) denominator may be non-positive (positive for all inputs below)
+        start = _smallest_non_positive(self._denominator_lower_bound())
+        if start is None:
+            return None
+        # evaluate inputs from there until the first failure (rounding errors are not monotone in the input)
+        for x in range(start, start + CRITICAL_POINT_SCAN):
+            even_accumulator, odd_accumulator = self._accumulators(x)
+            if even_accumulator <= odd_accumulator:
+                return x
+        # (all scanned inputs are valid - inputs beyond them may fail)
+        return start + CRITICAL_POINT_SCAN
+
+    def _denominator_lower_bound(self) -> list[int]:
+        """
+        Compute the coefficients of a polynomial in non-negative fixed-point inputs bounding the (rounded) denominator
+        from below (scaled by identity^(order - 1), or identity^order for fixed-point coefficients).
+        """
+        # exact terms c_n * (x / identity)^n of the denominator
+        bound = [(-1) ** n * c * self.identity ** (self.order - n) for n, c in enumerate(self.coefficients)]
+        # floored powers are below the exact powers x^n by at most 1 + x + ... + x^(n-2) s.t. the even accumulator (and
+        # hence the denominator) is underestimated by at most the sum of the even power terms of these errors
+        for n, c in enumerate(self.coefficients[2:], 2):
+            if n % 2 == 0:
+                for k in range(n - 1):
+                    bound[k] -= c * self.identity ** (self.order - 1 - k)
+        if self.normalized:
+            # rescaled products of even power terms are floored by less than 1 (i.e. identity^order when scaled)
+            bound[0] -= self.order // 2 * self.identity**self.order
+        return bound
 
 
 def coefficients(order: int) -> list[int]:
@@ -60,9 +205,91 @@ def coefficients(order: int) -> list[int]:
     return [math.factorial(2 * order - n) // (math.factorial(n) * math.factorial(order - n)) for n in range(order + 1)]
 
 
+def normalized_coefficients(order: int, identity: int) -> list[int]:
+    """Compute the Padé[N/N] coefficients divided by the constant coefficient, rounded to fixed-point numbers."""
+    raw = coefficients(order)
+    return [(2 * c * identity + raw[0]) // (2 * raw[0]) for c in raw]
+
+
 class BitShiftPadeApproximator(BitShiftApproximator):
     """Bit-shifted order-[N/N] Padé fixed-point approximator of the exponential function."""
 
-    def __init__(self, decimals: int, order: int):
-        super().__init__(decimals)
-        self.remainder_approximator = PadeApproximator(decimals, order)
+    def __init__(
+        self,
+        decimals: int,
+        order: int,
+        backend: str = "int",
+        normalized: bool = False,
+        internal_decimals: int | None = None,
+    ):
+        super().__init__(decimals, internal_decimals)
+        self.remainder_approximator = PadeApproximator(self.internal_decimals, order, backend, normalized)
+        self.underflow = self._find_underflow()
+
+    def approx_pair(self, x: int) -> tuple[int, int]:
+        """Approximate exp(x) and exp(-x) from a single pass of the accumulators of the remainder approximator."""
+        quotient, remainder = self._reduce(x)
+        # exp(-x) = exp(-remainder) * 2^-quotient
+        positive, negative = self.remainder_approximator.approx_pair(self._to_internal(remainder))
+        return self._shift(positive, quotient), self._shift(negative, -quotient)
+
+    def approx_hyperbolic(self, x: int) -> tuple[int, int]:
+        """Approximate cosh(x) and sinh(x) from a single pass of the accumulators of the remainder approximator."""
+        quotient, remainder = self._reduce(x)
+        if quotient == 0:
+            # evaluate directly for inputs near zero (avoiding cancellation of sinh)
+            cosh, sinh = self.remainder_approximator.approx_hyperbolic(self._to_internal(remainder))
+            return self._shift(cosh, quotient), self._shift(sinh, quotient)
+        positive, negative = self.approx_pair(x)
+        return (positive + negative) // 2, (positive - negative) // 2
+
+
+def _smallest_non_positive(coefficients: list[int]) -> int | None:
+    """Find the smallest non-negative integer s.t. a polynomial is non-positive (None if positive for all)."""
+    # non-negative roots are below the Fujiwara bound 2 * max |a_(N-k) / a_N|^(1/k) (rounded up to a power of 2)
+    degree = len(coefficients) - 1
+    leading_bits = abs(coefficients[-1]).bit_length() - 1
+    exponents = [-(-(abs(c).bit_length() - leading_bits) // (degree - k)) for k, c in enumerate(coefficients[:-1]) if c]
+    # the sign beyond the bound is the sign of the leading coefficient (s.t. the interval covers a non-positive value)
+    intervals = [(0, 2 << max([0, *exponents]))]
+    # depth-first search of intervals (lower first) for which the polynomial may be non-positive
+    while intervals:
+        lower, upper = intervals.pop()
+        # bound polynomial from below by its Taylor expansion at the lower end (dropping positive terms)
+        shifted = _taylor_shift(coefficients, lower)
+        width = upper - lower
+        if shifted[0] + sum(c * width**k for k, c in enumerate(shifted) if k and c < 0) > 0:
+            continue
+        if shifted[0] <= 0:
+            return lower
+        # bisect polynomials decreasing on the interval (bounding the derivative from above likewise)
+        if sum(k * c * width ** (k - 1) for k, c in enumerate(shifted) if k and (k == 1 or c > 0)) < 0:
+            if _evaluate(coefficients, upper) > 0:
+                continue
+            while upper - lower > 1:
+                middle = (lower + upper) // 2
+                if _evaluate(coefficients, middle) > 0:
+                    lower = middle
+                else:
+                    upper = middle
+            return upper
+        middle = (lower + upper) // 2
+        intervals += [(middle + 1, upper), (lower, middle)]
+    return None
+
+
+def _evaluate(coefficients: list[int], x: int) -> int:
+    """Evaluate a polynomial by Horner's method."""
+    value = 0
+    for c in reversed(coefficients):
+        value = value * x + c
+    return value
+
+
+def _taylor_shift(coefficients: list[int], shift: int) -> list[int]:
+    """Compute the coefficients of the polynomial p(x + shift) from the coefficients of p(x)."""
+    shifted = list(coefficients)
+    for i in range(len(shifted) - 1):
+        for k in range(len(shifted) - 2, i - 1, -1):
+            shifted[k] += shift * shifted[k + 1]
+    return shifted
@@ -0,0 +1,224 @@
+import math
+from collections.abc import Callable
+
+from expapprox import errors
+from expapprox.approximator import FixedPointExponentialApproximator
+from expapprox.approximators.bshift import fixed_log2
+from expapprox.backend import integer_type, resolve_backend
+
+# additional bits of binary working precision beyond the fixed-point decimals
+GUARD_BITS = 32
+# additional bits of log(2) s.t. range reduction is exact up to working precision for quotients below 2^64
+LOG2_GUARD_BITS = 64
+# bits of the remainder looked up per table of exponentials (of 2^TABLE_BITS entries at working precision)
+TABLE_BITS = 8
+# upper bound of default tables (beyond which table memory outweighs the shorter series, see benchmarks/splitting.py)
+MAX_DEFAULT_TABLES = 8
+# upper bound of bits of default tables (i.e. 4 MiB per integer backend)
+MAX_TABLE_BITS = 1 << 25
+# additional bits of table entries while accumulating them by multiplication
+TABLE_GUARD_BITS = 16
+# number of series terms per leaf of binary splitting (summed by Horner's scheme on cached coefficients)
+SPLIT_LEAF_TERMS = 16
+
+
+class BinarySplittingApproximator(FixedPointExponentialApproximator):
+    """
+    Arbitrary-precision fixed-point approximator of the exponential function, reducing the input by multiples of
+    log(2) to a (binary fixed-point) remainder r in [0, log(2)), looking up the exponentials of its leading bits in
+    cached tables and evaluating the series of exp(r_0) * exp(r_1) * ... by binary splitting on integers for bit-bursts
+    r_i of the remaining bits with doubling numbers of bits. Outputs are precise to the decimals relative to their
+    magnitude (i.e. within 1 unit of the last place up to e).
+    """
+
+    __slots__ = (
+        "precision",
+        "tables",
+        "reciprocal",
+        "log2",
+        "scale",
+        "exponentials",
+        "bursts",
+        "backend",
+        "integer",
+        "backend_constants",
+    )
+
+    def __init__(self, decimals: int, tables: int | None = None, backend: str = "auto"):
+        super().__init__(decimals)
+        # binary working precision (in bits) and tables (balancing lookups against series terms and memory by default)
+        self.precision = math.ceil(decimals * math.log2(10)) + GUARD_BITS
+        if tables is None:
+            max_tables = MAX_TABLE_BITS // (self.precision << TABLE_BITS)
+            tables = min(math.isqrt(self.precision) // 5, MAX_DEFAULT_TABLES, max_tables)
+        if not 0 <= tables < self.precision / TABLE_BITS:
+            raise errors.ApproximatorError(
+                f"Invalid number of tables {tables}; must be between 0 and {(self.precision - 1) // TABLE_BITS}"
+            )
+        self.tables = tables
+        # integer backend (of tables and constants)
+        self.backend = resolve_backend(backend, decimals)
+        self.integer = integer_type(self.backend)
+        # reciprocal of identity and log(2) as binary fixed-point numbers (with guard bits)
+        scale = self.precision + LOG2_GUARD_BITS
+        self.reciprocal = -(-1 << (scale + self.identity.bit_length() + LOG2_GUARD_BITS)) // self.identity
+        self.log2 = fixed_log2(1 << scale)
+        # bursts of remainder bits below the tables with |r_i| < 2^-start
+        self.bursts: list[_Burst] = []
+        start = TABLE_BITS * tables
+        end = min(self.precision, 2 * start + TABLE_BITS)
+        while True:
+            self.bursts.append(_Burst(start, end, self.precision))
+            if end == self.precision:
+                break
+            start, end = end, min(self.precision, 2 * end)
+        # factor identity / prod(terms!) * 2^scale (near 1) of the first table s.t. its products with numerators of bursts
+        # (of terms! * exp(r_i)) are outputs scaled by 2^(precision + scale)
+        factorials = math.prod(math.factorial(burst.terms) for burst in self.bursts)
+        self.scale = factorials.bit_length() - self.identity.bit_length()
+        factor = _shift(self.identity << self.precision, self.scale) // factorials
+        # tables of exp(i / 2^(TABLE_BITS * (j + 1))) at working precision, the first one covering [0, log(2)) and
+        # scaled to outputs (a single entry without tables)
+        exponentials = [_exponential_table(TABLE_BITS * (j + 1), self.precision, self.integer) for j in range(tables)]
+        first = (
+            exponentials[0][: math.ceil(math.log(2) * (1 << TABLE_BITS))]
+            if tables
+            else [self.integer(1) << self.precision]
+        )
+        exponentials[:1] = [[(entry * factor) >> self.precision for entry in first]]
+        self.exponentials = [[int(entry) for entry in table] for table in exponentials]
+        # constants converted to the integer backend once
+        self.backend_constants = (
+            self.integer(self.reciprocal),
+            self.integer(self.log2),
+            exponentials,
+            [_Burst(burst.start, burst.end, self.precision, self.integer) for burst in self.bursts],
+        )
+
+    def _fields(self):
+        fields = [*super()._fields(), f"tables={self.tables}"]
+        return fields if self.backend == "int" else [*fields, f"backend={self.backend!r}"]
+
+    @property
+    def order(self) -> int:
+        """Number of series terms of the leading burst."""
+        return self.bursts[0].terms
+
+    def approx(self, x: int) -> int:
+        # evaluate built-in ints on integer backend (and tracked integers as is)
+        if self.integer is not int and type(x) is int:
+            return int(self._approx(self.integer(x), *self.backend_constants))
+        return self._approx(x, self.reciprocal, self.log2, self.exponentials, self.bursts)
+
+    def _approx(self, x: int, reciprocal: int, log2: int, exponentials: list[list[int]], bursts: list["_Burst"]) -> int:
+        precision = self.precision
+        # find integer quotient s.t. remainder is between 0 and log(2)
+        scaled_x = (x * reciprocal) >> (self.identity.bit_length() + LOG2_GUARD_BITS)
+        quotient = scaled_x // log2
+        if quotient.bit_length() > LOG2_GUARD_BITS:
+            raise errors.ApproximatorDomainError("Exceeded range reduction")
+        # remainder as binary fixed-point number at working precision
+        remainder = (scaled_x - quotient * log2) >> LOG2_GUARD_BITS
+        # product of exponentials of leading bits looked up in tables (the first scaled to outputs)
+        leading = remainder >> (precision - TABLE_BITS * self.tables)
+        shift = TABLE_BITS * max(self.tables - 1, 0)
+        value = x.__class__(exponentials[0][leading >> shift])
+        for table in exponentials[1:]:
+            shift -= TABLE_BITS
+            value = (value * table[(leading >> shift) & ((1 << TABLE_BITS) - 1)]) >> precision
+        # multiply by exponentials of bursts (numerators truncated to working precision)
+        for burst in bursts:
+            a = (remainder >> (precision - burst.end)) & burst.mask
+            numerator = _split(a, burst) if a else burst.constant
+            value = (value * (numerator >> burst.truncation)) >> burst.shift
+        # rescale to fixed-point number and multiply by 2^quotient
+        shift = precision + self.scale - quotient
+        return value >> shift if shift >= 0 else value << -shift
+
+
+class _Burst:
+    """
+    Bit-burst of the remainder between start and end bit with cached tables of binary splitting of the truncated series
+    of exp(a / 2^end) = N / (terms! * 2^(end * terms)) for a < 2^(end - start) (over leaves of SPLIT_LEAF_TERMS terms).
+    """
+
+    __slots__ = ("start", "end", "mask", "terms", "constant", "truncation", "shift", "leaves", "merges", "length")
+
+    def __init__(self, start: int, end: int, precision: int, integer: Callable[[int], int] = int):
+        self.start = start
+        self.end = end
+        self.mask = integer((1 << (end - start)) - 1)
+        self.terms = _terms(start, precision)
+        # constant term of numerator, its bits beyond working precision and the remaining bits of the denominator
+        self.constant = integer(math.factorial(self.terms) << (end * self.terms))
+        self.truncation = max(0, end * self.terms - precision)
+        self.shift = end * self.terms - self.truncation
+        # Horner coefficients of leaves [lower, upper) of indices with
+        # T(lower, upper) = sum_{n=lower}^{upper-1} a^(n-lower+1) prod_{j=n+1}^{upper-1} j * 2^end
+        bounds = [*range(1, self.terms + 1, SPLIT_LEAF_TERMS), self.terms + 1]
+        self.leaves: list[list[int]] = []
+        for lower, upper in zip(bounds, bounds[1:]):
+            coefficients, coefficient = [], 1
+            for j in range(upper - 1, lower, -1):
+                coefficient *= j << end
+                coefficients.append(integer(coefficient))
+            self.leaves.append(coefficients)
+        # (Q, bits) of right halves of merged pairs by level, s.t.
+        # T(lower, upper) = (T(lower, middle) * Q(middle, upper) << bits) + a^(middle-lower) * T(middle, upper)
+        self.merges: list[list[tuple[int, int]]] = []
+        while len(bounds) > 2:
+            self.merges.append(
+                [
+                    (integer(math.prod(range(middle, upper))), end * (upper - middle))
+                    for middle, upper in zip(bounds[1::2], bounds[2::2])
+                ]
+            )
+            bounds = [*bounds[::2], bounds[-1]] if len(bounds) % 2 == 0 else bounds[::2]
+        # number of terms of (all but the last) leaves
+        self.length = min(SPLIT_LEAF_TERMS, self.terms)
+
+
+def _terms(magnitude: int, precision: int) -> int:
+    """Number of series terms s.t. the truncation error for |r| <= 2^-magnitude is below 2^-precision."""
+    terms = 1
+    while (terms + 1) * magnitude + math.lgamma(terms + 2) / math.log(2) < precision + 2:
+        terms += 1
+    return terms
+
+
+def _split(a: int, burst: _Burst) -> int:
+    """Numerator N of exp(a / 2^end) = N / (terms! * 2^(end * terms)) by binary splitting of the series of the burst."""
+    # sum leaves by Horner's scheme
+    values = []
+    for coefficients in burst.leaves:
+        value = 1
+        for coefficient in coefficients:
+            value = value * a + coefficient
+        values.append(value * a)
+    # merge adjacent pairs of leaves (of equal numbers of terms but the last) by level, with the power of a over the
+    # terms of left halves (doubling by level)
+    power = 0
+    for merges in burst.merges:
+        power = power * power if power else a**burst.length
+        merged = [
+            ((lower * q) << bits) + power * upper for (q, bits), lower, upper in zip(merges, values[::2], values[1::2])
+        ]
+        values = merged if len(values) % 2 == 0 else [*merged, values[-1]]
+    return burst.constant + values[0]
+
+
+def _exponential_table(bits: int, precision: int, integer: Callable[[int], int]) -> list[int]:
+    """Exponentials exp(i / 2^bits) for i < 2^TABLE_BITS as binary fixed-point numbers at precision (on a backend)."""
+    precision += TABLE_GUARD_BITS
+    burst = _Burst(bits, bits, precision, integer)
+    base = (_split(integer(1), burst) << precision) // burst.constant
+    table, value = [], integer(1) << precision
+    for _ in range(1 << TABLE_BITS):
+        table.append(value >> TABLE_GUARD_BITS)
+        value = (value * base) >> precision
+    return table
+
+
+def _shift(x: int, bits: int) -> int:
+    """Multiply by 2^bits (floored for negative bits)."""
+    return x << bits if bits >= 0 else x >> -bits
@@ -0,0 +1,68 @@
+import math
+from abc import ABC
+
+from expapprox import errors
+from expapprox.approximator import FixedPointExponentialApproximator
+from expapprox.approximators.bshift import BitShiftApproximator
+from expapprox.approximators.pade import PadeApproximator
+
+
+class SquaringApproximator(FixedPointExponentialApproximator, ABC):
+    """Base class for argument-halving (squaring) fixed-point approximator of the exponential function."""
+
+    __slots__ = ("remainder_approximator", "halvings", "internal_decimals", "internal_identity")
+    remainder_approximator: FixedPointExponentialApproximator
+
+    def __init__(self, decimals: int, halvings: int):
+        super().__init__(decimals)
+        if halvings < 0:
+            raise errors.ApproximatorError(f"Invalid number of halvings {halvings}; must be 0 or greater")
+        self.halvings = halvings
+        # working precision of halving and squaring: m squarings amplify errors of exp(x / 2^m) by 2^m, so m extra bits
+        # keep the low bits of halved inputs and bound the amplified rounding errors by about a unit in the last place
+        self.internal_decimals = decimals + math.ceil(halvings * math.log10(2))
+        self.internal_identity = 10**self.internal_decimals
+
+    def _fields(self):
+        # remainder approximator is constructed at internal decimals
+        return [*super()._fields(), *self.remainder_approximator._fields()[1:], f"halvings={self.halvings}"]
+
+    def domain(self) -> tuple[int | None, int | None]:
+        # scale domain of remainder approximator s.t. the halved input (at internal precision) is within it
+        lower, upper = self.remainder_approximator.domain()
+        scale = self.internal_identity // self.identity
+        return (
+            None if lower is None else -(-(lower << self.halvings) // scale),
+            None if upper is None else (((upper + 1) << self.halvings) - 1) // scale,
+        )
+
+    def approx(self, x: int) -> int:
+        if not self.halvings:
+            return self.remainder_approximator.approx(x)
+        # compute exp(x / 2^m) via remainder approximator (at internal precision)
+        scale = self.internal_identity // self.identity
+        value = self.remainder_approximator.approx(x * scale >> self.halvings)
+        # square m times to get exp(x / 2^m)^(2^m) (rescaled to output precision upon the last squaring)
+        for _ in range(self.halvings - 1):
+            value *= value
+            value //= self.internal_identity
+        value *= value
+        value //= self.internal_identity * scale
+        return value
+
+
+class SquaringPadeApproximator(SquaringApproximator):
+    """Argument-halving order-[N/N] Padé fixed-point approximator of the exponential function."""
+
+    def __init__(self, decimals: int, order: int, halvings: int):
+        super().__init__(decimals, halvings)
+        self.remainder_approximator = PadeApproximator(self.internal_decimals, order)
+
+
+class BitShiftSquaringPadeApproximator(BitShiftApproximator):
+    """Bit-shifted argument-halving order-[N/N] Padé fixed-point approximator of the exponential function."""
+
+    def __init__(self, decimals: int, order: int, halvings: int, internal_decimals: int | None = None):
+        super().__init__(decimals, internal_decimals)
+        self.remainder_approximator = SquaringPadeApproximator(self.internal_decimals, order, halvings)
+        self.underflow = self._find_underflow()
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import collections.abc
+import json
+import math
+import mmap
+import typing
+
+from expapprox import errors
+from expapprox.approximator import FixedPointExponentialApproximator
+from expapprox.approximators.taylor import TaylorApproximator
+
+# identifier written at the start of persisted tables
+MAGIC = b"EXPTABLE"
+
+
+class TableApproximator(FixedPointExponentialApproximator):
+    """
+    Lookup table fixed-point approximator of the exponential function on a bounded domain, correcting the value at
+    the nearest knot by an order-N Taylor approximation of the offset.
+    """
+
+    __slots__ = ("lower", "upper", "spacing", "order", "table", "correction", "certificate")
+
+    def __init__(
+        self,
+        decimals: int,
+        lower: int | float,
+        upper: int | float,
+        knots: int,
+        order: int = 1,
+        source: FixedPointExponentialApproximator | None = None,
+    ):
+        super().__init__(decimals)
+        if knots < 2:
+            raise errors.ApproximatorError(f"Invalid number of knots {knots}; must be 2 or greater")
+        self.lower = self.to_fixed(lower)
+        self.upper = self.to_fixed(upper)
+        if self.upper <= self.lower:
+            raise errors.ApproximatorError(f"Invalid domain [{lower}, {upper}]; must be non-empty")
+        # (ceiled) fixed-point spacing s.t. the final knot is at or above the upper bound of the domain
+        self.spacing = -((self.lower - self.upper) // (knots - 1))
+        self.order = order
+        self.correction = TaylorApproximator(decimals, order)
+        # fixed-point values at knots from source approximator (or floored reference values)
+        knot_xs = [self.lower + i * self.spacing for i in range(knots)]
+        if source is None:
+            import mpmath
+
+            with mpmath.workdps(decimals + 10):
+                self.table: typing.Sequence[int] = [
+                    math.floor(self.ref(self.to_float(x)) * self.identity) for x in knot_xs
+                ]
+        else:
+            if source.decimals != decimals:
+                raise errors.ApproximatorError(f"Mismatching source decimals {source.decimals}; must be {decimals}")
+            self.table = [source.approx(x) for x in knot_xs]
+        self.certificate = self._certify(knot_xs)
+
+    def _fields(self):
+        return [
+            *super()._fields(),
+            f"lower={self.to_float(self.lower)}",
+            f"upper={self.to_float(self.upper)}",
+            f"knots={len(self.table)}",
+            f"order={self.order}",
+        ]
+
+    def domain(self) -> tuple[int | None, int | None]:
+        return self.lower, self.upper
+
+    def approx(self, x: int) -> int:
+        if not self.lower <= x <= self.upper:
+            raise errors.ApproximatorDomainError("Exceeded table domain")
+        # index of nearest knot s.t. offset is between -spacing/2 and spacing/2
+        index = (x - self.lower + self.spacing // 2) // self.spacing
+        offset = x - self.lower - index * self.spacing
+        # correct tabulated value by exp(offset)
+        value = self.correction.approx(offset)
+        value *= self.table[index]
+        return value // self.identity
+
+    def _certify(self, knot_xs: list[int]) -> float:
+        """Compute an upper bound on the relative error of approximations on the domain (infinite if unbounded)."""
+        import mpmath
+
+        with mpmath.workdps(self.decimals + 10):
+            # relative errors of tabulated values
+            table_error = max(
+                abs(value - self.ref(self.to_float(x)) * self.identity) / (self.ref(self.to_float(x)) * self.identity)
+                for x, value in zip(knot_xs, self.table)
+            )
+            # truncation error of Taylor correction for offsets between -spacing/2 and spacing/2
+            half_spacing = self.to_float(self.spacing) / 2
+            truncation_error = (
+                half_spacing ** (self.order + 1) / math.factorial(self.order + 1) * mpmath.exp(half_spacing)
+            )
+            # rounding of constants and Horner rescales (at most 2 units in last place per order)
+            correction_error = 2 * self.order / (mpmath.exp(-half_spacing) * self.identity)
+            # flooring of the final product (at most one unit in last place of the smallest output), which is unbounded
+            # if the smallest output may floor to zero (i.e. tabulated values underflow)
+            smallest_output = min(self.table) * mpmath.exp(-half_spacing)
+            if smallest_output <= 1:
+                return math.inf
+            product_error = 1 / (smallest_output - 1)
+            bound = (1 + table_error) * (1 + truncation_error) * (1 + correction_error) * (1 + product_error) - 1
+            return float(bound)
+
+    def save(self, path: str):
+        """Persist table to file for memory-mapped loading."""
+        width = max(1, (max(self.table).bit_length() + 7) // 8)
+        header = {
+            "decimals": self.decimals,
+            "lower": self.lower,
+            "upper": self.upper,
+            "spacing": self.spacing,
+            "order": self.order,
+            "knots": len(self.table),
+            "width": width,
+            "certificate": self.certificate,
+        }
+        with open(path, "wb") as f:
+            encoded_header = json.dumps(header).encode()
+            f.write(MAGIC + len(encoded_header).to_bytes(4, "little") + encoded_header)
+            for value in self.table:
+                f.write(value.to_bytes(width, "little"))
+
+    @classmethod
+    def load(cls, path: str) -> TableApproximator:
+        """Load persisted table as a memory-mapped (read-only and shared between processes) table."""
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if buffer[: len(MAGIC)] != MAGIC:
+            raise errors.ApproximatorError(f"Invalid table file {path}")
+        header_start = len(MAGIC) + 4
+        header_length = int.from_bytes(buffer[len(MAGIC) : header_start], "little")
+        header = json.loads(buffer[header_start : header_start + header_length])
+        # initialize without recomputing table
+        approximator = cls.__new__(cls)
+        FixedPointExponentialApproximator.__init__(approximator, header["decimals"])
+        approximator.lower = header["lower"]
+        approximator.upper = header["upper"]
+        approximator.spacing = header["spacing"]
+        approximator.order = header["order"]
+        approximator.correction = TaylorApproximator(header["decimals"], header["order"])
+        approximator.certificate = header["certificate"]
+        approximator.table = MappedTable(buffer, header_start + header_length, header["knots"], header["width"])
+        return approximator
+
+
+class MappedTable(collections.abc.Sequence):
+    """Read-only sequence of fixed-width unsigned integers in a memory-mapped buffer."""
+
+    def __init__(self, buffer: mmap.mmap, offset: int, length: int, width: int):
+        self.buffer = buffer
+        self.offset = offset
+        self.length = length
+        self.width = width
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.length))]
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("table index out of range")
+        start = self.offset + index * self.width
+        return int.from_bytes(self.buffer[start : start + self.width], "little")
@@ -2,33 +2,75 @@ import math
 
 from expapprox import errors
 from expapprox.approximator import FixedPointExponentialApproximator
+from expapprox.backend import integer_type, resolve_backend
 
 
 class TaylorApproximator(FixedPointExponentialApproximator):
-    """Order-N Taylor fixed-point approximator of the exponential function."""
+    """
+    Order-N Taylor fixed-point approximator of the exponential function (optionally normalized s.t. the Horner terms
+    are divided by their index instead of scaled by N!, reducing the bit width of intermediaries by log2(N!) bits).
+    """
 
-    __slots__ = ("order", "factorial", "constants")
+    __slots__ = ("order", "normalized", "factorial", "constants", "backend", "integer", "backend_constants")
 
-    def __init__(self, decimals: int, order: int):
+    def __init__(self, decimals: int, order: int, backend: str = "int", normalized: bool = False):
         super().__init__(decimals)
         if order < 1:
             raise errors.ApproximatorError("Invalid order {order}; must be 1 or greater")
         self.order = order
-        self.constants = [self.to_fixed(math.factorial(order) / math.factorial(i)) for i in reversed(range(order))]
-        self.factorial = math.factorial(order)
+        self.normalized = normalized
+        if normalized:
+            # fixed-point divisors of Horner terms 1 + x/n * (...) for n = N-1, ..., 1
+            self.constants = [n * self.identity for n in reversed(range(1, order))]
+            self.factorial = 1
+        else:
+            self.constants = [self.to_fixed(math.factorial(order) / math.factorial(i)) for i in reversed(range(order))]
+            self.factorial = math.factorial(order)
+        # integer backend with constants converted once (for evaluating built-in int inputs)
+        self.backend = resolve_backend(backend, decimals)
+        self.integer = integer_type(self.backend)
+        self.backend_constants = (
+            self.integer(self.identity),
+            [self.integer(c) for c in self.constants],
+            self.integer(self.factorial),
+        )
 
     def _fields(self):
-        return [*super()._fields(), f"order={self.order}"]
+        fields = [*super()._fields(), f"order={self.order}"]
+        if self.backend != "int":
+            fields.append(f"backend={self.backend!r}")
+        return [*fields, "normalized=True"] if self.normalized else fields
 
     def approx(self, x: int) -> int:
+        # evaluate built-in ints on integer backend (and tracked integers as is)
+        if self.integer is not int and type(x) is int:
+            return int(self._approx(self.integer(x), *self.backend_constants))
+        return self._approx(x, self.identity, self.constants, self.factorial)
+
+    def _approx(self, x: int, identity: int, constants: list[int], factorial: int) -> int:
+        if self.normalized:
+            return self._approx_normalized(x, identity, constants)
         # initialize accumulator to N! + x (in fixed-point representation)
-        accumulator = x.__class__(self.constants[0])
+        accumulator = x.__class__(constants[0])
         accumulator += x
         # accumulate Horner terms
-        for constant in self.constants[1:]:
+        for constant in constants[1:]:
             # multiply to get next order and rescale
             accumulator *= x
-            accumulator //= self.identity
+            accumulator //= identity
             # add constant
             accumulator += constant
-        return accumulator // self.factorial
+        return accumulator // factorial
+
+    def _approx_normalized(self, x: int, identity: int, divisors: list[int]) -> int:
+        # initialize accumulator to 1 + x/N (in fixed-point representation)
+        accumulator = x // self.order
+        accumulator += identity
+        # accumulate Horner terms 1 + x/n * accumulator
+        for divisor in divisors:
+            # multiply and rescale by divisor
+            accumulator *= x
+            accumulator //= divisor
+            # add one
+            accumulator += identity
+        return accumulator
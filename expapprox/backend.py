@@ -0,0 +1,35 @@
+import typing
+
+from expapprox import errors
+
+# integer backends of approximator kernels (Python ints or GMP integers from the optional gmpy2 package)
+BACKENDS = ("int", "gmpy2", "auto")
+# smallest decimals s.t. the gmpy2 backend is consistently faster (see benchmarks/backend.py)
+GMPY2_DECIMALS = 50
+
+
+def resolve_backend(backend: str, decimals: int) -> str:
+    """Resolve integer backend ("auto" is gmpy2 if installed and beyond its crossover decimals, else int)."""
+    if backend not in BACKENDS:
+        raise errors.ApproximatorError(f"Unknown integer backend {backend!r}; must be one of {', '.join(BACKENDS)}")
+    if backend == "auto":
+        return "gmpy2" if decimals >= GMPY2_DECIMALS and _gmpy2() is not None else "int"
+    return backend
+
+
+def integer_type(backend: str) -> typing.Callable[[int], int]:
+    """Integer type (constructor from Python ints) of resolved integer backend."""
+    if backend == "int":
+        return int
+    gmpy2 = _gmpy2()
+    if gmpy2 is None:
+        raise errors.ApproximatorError(f"Integer backend {backend!r} requires gmpy2 to be installed")
+    return gmpy2.mpz
+
+
+def _gmpy2():
+    try:
+        import gmpy2
+    except ImportError:
+        return None
+    return gmpy2
@@ -0,0 +1,215 @@
+import math
+
+from expapprox import errors
+from expapprox.approximator import Approximator, FixedPointApproximator
+from expapprox.approximators.bshift import BitShiftApproximator
+from expapprox.approximators.minimax import MinimaxPolynomialApproximator, MinimaxRationalApproximator
+from expapprox.approximators.pade import PadeApproximator, coefficients
+from expapprox.approximators.squaring import SquaringApproximator
+from expapprox.approximators.table import TableApproximator
+from expapprox.approximators.taylor import TaylorApproximator
+
+# domain on which minimax coefficients are computed
+MINIMAX_DOMAIN = (-math.log(2) / 2, math.log(2) / 2)
+# absolute rounding error of minimax coefficients (printed to 16 decimals)
+MINIMAX_COEFFICIENT_ERROR = 5e-17
+# number of subintervals used for bounding polynomials from below
+PIECES = 64
+
+
+def error_bound(approximator: Approximator, lower: float, upper: float) -> float:
+    """
+    Compute an a-priori upper bound on the relative error of an approximator for inputs in [lower, upper], including
+    truncation errors of the approximation on the (reduced) domain and rounding errors of fixed-point operations.
+    """
+    if upper < lower:
+        raise errors.ApproximatorError(f"Invalid domain [{lower}, {upper}]; must be non-empty")
+    try:
+        if isinstance(approximator, FixedPointApproximator):
+            # flooring of inputs to fixed-point numbers (including rounding of the intermediary mpmath product and its
+            # conversion to float by math.floor)
+            magnitude = max(abs(lower), abs(upper))
+            input_error = math.expm1(2 * max(1.0, magnitude) / approximator.identity + magnitude * 2**-52)
+            return _compose(input_error, kernel_bound(approximator, lower, upper))
+        if isinstance(approximator, (MinimaxPolynomialApproximator, MinimaxRationalApproximator)):
+            return _minimax_bound(approximator, lower, upper)
+    except (OverflowError, ZeroDivisionError):
+        # bound is not representable (or meaningful) on the domain
+        return math.inf
+    raise errors.ApproximatorError(f"No error bound available for {approximator!r}")
+
+
+def kernel_bound(approximator: FixedPointApproximator, lower: float, upper: float) -> float:
+    """Compute an upper bound on the relative error of fixed-point approximations for fixed-point inputs."""
+    if isinstance(approximator, BitShiftApproximator):
+        return _bitshift_bound(approximator, lower, upper)
+    if isinstance(approximator, SquaringApproximator):
+        return _squaring_bound(approximator, lower, upper)
+    if isinstance(approximator, PadeApproximator):
+        return _pade_bound(approximator, lower, upper)
+    if isinstance(approximator, TaylorApproximator):
+        return _taylor_bound(approximator, lower, upper)
+    if isinstance(approximator, TableApproximator):
+        if not approximator.to_float(approximator.lower) <= lower <= upper <= approximator.to_float(approximator.upper):
+            raise errors.ApproximatorDomainError(f"Domain [{lower}, {upper}] exceeds table domain")
+        return approximator.certificate
+    raise errors.ApproximatorError(f"No error bound available for {approximator!r}")
+
+
+def _taylor_bound(approximator: TaylorApproximator, lower: float, upper: float) -> float:
+    order = approximator.order
+    identity = approximator.identity
+    magnitude = max(abs(lower), abs(upper))
+    # Lagrange remainder relative to exp(x) (largest for negative x)
+    truncation_error = magnitude ** (order + 1) / math.factorial(order + 1) * math.exp(max(0.0, -lower))
+    if approximator.normalized:
+        # accumulated errors of flooring x/N and Horner rescales by divisors (amplified by x/n) in units of identity
+        accumulator_error = 1.0
+        for n in reversed(range(1, order)):
+            accumulator_error = accumulator_error * magnitude / n + 1
+        return _compose(truncation_error, accumulator_error / (identity * math.exp(lower)))
+    # accumulated errors of Horner rescales and (float-computed and floored) constants in units of N! * identity
+    accumulator_error = 0.0
+    for constant in approximator.constants:
+        accumulator_error = accumulator_error * magnitude + 2 + constant * 2**-52
+    # final division by N! floors (at most one unit in last place)
+    rounding_error = (accumulator_error / approximator.factorial + 1) / (identity * math.exp(lower))
+    return _compose(truncation_error, rounding_error)
+
+
+def _pade_bound(approximator: PadeApproximator, lower: float, upper: float) -> float:
+    order = approximator.order
+    identity = approximator.identity
+    magnitude = max(abs(lower), abs(upper))
+    # normalized numerator P(x) and denominator Q(x) = P(-x) in ascending order (of the exact coefficients)
+    exact_coefficients = coefficients(order)
+    p = [c / exact_coefficients[0] for c in exact_coefficients]
+    q = [(-1) ** n * c for n, c in enumerate(p)]
+    p_min = _polynomial_lower_bound(p, lower, upper)
+    q_min = _polynomial_lower_bound(q, lower, upper)
+    # numerator and denominator must be positive (i.e. non-zero and positive at an endpoint)
+    if p_min <= 0 or q_min <= 0 or _evaluate(p, lower) < 0 or _evaluate(q, lower) < 0:
+        return math.inf
+    # exp(x) Q(x) - P(x) = (-1)^N x^(2N+1) / (2N)! * int_0^1 t^N (1 - t)^N exp(tx) dt
+    beta = math.factorial(order) ** 2 / math.factorial(2 * order + 1)
+    truncation_error = (
+        magnitude ** (2 * order + 1) * beta * math.exp(max(0.0, -lower)) / (math.factorial(2 * order) * q_min)
+    )
+    # accumulated errors of rescaled powers (in units of identity) weighted by coefficients
+    power_error = 0.0
+    accumulator_error = 0.0
+    for n, c in enumerate(approximator.coefficients[1:], 1):
+        if n > 1:
+            power_error = power_error * magnitude + 1
+        if approximator.normalized:
+            # fixed-point coefficients are rounded and rescaled products floored
+            accumulator_error += c / identity * power_error + 1 + magnitude**n / 2
+        else:
+            accumulator_error += c * power_error
+    # relative errors of numerator and denominator (with constant term as scale) and flooring of their rescaled ratio
+    numerator_error = accumulator_error / (approximator.constant * p_min)
+    denominator_error = accumulator_error / (approximator.constant * q_min)
+    if denominator_error >= 1:
+        return math.inf
+    ratio_error = (numerator_error + denominator_error) / (1 - denominator_error)
+    rounding_error = 1 / (identity * math.exp(lower) * (1 - truncation_error) * (1 - ratio_error))
+    return _compose(truncation_error, ratio_error, rounding_error)
+
+
+def _bitshift_bound(approximator: BitShiftApproximator, lower: float, upper: float) -> float:
+    identity = approximator.identity
+    log2 = math.log(2)
+    # quotients and (fixed-point) remainder bounds
+    quotient = max(abs(math.floor(lower / log2 + 0.5)), abs(math.floor(upper / log2 + 0.5))) + 1
+    remainder_lower = -approximator.log2half / identity
+    remainder_upper = (approximator.log2 - approximator.log2half) / identity
+    # flooring of log(2) skews remainders by at most one unit in last place per quotient
+    log2_error = math.expm1(quotient / identity)
+    remainder_error = kernel_bound(approximator.remainder_approximator, remainder_lower, remainder_upper)
+    rescaled = approximator.internal_identity != identity
+    if rescaled:
+        # flooring of remainders to internal precision
+        remainder_error = _compose(math.expm1(1 / approximator.internal_identity), remainder_error)
+    # right-shifts (and rescaling from internal precision) floor (at most one unit in last place of the smallest output)
+    shift_error = 0.0
+    if lower <= 0 or rescaled:
+        smallest = identity * math.exp(lower) * (1 - log2_error) * (1 - remainder_error)
+        shift_error = 1 / smallest if smallest > 0 else math.inf
+    return _compose(log2_error, remainder_error, shift_error)
+
+
+def _squaring_bound(approximator: SquaringApproximator, lower: float, upper: float) -> float:
+    identity = approximator.identity
+    scale = 2**approximator.halvings
+    # flooring of halved inputs is amplified by squaring
+    halving_error = math.expm1(scale / identity)
+    error = _compose(halving_error, kernel_bound(approximator.remainder_approximator, lower / scale, upper / scale))
+    # squaring doubles relative errors and flooring adds at most one unit in last place
+    for i in range(approximator.halvings):
+        smallest = identity * math.exp(lower * 2 ** (i + 1) / scale) * (1 - error) ** 2
+        if smallest <= 1:
+            return math.inf
+        error = _compose(error, error, 1 / (smallest - 1))
+    return error
+
+
+def _minimax_bound(
+    approximator: MinimaxPolynomialApproximator | MinimaxRationalApproximator, lower: float, upper: float
+) -> float:
+    domain_lower, domain_upper = MINIMAX_DOMAIN
+    if not domain_lower <= lower <= upper <= domain_upper:
+        raise errors.ApproximatorDomainError(f"Domain [{lower}, {upper}] exceeds minimax domain")
+    magnitude = max(abs(domain_lower), abs(domain_upper))
+    # perturbation of coefficients from (rounded) minimax coefficients
+    perturbation = sum(MINIMAX_COEFFICIENT_ERROR * magnitude**n for n in range(approximator.order + 1))
+    if isinstance(approximator, MinimaxRationalApproximator):
+        p = [float(c) for c in reversed(approximator.p_coefficients)]
+        q = [float(c) for c in reversed(approximator.q_coefficients)]
+        q_min = _polynomial_lower_bound(q, domain_lower, domain_upper)
+        if q_min <= 0:
+            return math.inf
+        ratio_max = _polynomial_upper_bound(p, domain_lower, domain_upper) / q_min
+        perturbation = perturbation * (1 + ratio_max) / q_min
+    # absolute minimax error equioscillates and hence attains its maximum at the domain endpoints
+    # (with an allowance for the evaluation in floating point)
+    absolute_error = max(abs(float(approximator(x)) - math.exp(x)) for x in (domain_lower, domain_upper))
+    absolute_error += 2 * perturbation + 2**-50
+    return absolute_error / math.exp(lower)
+
+
+def _polynomial_lower_bound(coefficients: list[float], lower: float, upper: float) -> float:
+    """Lower bound of absolute value of polynomial (ascending coefficients) on interval via expansions at midpoints."""
+    bound = math.inf
+    width = (upper - lower) / PIECES
+    for i in range(PIECES):
+        midpoint = lower + (i + 0.5) * width
+        derivatives = _derivatives(coefficients, midpoint)
+        deviation = sum(abs(d) / math.factorial(n) * (width / 2) ** n for n, d in enumerate(derivatives) if n > 0)
+        bound = min(bound, abs(derivatives[0]) - deviation)
+    return bound
+
+
+def _evaluate(coefficients: list[float], x: float) -> float:
+    """Evaluate polynomial (coefficients in ascending order) at a point."""
+    return sum(c * x**n for n, c in enumerate(coefficients))
+
+
+def _polynomial_upper_bound(coefficients: list[float], lower: float, upper: float) -> float:
+    """Upper bound of absolute value of polynomial (coefficients in ascending order) on interval."""
+    magnitude = max(abs(lower), abs(upper))
+    return sum(abs(c) * magnitude**n for n, c in enumerate(coefficients))
+
+
+def _derivatives(coefficients: list[float], x: float) -> list[float]:
+    """Evaluate polynomial (coefficients in ascending order) and all its derivatives at a point."""
+    derivatives = []
+    for _ in range(len(coefficients)):
+        derivatives.append(_evaluate(coefficients, x))
+        coefficients = [n * c for n, c in enumerate(coefficients)][1:]
+    return derivatives
+
+
+def _compose(*relative_errors: float) -> float:
+    """Compose relative errors of consecutive operations."""
+    # (accumulated in logarithms to preserve errors below machine precision)
+    return math.expm1(math.fsum(math.log1p(error) for error in relative_errors))
@@ -0,0 +1,219 @@
+"""
+Streaming bulk evaluation of fixed-point approximators over files (or stdin/stdout), e.g.
+
+    python -m expapprox "BitShiftPadeApproximator(decimals=16, order=3)" inputs.txt -o outputs.txt
+    python -m expapprox "PadeApproximator(10, 3)" data.csv --input-format csv --column x --output-format float64
+"""
+
+import argparse
+import ast
+import collections
+import csv
+import io
+import itertools
+import math
+import mmap
+import struct
+import sys
+import typing
+from concurrent.futures import Future, ProcessPoolExecutor
+from fractions import Fraction
+
+from expapprox import approximators, errors
+from expapprox.approximator import FixedPointApproximator
+
+# formats of inputs and outputs (text: decimal number per line, csv: column of decimal numbers, int64: raw
+# little-endian fixed-point numbers, float64: raw little-endian doubles)
+FORMATS = ("text", "csv", "int64", "float64")
+BINARY_FORMATS = {"int64": "q", "float64": "d"}
+# fixed-point output written for failed approximations in int64 format
+INT64_ERROR = -(2**63)
+
+
+def parse_spec(spec: str) -> FixedPointApproximator:
+    """Construct fixed-point approximator from specification as its string representation (with literal arguments)."""
+    try:
+        call = ast.parse(spec.strip(), mode="eval").body
+    except SyntaxError:
+        raise errors.ApproximatorError(f"Invalid approximator specification {spec!r}")
+    if not (isinstance(call, ast.Call) and isinstance(call.func, ast.Name)):
+        raise errors.ApproximatorError(f"Invalid approximator specification {spec!r}")
+    cls = getattr(approximators, call.func.id, None)
+    if not (isinstance(cls, type) and issubclass(cls, FixedPointApproximator)):
+        raise errors.ApproximatorError(f"Unknown fixed-point approximator {call.func.id!r}")
+    try:
+        args = [ast.literal_eval(arg) for arg in call.args]
+        kwargs = {keyword.arg: ast.literal_eval(keyword.value) for keyword in call.keywords}
+    except ValueError:
+        raise errors.ApproximatorError(f"Non-literal arguments in approximator specification {spec!r}")
+    return cls(*args, **kwargs)
+
+
+def read_chunks(
+    file: typing.BinaryIO, input_format: str, size: int, column: int | str = 0
+) -> typing.Iterator[list[str] | list[int] | list[float]]:
+    """Iterate over chunks of at most size inputs (decimal strings or fixed-point/float numbers for binary formats)."""
+    if input_format in BINARY_FORMATS:
+        yield from _read_binary_chunks(file, BINARY_FORMATS[input_format], size)
+        return
+    lines = io.TextIOWrapper(file, newline="")
+    if input_format == "csv":
+        rows = csv.reader(lines)
+        if isinstance(column, str):
+            # named column - find index from header
+            header = next(rows, [])
+            if column not in header:
+                raise errors.ApproximatorError(f"Column {column!r} not in CSV header")
+            column = header.index(column)
+        values = (row[column] for row in rows if row)
+    else:
+        values = (stripped for line in lines if (stripped := line.strip()))
+    while chunk := list(itertools.islice(values, size)):
+        yield chunk
+
+
+def _read_binary_chunks(file: typing.BinaryIO, code: str, size: int) -> typing.Iterator[list[int] | list[float]]:
+    itemsize = struct.calcsize(f"<{code}")
+    try:
+        fileno = file.fileno()
+        buffer = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError, io.UnsupportedOperation):
+        # streams (e.g. pipes) and empty files cannot be memory-mapped - read chunks instead
+        while data := file.read(size * itemsize):
+            if len(data) % itemsize:
+                raise errors.ApproximatorError(f"Truncated binary input; must be a multiple of {itemsize} bytes")
+            yield _unpack(data, code)
+        return
+    with buffer:
+        if len(buffer) % itemsize:
+            raise errors.ApproximatorError(f"Truncated binary input; must be a multiple of {itemsize} bytes")
+        for start in range(0, len(buffer), size * itemsize):
+            yield _unpack(buffer[start : start + size * itemsize], code)
+
+
+def _unpack(data: bytes, code: str) -> list:
+    return list(struct.unpack(f"<{len(data) // struct.calcsize(code)}{code}", data))
+
+
+def evaluate_chunk(
+    approximator: FixedPointApproximator, chunk: typing.Sequence, input_format: str, output_format: str
+) -> bytes:
+    """Approximate function values of chunk of inputs, encoded in output format."""
+    xs = [_to_fixed(approximator, x, input_format) for x in chunk]
+    values = [_try_approx(approximator, x) for x in xs]
+    return _encode(approximator, chunk, values, output_format)
+
+
+def _try_approx(approximator: FixedPointApproximator, x: int | None) -> int | None:
+    """Approximate function value as fixed-point number (None if invalid or outside of domain)."""
+    if x is None or not approximator.in_domain(x):
+        return None
+    try:
+        return approximator.approx(x)
+    except errors.ApproximatorError:
+        return None
+
+
+def _to_fixed(approximator: FixedPointApproximator, x: str | int | float, input_format: str) -> int | None:
+    """Convert input to fixed-point number (None if invalid), exactly for decimal strings."""
+    try:
+        if input_format == "int64":
+            return x  # type: ignore[return-value]
+        if input_format == "float64":
+            return approximator.to_fixed(x) if math.isfinite(x) else None  # type: ignore[arg-type]
+        return math.floor(Fraction(x) * approximator.identity)  # type: ignore[arg-type]
+    except (ValueError, ZeroDivisionError):
+        return None
+
+
+def _encode(
+    approximator: FixedPointApproximator, chunk: typing.Sequence, values: list[int | None], output_format: str
+) -> bytes:
+    if output_format == "int64":
+        if any(value is not None and not -(2**63) < value < 2**63 for value in values):
+            raise errors.ApproximatorError("Fixed-point output exceeds 64 bits; use a text or float64 output format")
+        return struct.pack(f"<{len(values)}q", *(INT64_ERROR if value is None else value for value in values))
+    if output_format == "float64":
+        floats = [math.nan if value is None else _to_float(value, approximator.identity) for value in values]
+        return struct.pack(f"<{len(floats)}d", *floats)
+    texts = ["nan" if value is None else _format_fixed(value, approximator.decimals) for value in values]
+    if output_format == "csv":
+        return "".join(f"{x},{text}\n" for x, text in zip(chunk, texts)).encode()
+    return "".join(f"{text}\n" for text in texts).encode()
+
+
+def _to_float(value: int, identity: int) -> float:
+    try:
+        return value / identity
+    except OverflowError:
+        return math.inf
+
+
+def _format_fixed(value: int, decimals: int) -> str:
+    """Exact decimal representation of fixed-point number."""
+    sign = "-" if value < 0 else ""
+    integer, fraction = divmod(abs(value), 10**decimals)
+    return f"{sign}{integer}.{fraction:0{decimals}d}" if decimals else f"{sign}{integer}"
+
+
+def evaluate_stream(
+    approximator: FixedPointApproximator,
+    chunks: typing.Iterable[typing.Sequence],
+    input_format: str,
+    output_format: str,
+    workers: int = 1,
+) -> typing.Iterator[bytes]:
+    """Iterate over encoded outputs of chunks in order, with at most 2 chunks per worker in flight."""
+    if workers == 1:
+        for chunk in chunks:
+            yield evaluate_chunk(approximator, chunk, input_format, output_format)
+        return
+    with ProcessPoolExecutor(workers) as executor:
+        pending: collections.deque[Future[bytes]] = collections.deque()
+        for chunk in chunks:
+            pending.append(executor.submit(evaluate_chunk, approximator, chunk, input_format, output_format))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def main(argv: typing.Sequence[str] | None = None):
+    parser = argparse.ArgumentParser(prog="python -m expapprox", description="Bulk evaluation of approximators.")
+    parser.add_argument("spec", help='approximator, e.g. "BitShiftPadeApproximator(decimals=16, order=3)"')
+    parser.add_argument("input", nargs="?", default="-", help="input file (default: stdin)")
+    parser.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+    parser.add_argument("--input-format", choices=FORMATS, default="text")
+    parser.add_argument("--output-format", choices=FORMATS, help="(default: input format)")
+    parser.add_argument("--column", default="0", help="CSV column index or name (default: 0)")
+    parser.add_argument("--chunk-size", type=int, default=65536, help="inputs per chunk (default: 65536)")
+    parser.add_argument("--workers", type=int, default=1, help="number of processes (default: 1)")
+    args = parser.parse_args(argv)
+    if args.chunk_size < 1 or args.workers < 1:
+        parser.error("chunk size and number of workers must be 1 or greater")
+
+    try:
+        approximator = parse_spec(args.spec)
+    except (errors.ApproximatorError, TypeError) as e:
+        parser.error(str(e) or repr(e))
+    output_format = args.output_format or args.input_format
+    column = int(args.column) if args.column.lstrip("-").isdigit() else args.column
+
+    with (
+        open(args.input, "rb") if args.input != "-" else _stdin() as infile,
+        open(args.output, "wb") if args.output != "-" else _stdout() as outfile,
+    ):
+        chunks = read_chunks(infile, args.input_format, args.chunk_size, column)
+        try:
+            for data in evaluate_stream(approximator, chunks, args.input_format, output_format, args.workers):
+                outfile.write(data)
+        except errors.ApproximatorError as e:
+            parser.exit(1, f"error: {e}\n")
+
+
+def _stdin() -> typing.BinaryIO:
+    return open(sys.stdin.fileno(), "rb", closefd=False)
+
+
+def _stdout() -> typing.BinaryIO:
+    return open(sys.stdout.fileno(), "wb", closefd=False)
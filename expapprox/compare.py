@@ -0,0 +1,48 @@
+import contextlib
+import typing
+from concurrent.futures import ProcessPoolExecutor
+
+import mpmath
+
+from expapprox import errors
+from expapprox.approximator import Approximator, FixedPointApproximator, mpf, relative_error
+
+
+def compare(
+    approximators: typing.Sequence[Approximator],
+    xs: typing.Sequence[float],
+    workers: int | None = 1,
+) -> dict[str, list[float]]:
+    """
+    Compute relative errors of approximators (of the same function) for sequence of inputs from reference values
+    computed once at the highest precision required by any approximator, returned as columns of inputs, reference
+    values and relative errors (keyed by approximator representation).
+    """
+    if not approximators:
+        raise errors.ApproximatorError("No approximators to compare")
+    names = [repr(approximator) for approximator in approximators]
+    if len(set(names)) < len(names):
+        raise errors.ApproximatorError("Duplicate approximators in comparison")
+    # compute shared reference values at highest precision
+    precision = max([mpmath.mp.dps, *(_precision(approximator) or 0 for approximator in approximators)])
+    with mpmath.workdps(precision):
+        refs = [approximators[0].ref(x) for x in xs]
+    # evaluate approximators against reference values (optionally in parallel)
+    if workers == 1:
+        columns = [_errors(approximator, xs, refs) for approximator in approximators]
+    else:
+        with ProcessPoolExecutor(workers) as executor:
+            n = len(approximators)
+            columns = list(executor.map(_errors, approximators, [xs] * n, [refs] * n))
+    return {"x": list(xs), "reference": [float(ref) for ref in refs], **dict(zip(names, columns))}
+
+
+def _precision(approximator: Approximator) -> int | None:
+    """Decimals used for evaluating approximator (None for current mpmath decimals)."""
+    return approximator.decimals if isinstance(approximator, FixedPointApproximator) else None
+
+
+def _errors(approximator: Approximator, xs: typing.Sequence[float], refs: typing.Sequence[mpf]) -> list[float]:
+    precision = _precision(approximator)
+    with mpmath.workdps(precision) if precision is not None else contextlib.nullcontext():
+        return [relative_error(approximator.try_call(x), ref) for x, ref in zip(xs, refs)]
@@ -0,0 +1,234 @@
+import dataclasses
+import hashlib
+import math
+import os
+import sqlite3
+import struct
+import typing
+
+from expapprox import errors
+from expapprox.approximator import Approximator, FixedPointApproximator
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS series (
+    spec TEXT NOT NULL,
+    x REAL NOT NULL,
+    error REAL,
+    bits INTEGER,
+    PRIMARY KEY (spec, x)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS series_x ON series (x, spec);
+CREATE TABLE IF NOT EXISTS summaries (
+    spec TEXT NOT NULL,
+    grid TEXT NOT NULL,
+    method TEXT NOT NULL,
+    decimals INTEGER,
+    "order" INTEGER,
+    lower REAL NOT NULL,
+    upper REAL NOT NULL,
+    size INTEGER NOT NULL,
+    max_error REAL,
+    mean_error REAL,
+    max_bits INTEGER,
+    failures INTEGER NOT NULL,
+    PRIMARY KEY (spec, grid)
+);
+CREATE INDEX IF NOT EXISTS summaries_configuration ON summaries (method, "order", decimals);
+"""
+
+# summary columns (in order of the fields of Summary)
+SUMMARY_COLUMNS = 'spec, grid, method, decimals, "order", lower, upper, size, max_error, mean_error, max_bits, failures'
+
+
+@dataclasses.dataclass(frozen=True)
+class Summary:
+    """Summary of the results of an approximator (by its string representation) for a grid of inputs."""
+
+    spec: str
+    grid: str
+    method: str
+    decimals: int | None
+    order: int | None
+    lower: float
+    upper: float
+    size: int
+    # maximal and mean relative errors and max bits (None if unavailable) and number of failed approximations
+    max_error: float | None
+    mean_error: float | None
+    max_bits: int | None
+    failures: int
+
+
+class ResultDatabase:
+    """
+    Local SQLite database of relative errors (and optionally max bits) of approximators per input, indexed by the
+    string representation of the approximator (spec) and input, with summaries per spec and grid of inputs (by hash).
+    """
+
+    __slots__ = ("path", "connection")
+
+    def __init__(self, path: str | os.PathLike = ":memory:"):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({str(self.path)!r})"
+
+    def __enter__(self) -> typing.Self:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def sweep(
+        self, approximator: Approximator, xs: typing.Sequence[float], bits: bool = False, chunk_size: int = 1024
+    ) -> Summary:
+        """
+        Compute results of approximator for inputs not yet stored (committed in chunks s.t. interrupted sweeps are
+        resumed) and store and return the summary of the grid of inputs.
+        """
+        if not xs:
+            raise errors.ApproximatorError("No inputs to sweep")
+        if chunk_size < 1:
+            raise errors.ApproximatorError(f"Invalid chunk size {chunk_size}; must be 1 or greater")
+        spec = repr(approximator)
+        # max bits are only tracked for fixed-point approximators
+        bits = bits and isinstance(approximator, FixedPointApproximator)
+        with _TemporaryGrid(self.connection, xs):
+            missing = [
+                x
+                for (x,) in self.connection.execute(
+                    "SELECT grid.x FROM temp.grid LEFT JOIN series ON series.spec = ? AND series.x = grid.x "
+                    "WHERE series.x IS NULL OR (? AND series.bits IS NULL) ORDER BY grid.x",
+                    (spec, bits),
+                )
+            ]
+            for start in range(0, len(missing), chunk_size):
+                chunk = missing[start : start + chunk_size]
+                rows = [(spec, x, error, max_bits) for x, error, max_bits in _results(approximator, chunk, bits)]
+                with self.connection:
+                    self.connection.executemany(
+                        "INSERT INTO series (spec, x, error, bits) VALUES (?, ?, ?, ?) "
+                        "ON CONFLICT (spec, x) DO UPDATE SET error = excluded.error, bits = excluded.bits",
+                        rows,
+                    )
+            max_error, mean_error, max_bits, failures = self.connection.execute(
+                "SELECT MAX(error), AVG(error), MAX(bits), COUNT(*) - COUNT(error) "
+                "FROM temp.grid JOIN series ON series.spec = ? AND series.x = grid.x",
+                (spec,),
+            ).fetchone()
+        summary = Summary(
+            spec,
+            grid_hash(xs),
+            approximator.__class__.__name__,
+            getattr(approximator, "decimals", None),
+            _order(approximator),
+            min(xs),
+            max(xs),
+            len(xs),
+            max_error,
+            mean_error,
+            max_bits,
+            failures,
+        )
+        with self.connection:
+            self.connection.execute(
+                f"INSERT OR REPLACE INTO summaries ({SUMMARY_COLUMNS}) VALUES ({', '.join('?' * 12)})",
+                dataclasses.astuple(summary),
+            )
+        return summary
+
+    def summary(self, approximator: Approximator | str, xs: typing.Sequence[float]) -> Summary | None:
+        """Stored summary of approximator (or spec) for grid of inputs (None if not swept)."""
+        row = self.connection.execute(
+            f"SELECT {SUMMARY_COLUMNS} FROM summaries WHERE spec = ? AND grid = ?",
+            (_spec(approximator), grid_hash(xs)),
+        ).fetchone()
+        return None if row is None else Summary(*row)
+
+    def summaries(
+        self, method: str | None = None, order: int | None = None, decimals: int | None = None
+    ) -> list[Summary]:
+        """Stored summaries (optionally of given method, order and decimals) ordered by spec."""
+        filters = {"method": method, '"order"': order, "decimals": decimals}
+        conditions = [f"{column} = ?" for column, value in filters.items() if value is not None]
+        query = f"SELECT {SUMMARY_COLUMNS} FROM summaries"
+        if conditions:
+            query += f" WHERE {' AND '.join(conditions)}"
+        rows = self.connection.execute(
+            f"{query} ORDER BY spec, lower, upper", [value for value in filters.values() if value is not None]
+        )
+        return [Summary(*row) for row in rows]
+
+    def series(self, approximator: Approximator | str, lower: float, upper: float) -> list[tuple[float, float, int]]:
+        """Stored (input, relative error, max bits) of approximator (or spec) for inputs in an interval."""
+        return self.connection.execute(
+            "SELECT x, error, bits FROM series WHERE spec = ? AND x BETWEEN ? AND ? ORDER BY x",
+            (_spec(approximator), lower, upper),
+        ).fetchall()
+
+    def smallest_bits(self, error: float, lower: float, upper: float) -> tuple[str, int, float] | None:
+        """
+        Find the approximator (spec) with the smallest max bits among those with relative errors below a threshold
+        (and no failed approximations) for all stored inputs in an interval, as (spec, max bits, max error). Only specs
+        swept on a grid covering the interval are candidates (s.t. sparsely stored specs are not ranked by few inputs).
+        """
+        return self.connection.execute(
+            "SELECT spec, MAX(bits), MAX(error) FROM series WHERE x BETWEEN ? AND ? "
+            "AND spec IN (SELECT spec FROM summaries WHERE lower <= ? AND upper >= ?) GROUP BY spec "
+            "HAVING COUNT(error) = COUNT(*) AND COUNT(bits) = COUNT(*) AND MAX(error) < ? "
+            "ORDER BY MAX(bits), MAX(error), spec LIMIT 1",
+            (lower, upper, lower, upper, error),
+        ).fetchone()
+
+
+class _TemporaryGrid:
+    """Context manager of temporary table of grid of inputs (for joins with stored results)."""
+
+    def __init__(self, connection: sqlite3.Connection, xs: typing.Sequence[float]):
+        self.connection = connection
+        self.xs = xs
+
+    def __enter__(self):
+        self.connection.execute("CREATE TEMP TABLE grid (x REAL PRIMARY KEY) WITHOUT ROWID")
+        self.connection.executemany("INSERT OR IGNORE INTO temp.grid (x) VALUES (?)", ((x,) for x in self.xs))
+
+    def __exit__(self, *args):
+        self.connection.execute("DROP TABLE temp.grid")
+
+
+def grid_hash(xs: typing.Iterable[float]) -> str:
+    """Hash of grid of inputs (from their binary representation as doubles)."""
+    digest = hashlib.sha256()
+    for x in xs:
+        digest.update(struct.pack("<d", x))
+    return digest.hexdigest()[:16]
+
+
+def _spec(approximator: Approximator | str) -> str:
+    return approximator if isinstance(approximator, str) else repr(approximator)
+
+
+def _order(approximator: Approximator) -> int | None:
+    """Order of approximator (or of the approximator of the remainder of bit-shifted approximators)."""
+    order = getattr(approximator, "order", None)
+    if order is None and hasattr(approximator, "remainder_approximator"):
+        order = getattr(approximator.remainder_approximator, "order", None)
+    return order
+
+
+def _results(
+    approximator: Approximator, xs: list[float], bits: bool
+) -> typing.Iterator[tuple[float, float | None, int | None]]:
+    # (failed approximations are stored with NULL errors and 0 bits)
+    for x, error in zip(xs, approximator.benchmark(xs)):
+        if not math.isfinite(error):
+            yield x, None, 0 if bits else None
+        elif bits:
+            yield x, error, typing.cast(FixedPointApproximator, approximator).max_bits([x])
+        else:
+            yield x, error, None
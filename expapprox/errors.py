@@ -26,3 +26,7 @@ class ApproximatorDomainError(ApproximatorError):
 # errors related to integer tracking
 class IntegerTrackerError(ExponentialApproximationError):
     ...
+
+
+class IntegerOverflowError(IntegerTrackerError):
+    ...
@@ -0,0 +1,82 @@
+import typing
+
+from expapprox import errors
+from expapprox.approximator import FixedPointExponentialApproximator
+from expapprox.memoize import MemoizedApproximator
+
+
+class IncrementalExponential:
+    """
+    Streaming evaluator of the exponential function for (monotone) sequences of fixed-point inputs, advancing
+    exp(x + step) = exp(x) * exp(step) by fixed-point multiplication and resynchronizing with a full approximation
+    whenever the accumulated relative error bound would exceed the error budget.
+    """
+
+    __slots__ = ("approximator", "steps", "error", "budget", "x", "value", "bound", "resyncs")
+
+    def __init__(
+        self,
+        approximator: FixedPointExponentialApproximator,
+        error: float,
+        budget: float,
+        maxsteps: int = 16,
+    ):
+        if error < 0:
+            raise errors.ApproximatorError(f"Invalid error bound {error}; must be non-negative")
+        if budget < error:
+            raise errors.ApproximatorError(f"Invalid error budget {budget}; must be at least error bound {error}")
+        self.approximator = approximator
+        # cache of exp(step) for the most recently used steps
+        self.steps = MemoizedApproximator(approximator, maxsize=maxsteps)
+        # relative error bound of (fixed-point) approximations and budget for accumulated relative error
+        self.error = error
+        self.budget = budget
+        # current fixed-point input, approximation and relative error bound of approximation
+        self.x: int | None = None
+        self.value = 0
+        self.bound = 0.0
+        # number of full approximations
+        self.resyncs = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.approximator!r}, error={self.error}, budget={self.budget})"
+
+    def __call__(self, x: int) -> int:
+        """Approximate function value from fixed-point number, advancing from the previous input if possible."""
+        if self.x is None:
+            return self.reset(x)
+        return self.advance(x - self.x)
+
+    def stream(self, xs: typing.Iterable[int]) -> typing.Iterator[int]:
+        """Approximate function values from sequence of fixed-point numbers."""
+        for x in xs:
+            yield self(x)
+
+    def reset(self, x: int) -> int:
+        """Resynchronize evaluator with a full approximation at fixed-point input."""
+        self.x = x
+        self.value = self.approximator.approx(x)
+        self.bound = self.error
+        self.resyncs += 1
+        return self.value
+
+    def advance(self, step: int) -> int:
+        """Advance evaluator by fixed-point step and return the approximation at the new input."""
+        if self.x is None:
+            raise errors.ApproximatorError("Cannot advance evaluator before initial input")
+        x = self.x + step
+        if step == 0:
+            return self.value
+        # multiply by (cached) exp(step) and rescale
+        value = self.value * self.steps.approx(step) // self.approximator.identity
+        # zero values are not representable in relative terms (and cannot be advanced further)
+        if value <= 0:
+            return self.reset(x)
+        # relative errors of current value and exp(step) compound, and flooring adds at most one unit in last place
+        bound = (1 + self.bound) * (1 + self.error) * (1 + 1 / value) - 1
+        if bound > self.budget:
+            return self.reset(x)
+        self.x = x
+        self.value = value
+        self.bound = bound
+        return value
@@ -0,0 +1,103 @@
+import sys
+import typing
+from collections import OrderedDict
+
+from expapprox import errors
+from expapprox.approximator import FixedPointApproximator, mpf
+
+
+class MemoizedApproximator(FixedPointApproximator):
+    """Fixed-point approximator wrapper memoizing fixed-point results in a bounded LRU cache."""
+
+    __slots__ = ("approximator", "maxsize", "maxbytes", "cache", "nbytes", "hits", "misses", "evictions")
+
+    def __init__(
+        self,
+        approximator: FixedPointApproximator,
+        maxsize: int | None = 1024,
+        maxbytes: int | None = None,
+    ):
+        super().__init__(approximator.decimals)
+        if maxsize is not None and maxsize < 1:
+            raise errors.ApproximatorError(f"Invalid cache size {maxsize}; must be 1 or greater")
+        if maxbytes is not None and maxbytes < 1:
+            raise errors.ApproximatorError(f"Invalid cache memory limit {maxbytes}; must be 1 or greater")
+        self.approximator = approximator
+        # cache limits (None for unbounded)
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        # fixed-point input |-> fixed-point output in least-recently-used order
+        self.cache: OrderedDict[int, int] = OrderedDict()
+        self.nbytes = 0
+        # cache statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _fields(self):
+        return [repr(self.approximator), f"maxsize={self.maxsize}", f"maxbytes={self.maxbytes}"]
+
+    def ref(self, x: float) -> mpf:  # type: ignore[override]
+        return self.approximator.ref(x)
+
+    def ref_float(self, x: float) -> float | None:  # type: ignore[override]
+        return self.approximator.ref_float(x)
+
+    def domain(self) -> tuple[int | None, int | None]:
+        return self.approximator.domain()
+
+    def approx(self, x: int) -> int:
+        # bypass cache for tracked integers s.t. intermediary operations are registered with the tracker
+        if type(x) is not int:
+            return self.approximator.approx(x)
+        try:
+            value = self.cache[x]
+        except KeyError:
+            self.misses += 1
+            value = self.approximator.approx(x)
+            self._insert(x, value)
+        else:
+            self.hits += 1
+            self.cache.move_to_end(x)
+        return value
+
+    def warm(self, xs: typing.Iterable[int | float]):
+        """Precompute and cache approximations for inputs (without counting as hits or misses)."""
+        # (converted to fixed-point numbers as when called)
+        self.warm_fixed(self.to_fixed(x) for x in xs)
+
+    def warm_fixed(self, xs: typing.Iterable[int]):
+        """Precompute and cache approximations for fixed-point inputs (without counting as hits or misses)."""
+        for x in xs:
+            if x not in self.cache:
+                self._insert(x, self.approximator.approx(x))
+
+    def clear(self):
+        """Clear cache and reset statistics."""
+        self.cache.clear()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of cache lookups resulting in a hit."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def _insert(self, x: int, value: int):
+        self.cache[x] = value
+        self.nbytes += _entry_size(x, value)
+        # evict least-recently-used entries until within limits
+        while (self.maxsize is not None and len(self.cache) > self.maxsize) or (
+            self.maxbytes is not None and self.nbytes > self.maxbytes and len(self.cache) > 1
+        ):
+            evicted_x, evicted_value = self.cache.popitem(last=False)
+            self.nbytes -= _entry_size(evicted_x, evicted_value)
+            self.evictions += 1
+
+
+def _entry_size(x: int, value: int) -> int:
+    """Approximate memory used by a cache entry (key and value)."""
+    return sys.getsizeof(x) + sys.getsizeof(value)
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import collections
+import inspect
+import time
+import typing
+from contextlib import AbstractContextManager
+from dataclasses import dataclass, field
+
+from expapprox import errors
+from expapprox.approximator import Approximator
+
+# profiled methods of approximators (stages of evaluation and benchmarking)
+STAGES = ("to_fixed", "in_domain", "approx", "to_float", "ref", "ref_float", "relative_error")
+
+
+@dataclass
+class StageStatistics:
+    """Call count, cumulative time (in seconds) and exception counts (by exception type) of a profiled stage."""
+
+    calls: int = 0
+    time: float = 0.0
+    exceptions: collections.Counter[str] = field(default_factory=collections.Counter)
+
+    @property
+    def mean_time(self) -> float:
+        """Mean time (in seconds) per call."""
+        return self.time / self.calls if self.calls else 0.0
+
+
+@dataclass
+class Profiler(AbstractContextManager):
+    """
+    Context manager for profiling the stages of an approximator instance (without overhead outside of the context),
+    recording call counts, cumulative times and exceptions - including those swallowed by try_call.
+    """
+
+    approximator: Approximator
+    # profiled attributes
+    stages: dict[str, StageStatistics] = field(init=False)
+    time: float = field(default=0.0, init=False)
+    # number of inputs outside of the valid domain (masked without evaluation)
+    masked: int = field(default=0, init=False)
+    _cls: type[Approximator] | None = field(default=None, init=False, repr=False)
+    _start: float = field(default=0.0, init=False, repr=False)
+
+    def __post_init__(self):
+        self.stages = {stage: StageStatistics() for stage in STAGES if hasattr(self.approximator, stage)}
+
+    def __enter__(self) -> typing.Self:
+        if self._cls is not None:
+            raise errors.ApproximatorError("Profiler is already active")
+        # swap class of instance to an instance-specific subclass with profiled stages
+        self._cls = self.approximator.__class__
+        self.approximator.__class__ = _profiled_class(self._cls, self)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args) -> bool | None:
+        self.time += time.perf_counter() - self._start
+        self.approximator.__class__ = typing.cast(type[Approximator], self._cls)
+        self._cls = None
+
+    @property
+    def calls(self) -> int:
+        """Total number of profiled calls."""
+        return sum(statistics.calls for statistics in self.stages.values())
+
+    @property
+    def exceptions(self) -> int:
+        """Total number of exceptions raised by profiled stages."""
+        return sum(sum(statistics.exceptions.values()) for statistics in self.stages.values())
+
+    def record(self, stage: str, duration: float, exception: BaseException | None = None):
+        """Record call of stage."""
+        statistics = self.stages[stage]
+        statistics.calls += 1
+        statistics.time += duration
+        if exception is not None:
+            statistics.exceptions[exception.__class__.__name__] += 1
+
+    def export(self) -> list[dict[str, typing.Any]]:
+        """Statistics of called stages as rows (e.g. for plotting or writing to CSV)."""
+        return [
+            {
+                "approximator": repr(self.approximator),
+                "stage": stage,
+                "calls": statistics.calls,
+                "time": statistics.time,
+                "mean_time": statistics.mean_time,
+                "exceptions": sum(statistics.exceptions.values()),
+                **{f"exceptions.{name}": n for name, n in sorted(statistics.exceptions.items())},
+            }
+            for stage, statistics in self.stages.items()
+            if statistics.calls
+        ]
+
+    def report(self) -> str:
+        """Table of statistics of called stages (and their share of the total profiled time)."""
+        lines = [
+            repr(self.approximator),
+            f"{'stage':<16}{'calls':>10}{'time [s]':>12}{'mean [us]':>12}{'share':>8}  exceptions",
+        ]
+        for stage, statistics in self.stages.items():
+            if not statistics.calls:
+                continue
+            share = statistics.time / self.time if self.time else 0.0
+            exceptions = ", ".join(f"{name}={n}" for name, n in sorted(statistics.exceptions.items()))
+            lines.append(
+                f"{stage:<16}{statistics.calls:>10}{statistics.time:>12.4f}{1e6 * statistics.mean_time:>12.2f}"
+                f"{share:>8.1%}  {exceptions}"
+            )
+        lines.append(f"{'total':<16}{self.calls:>10}{self.time:>12.4f}")
+        lines.append(f"masked inputs: {self.masked}")
+        return "\n".join(lines)
+
+
+def _profiled_class(cls: type[Approximator], profiler: Profiler) -> type[Approximator]:
+    """Subclass of approximator class recording calls of stages with profiler."""
+    namespace: dict[str, typing.Any] = {"__slots__": ()}
+    for stage in profiler.stages:
+        method = inspect.getattr_static(cls, stage)
+        if isinstance(method, (classmethod, staticmethod)):
+            namespace[stage] = method.__class__(_profiled(method.__func__, stage, profiler))
+        else:
+            namespace[stage] = _profiled(method, stage, profiler)
+    return type(cls.__name__, (cls,), namespace)
+
+
+def _profiled(fn: typing.Callable, stage: str, profiler: Profiler) -> typing.Callable:
+    def inner(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            value = fn(*args, **kwargs)
+        except BaseException as e:
+            profiler.record(stage, time.perf_counter() - start, e)
+            raise
+        profiler.record(stage, time.perf_counter() - start)
+        if stage == "in_domain" and not value:
+            profiler.masked += 1
+        return value
+
+    return inner
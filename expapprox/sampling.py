@@ -0,0 +1,189 @@
+import math
+import random
+import statistics
+import typing
+from dataclasses import dataclass
+
+from expapprox import errors
+from expapprox.approximator import Approximator, FixedPointApproximator
+
+# bits of (binary) low-discrepancy points and their random shifts
+POINT_BITS = 64
+# minimal number of samples beyond a quantile (on either side) before its estimate is considered converged
+MIN_TAIL_SAMPLES = 8
+
+
+@dataclass(frozen=True)
+class Estimate:
+    """Estimate of a statistic of relative errors with the bounds of its confidence interval."""
+
+    value: float
+    lower: float
+    upper: float
+
+    @property
+    def half_width(self) -> float:
+        """Half width of the confidence interval."""
+        return (self.upper - self.lower) / 2
+
+    def converged(self, rtol: float) -> bool:
+        """Check if the half width of the confidence interval is within a tolerance relative to the estimate."""
+        return self.half_width <= rtol * abs(self.value)
+
+
+class ErrorSampler:
+    """
+    Randomized quasi-Monte Carlo sampler of relative errors of an approximator over an input interval, evaluating
+    batches of the van der Corput sequence in base 2 (i.e. the one-dimensional Sobol and Halton sequences) under
+    independent random shifts modulo 1 (Cranley-Patterson rotations) drawn from a seed. Mean and quantiles of errors
+    are estimated from all samples, with confidence intervals derived from the spread of the estimates per shift
+    (replication).
+    """
+
+    __slots__ = (
+        "approximator",
+        "lower",
+        "upper",
+        "quantiles",
+        "confidence",
+        "batch",
+        "shifts",
+        "samples",
+        "failures",
+        "sums",
+        "errors",
+    )
+
+    def __init__(
+        self,
+        approximator: Approximator,
+        lower: float,
+        upper: float,
+        quantiles: typing.Sequence[float] = (0.5, 0.99),
+        replications: int = 8,
+        batch: int = 64,
+        confidence: float = 0.95,
+        seed: int | None = 0,
+    ):
+        if not lower <= upper:
+            raise errors.ApproximatorError(f"Invalid interval [{lower}, {upper}]")
+        # (the extremes 0 and 1 are never resolved by samples beyond them)
+        if any(not 0 < q < 1 for q in quantiles):
+            raise errors.ApproximatorError(f"Invalid quantiles {quantiles}; must be strictly between 0 and 1")
+        if replications < 2:
+            raise errors.ApproximatorError(f"Invalid replications {replications}; must be 2 or greater")
+        if batch < 1:
+            raise errors.ApproximatorError(f"Invalid batch size {batch}; must be 1 or greater")
+        if not 0 < confidence < 1:
+            raise errors.ApproximatorError(f"Invalid confidence {confidence}; must be between 0 and 1")
+        self.approximator = approximator
+        self.lower = lower
+        self.upper = upper
+        self.quantiles = tuple(quantiles)
+        self.confidence = confidence
+        self.batch = batch
+        # random shifts (as binary fractions) of replications
+        rng = random.Random(seed)
+        self.shifts = [rng.getrandbits(POINT_BITS) for _ in range(replications)]
+        # number of points sampled per replication (and failed approximations among them)
+        self.samples = 0
+        self.failures = 0
+        # sums of errors and errors per replication
+        self.sums = [0.0] * replications
+        self.errors: list[list[float]] = [[] for _ in range(replications)]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.approximator!r}, {self.lower}, {self.upper})"
+
+    def points(self, start: int, stop: int, shift: int = 0) -> list[float] | list[int]:
+        """Inputs (fixed-point if supported by the approximator) of the shifted sequence from start to stop index."""
+        mask = (1 << POINT_BITS) - 1
+        # shifted points in [0, 1) as binary fractions
+        points = [(_radical_inverse(i) + shift) & mask for i in range(start, stop)]
+        if isinstance(self.approximator, FixedPointApproximator):
+            # (exactly scaled to the fixed-point inputs of the interval)
+            lower = self.approximator.to_fixed(self.lower)
+            width = self.approximator.to_fixed(self.upper) - lower + 1
+            return [lower + ((point * width) >> POINT_BITS) for point in points]
+        return [self.lower + (self.upper - self.lower) * math.ldexp(point, -POINT_BITS) for point in points]
+
+    def sample(self, n: int | None = None):
+        """Sample the next n points (by default a batch) of every replication."""
+        n = self.batch if n is None else n
+        for shift, errs, r in zip(self.shifts, self.errors, range(len(self.shifts))):
+            xs = self.points(self.samples, self.samples + n, shift)
+            if isinstance(self.approximator, FixedPointApproximator):
+                batch = self.approximator.benchmark_fixed(typing.cast(list[int], xs))
+            else:
+                batch = self.approximator.benchmark(xs)
+            # update running sums and errors (excluding failed approximations)
+            for err in batch:
+                if math.isnan(err):
+                    self.failures += 1
+                    continue
+                self.sums[r] += err
+                errs.append(err)
+        self.samples += n
+
+    def estimates(self) -> dict[str, Estimate]:
+        """Estimates of the mean and quantiles of errors (keyed by "mean" and e.g. "q0.99")."""
+        if not all(self.errors):
+            raise errors.ApproximatorError("No errors sampled for every replication")
+        # (sorting is linear for previously sorted errors followed by a batch)
+        for errs in self.errors:
+            errs.sort()
+        pooled = sorted(err for errs in self.errors for err in errs)
+        estimates = {
+            "mean": self._estimate(
+                math.fsum(self.sums) / len(pooled), [s / len(errs) for s, errs in zip(self.sums, self.errors)]
+            )
+        }
+        for q in self.quantiles:
+            estimates[f"q{q}"] = self._estimate(_quantile(pooled, q), [_quantile(errs, q) for errs in self.errors])
+        return estimates
+
+    def run(self, rtol: float = 0.01, max_samples: int = 1 << 16) -> dict[str, Estimate]:
+        """
+        Sample batches until the confidence intervals of all estimates are within a tolerance relative to the
+        estimates (or the maximal number of samples per replication is reached) and return the estimates.
+        """
+        while True:
+            if self.samples < max_samples:
+                self.sample(min(self.batch, max_samples - self.samples))
+            estimates = self.estimates()
+            if self.samples >= max_samples or (
+                all(estimate.converged(rtol) for estimate in estimates.values())
+                # quantiles are resolved by a minimal number of samples on either side
+                and all(self.samples * min(q, 1 - q) >= MIN_TAIL_SAMPLES for q in self.quantiles)
+            ):
+                return estimates
+
+    def _estimate(self, value: float, replicated: list[float]) -> Estimate:
+        # confidence interval about the estimate from the standard error of the replicated estimates
+        half_width = _t_quantile((1 + self.confidence) / 2, len(replicated) - 1) * statistics.stdev(replicated)
+        half_width /= math.sqrt(len(replicated))
+        return Estimate(value, value - half_width, value + half_width)
+
+
+def _radical_inverse(i: int) -> int:
+    """Van der Corput point in base 2 (bit-reversed index) as binary fraction of POINT_BITS bits."""
+    return int(f"{i:0{POINT_BITS}b}"[::-1], 2)
+
+
+def _quantile(sorted_values: list[float], q: float) -> float:
+    """Quantile of sorted values (linearly interpolated between order statistics)."""
+    position = q * (len(sorted_values) - 1)
+    i = math.floor(position)
+    if i + 1 >= len(sorted_values):
+        return sorted_values[-1]
+    return sorted_values[i] + (position - i) * (sorted_values[i + 1] - sorted_values[i])
+
+
+def _t_quantile(p: float, dof: int) -> float:
+    """Quantile of Student's t-distribution (for p above 0.5) by root-finding of its cumulative distribution."""
+    import mpmath
+
+    def cdf(t):
+        return 1 - mpmath.betainc(dof / 2, 0.5, 0, dof / (dof + t**2), regularized=True) / 2 - p
+
+    return float(mpmath.findroot(cdf, statistics.NormalDist().inv_cdf(p)))
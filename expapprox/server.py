@@ -0,0 +1,261 @@
+import asyncio
+import collections
+import json
+import math
+import time
+import typing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from expapprox import errors
+from expapprox.approximator import FixedPointApproximator
+
+# command requesting server statistics (instead of an input) in the line protocol
+STATS_COMMAND = "stats"
+
+
+class EvaluationServer:
+    """
+    Asyncio evaluation server for a fixed-point approximator, coalescing concurrent requests into micro-batches (of at
+    most max_batch inputs, collected for at most max_delay seconds) evaluated on a worker pool.
+
+    Clients connect over TCP with a line protocol: each line is an input, answered (in order) by a line with the
+    approximation (or "nan" on error), except for the line "stats" which is answered by a line of JSON statistics.
+    """
+
+    __slots__ = (
+        "approximator",
+        "max_batch",
+        "max_delay",
+        "workers",
+        "queue",
+        "latencies",
+        "requests",
+        "batches",
+        "executor",
+        "server",
+        "batcher",
+        "pending",
+    )
+
+    def __init__(
+        self,
+        approximator: FixedPointApproximator,
+        max_batch: int = 256,
+        max_delay: float = 0.001,
+        workers: int = 1,
+        window: int = 10000,
+    ):
+        if max_batch < 1:
+            raise errors.ApproximatorError(f"Invalid batch size {max_batch}; must be 1 or greater")
+        if max_delay < 0:
+            raise errors.ApproximatorError(f"Invalid batch delay {max_delay}; must be non-negative")
+        if workers < 1:
+            raise errors.ApproximatorError(f"Invalid number of workers {workers}; must be 1 or greater")
+        self.approximator = approximator
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.workers = workers
+        # queued (input, future, arrival time) requests
+        self.queue: asyncio.Queue[tuple[float, asyncio.Future[float], float]] = asyncio.Queue()
+        # latencies (in seconds) of the most recent requests and sizes of the evaluated batches
+        self.latencies: collections.deque[float] = collections.deque(maxlen=window)
+        self.batches: collections.Counter[int] = collections.Counter()
+        self.requests = 0
+        self.executor: Executor | None = None
+        self.server: asyncio.Server | None = None
+        self.batcher: asyncio.Task | None = None
+        # batches currently being evaluated
+        self.pending: set[asyncio.Task] = set()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> tuple[str, int]:
+        """Start serving on host and port (arbitrary free port if 0), returning the bound address."""
+        # evaluate batches in a separate thread (if single worker) to keep the event loop responsive
+        if self.workers == 1:
+            self.executor = ThreadPoolExecutor(1)
+        else:
+            self.executor = ProcessPoolExecutor(self.workers)
+        self.batcher = asyncio.create_task(self._batch())
+        self.server = await asyncio.start_server(self._handle, host, port)
+        return self.server.sockets[0].getsockname()[:2]
+
+    async def close(self):
+        """Stop serving and shut down the worker pool (after evaluating pending batches and queued requests)."""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self.batcher is not None:
+            self.batcher.cancel()
+            await asyncio.gather(self.batcher, return_exceptions=True)
+            # dispatch requests queued but not yet collected into batches (s.t. their futures are resolved)
+            while not self.queue.empty():
+                self._dispatch([self.queue.get_nowait() for _ in range(min(self.max_batch, self.queue.qsize()))])
+            await asyncio.gather(*self.pending, return_exceptions=True)
+        if self.executor is not None:
+            self.executor.shutdown()
+        self.server = self.batcher = self.executor = None
+
+    async def __aenter__(self) -> typing.Self:
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    def submit(self, x: float) -> asyncio.Future[float]:
+        """Queue input for evaluation in the next batch."""
+        future = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait((x, future, time.perf_counter()))
+        return future
+
+    async def evaluate(self, x: float) -> float:
+        """Approximate function value (NaN on error) of input evaluated in a batch."""
+        return await self.submit(x)
+
+    def stats(self) -> dict[str, float]:
+        """Statistics of queue depth, batch sizes and request latencies (in seconds)."""
+        latencies = sorted(self.latencies)
+        batches = sum(self.batches.values())
+        return {
+            "queue_depth": self.queue.qsize(),
+            "requests": self.requests,
+            "batches": batches,
+            "mean_batch_size": sum(size * n for size, n in self.batches.items()) / batches if batches else 0.0,
+            "max_batch_size": max(self.batches, default=0),
+            "p50_latency": _quantile(latencies, 0.5),
+            "p99_latency": _quantile(latencies, 0.99),
+        }
+
+    async def _batch(self):
+        """Collect queued requests into batches and dispatch them for evaluation."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            # collect further requests until the batch is full or the latency budget is spent (dispatching collected
+            # requests also if cancelled)
+            deadline = loop.time() + self.max_delay
+            try:
+                while len(batch) < self.max_batch:
+                    try:
+                        batch.append(self.queue.get_nowait())
+                        continue
+                    except asyncio.QueueEmpty:
+                        pass
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    # (unlike wait_for, timeout never swallows cancellations of the batcher racing with a request)
+                    try:
+                        async with asyncio.timeout(timeout):
+                            batch.append(await self.queue.get())
+                    except asyncio.TimeoutError:
+                        break
+            finally:
+                self._dispatch(batch)
+
+    def _dispatch(self, batch: list[tuple[float, asyncio.Future[float], float]]):
+        """Evaluate batch in a pending task."""
+        task = asyncio.create_task(self._evaluate(batch))
+        self.pending.add(task)
+        task.add_done_callback(self.pending.discard)
+
+    async def _evaluate(self, batch: list[tuple[float, asyncio.Future[float], float]]):
+        """Evaluate batch on the worker pool and resolve its futures."""
+        xs = [x for x, _, _ in batch]
+        try:
+            values = await asyncio.get_running_loop().run_in_executor(self.executor, evaluate, self.approximator, xs)
+        except Exception as e:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        end = time.perf_counter()
+        self.requests += len(batch)
+        self.batches[len(batch)] += 1
+        for (_, future, start), value in zip(batch, values):
+            self.latencies.append(end - start)
+            if not future.done():
+                future.set_result(value)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve connection, answering lines in order (while later lines are queued)."""
+        responses: asyncio.Queue[asyncio.Future[float] | str | None] = asyncio.Queue()
+        respond = asyncio.create_task(self._respond(responses, writer))
+        try:
+            while raw := await reader.readline():
+                line = raw.decode().strip()
+                if not line:
+                    continue
+                if line == STATS_COMMAND:
+                    responses.put_nowait(json.dumps(self.stats()))
+                    continue
+                try:
+                    x = float(line)
+                except ValueError:
+                    responses.put_nowait("nan")
+                    continue
+                responses.put_nowait(self.submit(x))
+        finally:
+            responses.put_nowait(None)
+            await respond
+            writer.close()
+
+    async def _respond(self, responses: asyncio.Queue, writer: asyncio.StreamWriter):
+        while (response := await responses.get()) is not None:
+            writer.write(f"{response if isinstance(response, str) else repr(await response)}\n".encode())
+            # flush once all ready responses are written
+            if responses.empty():
+                await writer.drain()
+        await writer.drain()
+
+
+class EvaluationClient:
+    """Client of an evaluation server, pipelining inputs over a single connection."""
+
+    __slots__ = ("reader", "writer", "lock")
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        # serialize requests s.t. responses are read in order
+        self.lock = asyncio.Lock()
+
+    @classmethod
+    async def connect(cls, host: str, port: int) -> typing.Self:
+        """Connect to evaluation server."""
+        return cls(*await asyncio.open_connection(host, port))
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+    async def __aenter__(self) -> typing.Self:
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def evaluate(self, xs: typing.Sequence[float]) -> list[float]:
+        """Approximate function values (NaN on error) of inputs."""
+        async with self.lock:
+            self.writer.write("".join(f"{x!r}\n" for x in xs).encode())
+            await self.writer.drain()
+            return [float(await self.reader.readline()) for _ in xs]
+
+    async def stats(self) -> dict[str, float]:
+        """Request server statistics."""
+        async with self.lock:
+            self.writer.write(f"{STATS_COMMAND}\n".encode())
+            await self.writer.drain()
+            return json.loads(await self.reader.readline())
+
+
+def evaluate(approximator: FixedPointApproximator, xs: typing.Sequence[float]) -> list[float]:
+    """Approximate function values (NaN on error) of batch of inputs as built-in floats."""
+    with approximator.workdps:
+        return [float(approximator.try_call(x)) for x in xs]
+
+
+def _quantile(values: typing.Sequence[float], q: float) -> float:
+    """Quantile (nearest rank) of sorted values (NaN if empty)."""
+    if not values:
+        return math.nan
+    return values[min(len(values) - 1, math.ceil(q * len(values)) - 1)]
@@ -0,0 +1,143 @@
+import os
+import typing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from expapprox import errors
+from expapprox.approximator import FixedPointApproximator
+
+# record of a sweep result (fixed-point numbers as signed 128-bit integers split into low and high 64-bit limbs)
+DTYPE = np.dtype(
+    [
+        ("x", "<f8"),
+        ("input_lo", "<u8"),
+        ("input_hi", "<i8"),
+        ("output_lo", "<u8"),
+        ("output_hi", "<i8"),
+        ("error", "<f8"),
+        ("bits", "<i2"),
+        ("status", "u1"),
+    ]
+)
+
+# statuses of records (newly created records are zero-initialized as pending)
+PENDING = 0
+OK = 1
+# approximation failed (with NaN error)
+FAILED = 2
+# input outside of the valid domain (with NaN error)
+MASKED = 3
+# fixed-point input or output exceeds 128 bits (and is not stored)
+OVERFLOW = 4
+
+
+def create_store(path: str | os.PathLike, n: int) -> np.memmap:
+    """Create memory-mapped store of n pending records (as a NumPy .npy file)."""
+    return np.lib.format.open_memmap(path, mode="w+", dtype=DTYPE, shape=(n,))
+
+
+def open_store(path: str | os.PathLike, writable: bool = False) -> np.memmap:
+    """Open memory-mapped store (read-only unless writable) without copying records."""
+    store = np.load(path, mmap_mode="r+" if writable else "r")
+    if store.dtype != DTYPE:
+        raise errors.ApproximatorError(f"Invalid result store {path}")
+    return store
+
+
+def fill(
+    store: np.ndarray,
+    start: int,
+    approximator: FixedPointApproximator,
+    xs: typing.Sequence[float],
+    bits: bool = False,
+):
+    """Write results of approximator for sequence of inputs to consecutive records of store in place."""
+    records = store[start : start + len(xs)]
+    with approximator.workdps:
+        for i, x in enumerate(xs):
+            records[i] = _record(approximator, x, bits)
+
+
+def _record(approximator: FixedPointApproximator, x: float, bits: bool) -> tuple:
+    fixed = approximator.to_fixed(x)
+    output = None
+    status = OK
+    if not approximator.in_domain(fixed):
+        status = MASKED
+    else:
+        try:
+            output = approximator.approx(fixed)
+        except:
+            status = FAILED
+    error = approximator.relative_error(
+        approximator.to_float(output) if output is not None else np.nan, approximator.ref(x)
+    )
+    max_bits = approximator.max_bits_fixed([fixed]) if bits and status == OK else 0
+    input_limbs, output_limbs = split(fixed), split(output or 0)
+    if status == OK and (input_limbs is None or output_limbs is None):
+        status = OVERFLOW
+    return (x, *(input_limbs or (0, 0)), *(output_limbs or (0, 0)), error, max_bits, status)
+
+
+def sweep(
+    path: str | os.PathLike,
+    approximator: FixedPointApproximator,
+    xs: typing.Sequence[float],
+    bits: bool = False,
+    workers: int = 1,
+    chunk_size: int = 65536,
+) -> np.memmap:
+    """
+    Compute results (relative errors and optionally max bits) of approximator for sequence of inputs into a
+    memory-mapped store, with worker processes filling disjoint chunks in place, and open it read-only.
+    """
+    if chunk_size < 1:
+        raise errors.ApproximatorError(f"Invalid chunk size {chunk_size}; must be 1 or greater")
+    store = create_store(path, len(xs))
+    starts = range(0, len(xs), chunk_size)
+    if workers == 1:
+        for start in starts:
+            fill(store, start, approximator, xs[start : start + chunk_size], bits)
+    else:
+        # release writable mapping before workers map the file themselves
+        store.flush()
+        del store
+        with ProcessPoolExecutor(workers) as executor:
+            futures = [
+                executor.submit(_fill_file, path, start, approximator, xs[start : start + chunk_size], bits)
+                for start in starts
+            ]
+            for future in futures:
+                future.result()
+    return open_store(path)
+
+
+def _fill_file(
+    path: str | os.PathLike, start: int, approximator: FixedPointApproximator, xs: typing.Sequence[float], bits: bool
+):
+    store = open_store(path, writable=True)
+    fill(store, start, approximator, xs, bits)
+    store.flush()
+
+
+def split(value: int) -> tuple[int, int] | None:
+    """Split signed 128-bit integer into low (unsigned) and high (signed) 64-bit limbs (None if exceeding 128 bits)."""
+    if not -(2**127) <= value < 2**127:
+        return None
+    return value & (2**64 - 1), value >> 64
+
+
+def join(lo: int, hi: int) -> int:
+    """Join low (unsigned) and high (signed) 64-bit limbs into signed 128-bit integer."""
+    return (int(hi) << 64) | int(lo)
+
+
+def inputs(store: np.ndarray) -> list[int]:
+    """Fixed-point inputs of records."""
+    return [join(lo, hi) for lo, hi in zip(store["input_lo"], store["input_hi"])]
+
+
+def outputs(store: np.ndarray) -> list[int]:
+    """Fixed-point outputs of records."""
+    return [join(lo, hi) for lo, hi in zip(store["output_lo"], store["output_hi"])]
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import collections.abc
 import typing
 from abc import ABC
 from contextlib import AbstractContextManager
@@ -21,6 +20,7 @@ class IntegerTracker(AbstractContextManager):
     # tracked attributes
     min_int: int | None = field(default=None, init=False)
     max_int: int | None = field(default=None, init=False)
+    operations: int = field(default=0, init=False)
     int: typing.Type[_TrackedInteger] = field(init=False)
 
     def __post_init__(self):
@@ -58,8 +58,80 @@ class IntegerTracker(AbstractContextManager):
         if not isinstance(value, int):
             raise errors.IntegerTrackerError(f"Cannot track non-integer value: {value}")
         # update min / max values
-        self.min_int = value if self.min_int is None or value < self.min_int else self.min_int
-        self.max_int = value if self.max_int is None or value > self.max_int else self.max_int
+        if self.min_int is None or value < self.min_int:
+            self.min_int = value
+        if self.max_int is None or value > self.max_int:
+            self.max_int = value
+
+    def register_result(self, name: str, operands: tuple[int, ...], value: int) -> int:
+        """Validate result of operation and return the value to proceed with (registered as tracked integer)."""
+        if not isinstance(value, int):
+            raise errors.IntegerTrackerError(f"Cannot track non-integer value: {value}")
+        return value
+
+
+@dataclass(frozen=True)
+class Overflow:
+    """Report of an integer operation with a result exceeding the word size of a FixedWidthTracker."""
+
+    # index of operation (by number of tracked operations)
+    operation: int
+    name: str
+    operands: tuple[int, ...]
+    # exact result of operation
+    value: int
+
+    def __str__(self) -> str:
+        operands = ", ".join(str(operand) for operand in self.operands)
+        return f"Operation {self.operation} ({self.name}({operands})) overflowed with {self.value}"
+
+
+@dataclass
+class FixedWidthTracker(IntegerTracker):
+    """
+    Integer tracker simulating integers of a fixed word size by raising IntegerOverflowError (or wrapping around, in
+    two's complement if signed) on results of operations exceeding the word size, with a report of the first
+    overflowing operation. Operands (inputs and constants) must be representable, and divisions floor as in Python.
+    """
+
+    width: int
+    unsigned: bool = False
+    wrap: bool = False
+    # tracked overflows
+    first_overflow: Overflow | None = field(default=None, init=False)
+    overflows: int = field(default=0, init=False)
+    # representable range of integers
+    lower: int = field(init=False)
+    upper: int = field(init=False)
+
+    def __post_init__(self):
+        if self.width < 1:
+            raise errors.IntegerTrackerError(f"Invalid width {self.width}; must be 1 or greater")
+        super().__post_init__()
+        self.lower = 0 if self.unsigned else -(1 << (self.width - 1))
+        self.upper = self.lower + (1 << self.width) - 1
+
+    def register(self, value: int):
+        super().register(value)
+        if not self.lower <= value <= self.upper:
+            self._overflow("operand", (value,), value)
+            raise errors.IntegerOverflowError(f"Operand {value} exceeds {self.width}-bit word")
+
+    def register_result(self, name: str, operands: tuple[int, ...], value: int) -> int:
+        if isinstance(value, int) and not self.lower <= value <= self.upper:
+            self._overflow(name.strip("_"), operands, value)
+            if not self.wrap:
+                raise errors.IntegerOverflowError(str(self.first_overflow))
+            # wrap around to representable range
+            value = (value - self.lower) % (1 << self.width) + self.lower
+        return super().register_result(name, operands, value)
+
+    def _overflow(self, name: str, operands: tuple[int, ...], value: int):
+        self.overflows += 1
+        if self.first_overflow is None:
+            # (converting tracked operands without tracking)
+            operands = tuple(int.__int__(operand) for operand in operands)
+            self.first_overflow = Overflow(self.operations, name, operands, int.__int__(value))
 
 
 # note: "lying" in the return type here to preserve (int) type hints of wrapped methods
@@ -67,21 +139,21 @@ def tracked(fn: typing.Callable[..., R]) -> typing.Callable[..., R]:
     """Register new value with IntegerTracker and return value as TrackedInteger."""
 
     def inner(tracked_int: _TrackedInteger, *args):
+        tracker = tracked_int.tracker
+        tracker.operations += 1
         # register all int args
         for arg in args:
             if isinstance(arg, int):
-                tracked_int.tracker.register(arg)
+                tracker.register(arg)
         # apply operation
         value = fn(tracked_int, *args)
-        if isinstance(value, collections.abc.Sequence):
-            # register elements of returned sequence
-            for v in value:
-                tracked_int.tracker.register(v)
-            return tuple(tracked_int.__class__(v) for v in value)
+        operands = (tracked_int, *args)
+        if isinstance(value, tuple):
+            # register elements of returned tuple
+            return tuple(tracked_int.__class__(tracker.register_result(fn.__name__, operands, v)) for v in value)
         else:
             # register return value
-            tracked_int.tracker.register(typing.cast(int, value))
-            return tracked_int.__class__(typing.cast(int, value))
+            return tracked_int.__class__(tracker.register_result(fn.__name__, operands, typing.cast(int, value)))
 
     return inner  # type: ignore
 
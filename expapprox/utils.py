@@ -1,13 +1,129 @@
+from __future__ import annotations
+
+import collections.abc
 import math
+import typing
+from abc import ABC, abstractmethod
+from fractions import Fraction
+
+if typing.TYPE_CHECKING:
+    import numpy as np
+
+T = typing.TypeVar("T", int, float)
+
+
+class LazyRange(collections.abc.Sequence[T], ABC):
+    """Base class for lazy ranges of evenly-spaced numbers supporting length, indexing, slicing and chunking."""
+
+    def __init__(self, start: T, end: T, step: T, length: int, indices: range | None = None):
+        self.start = start
+        self.end = end
+        self.step = step
+        # indices (into the unsliced range) of elements
+        self.indices = range(length) if indices is None else indices
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.start}, {self.end}, {self.step})[{len(self)}]"
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    @typing.overload
+    def __getitem__(self, index: int) -> T:
+        ...
+
+    @typing.overload
+    def __getitem__(self, index: slice) -> typing.Self:
+        ...
+
+    def __getitem__(self, index: int | slice) -> T | typing.Self:
+        if isinstance(index, slice):
+            sliced = self.__class__.__new__(self.__class__)
+            LazyRange.__init__(sliced, self.start, self.end, self.step, 0, self.indices[index])
+            return sliced
+        return self.value(self.indices[index])
+
+    def __iter__(self) -> typing.Iterator[T]:
+        return map(self.value, self.indices)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, collections.abc.Sequence):
+            return len(self) == len(other) and all(x == y for x, y in zip(self, other))
+        return NotImplemented
+
+    @abstractmethod
+    def value(self, i: int) -> T:
+        """Value at index i of the unsliced range."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def array(self) -> np.ndarray:
+        """Range as NumPy array."""
+        raise NotImplementedError
+
+    def chunks(self, size: int) -> typing.Iterator[typing.Self]:
+        """Iterate over consecutive (lazy) chunks of at most size elements."""
+        for i in range(0, len(self), size):
+            yield self[i : i + size]
+
+    def arrays(self, size: int) -> typing.Iterator[np.ndarray]:
+        """Iterate over consecutive chunks of at most size elements as NumPy arrays."""
+        for chunk in self.chunks(size):
+            yield chunk.array()
+
+
+class IntRange(LazyRange[int]):
+    """Lazy range of evenly-spaced integers."""
+
+    def __init__(self, start: int, end: int, step: int):
+        super().__init__(start, end, step, (end - start) // step + 1)
+
+    def value(self, i: int) -> int:
+        return min(self.start + i * self.step, self.end)
+
+    def array(self) -> np.ndarray:
+        import numpy as np
+
+        indices = np.arange(self.indices.start, self.indices.stop, self.indices.step, dtype=np.int64)
+        values = [self.start, self.end, self.value(self.indices[-1]) if self.indices else self.start]
+        if all(np.iinfo(np.int64).min <= v <= np.iinfo(np.int64).max for v in values):
+            return np.minimum(self.start + indices * self.step, self.end)
+        # fall back to Python integers (object array) for values beyond 64 bits
+        return np.array(list(self), dtype=object)
+
+
+class FloatRange(LazyRange[float]):
+    """Lazy range of evenly-spaced floats."""
+
+    def __init__(self, start: int | float, end: int | float, step: int | float):
+        super().__init__(start, end, step, round((end - start) / step) + 1)
+
+    def value(self, i: int) -> float:
+        return float(min(self.start + i * self.step, self.end))
+
+    def array(self) -> np.ndarray:
+        import numpy as np
+
+        indices = np.arange(self.indices.start, self.indices.stop, self.indices.step, dtype=np.float64)
+        return np.minimum(float(self.start) + indices * float(self.step), float(self.end))
+
+
+def fixed_range(
+    start: int | str | Fraction, end: int | str | Fraction, step: int | str | Fraction, decimals: int
+) -> IntRange:
+    """
+    Lazy range of evenly-spaced fixed-point numbers from exact (e.g. decimal string) bounds and step, floored to the
+    given number of decimals without floating-point intermediaries.
+    """
+    identity = 10**decimals
+    return IntRange(*(math.floor(Fraction(v) * identity) for v in (start, end, step)))
 
 
 def int_range(start: int, end: int, step: int) -> list[int]:
     """Range of evenly-spaced integers."""
-    length = math.floor((end - start) / step) + 1
-    return [min(start + i * step, end) for i in range(length)]
+    return list(IntRange(start, end, step))
 
 
 def float_range(start: int | float, end: int | float, step: int | float) -> list[float]:
     """Range of evenly-spaced floats."""
-    length = round((end - start) / step) + 1
-    return [float(min(start + i * step, end)) for i in range(length)]
+    return list(FloatRange(start, end, step))
@@ -0,0 +1,263 @@
+"""
+Vectorized evaluation of bit-shifted Padé approximators on NumPy arrays, with intermediaries of up to 128 bits
+represented as two 64-bit limbs (bit-identical to the scalar evaluation on Python ints).
+"""
+
+from __future__ import annotations
+
+import typing
+from dataclasses import dataclass
+
+import numpy as np
+
+from expapprox import errors
+from expapprox.approximators.pade import BitShiftPadeApproximator
+
+MASK32 = np.uint64(2**32 - 1)
+# bounds of intermediaries stored in a single (signed) limb
+INT64_BOUND = 2**63
+# bound of intermediaries in the kernel (s.t. sums of two of them fit a single limb)
+KERNEL_BOUND = 2**62
+
+
+@dataclass(frozen=True)
+class Int128:
+    """Array of signed 128-bit integers as high (signed) and low (unsigned) 64-bit limbs in two's complement."""
+
+    hi: np.ndarray
+    lo: np.ndarray
+
+    @classmethod
+    def from_int64(cls, a: np.ndarray) -> Int128:
+        a = np.asarray(a, dtype=np.int64)
+        return cls(a >> 63, a.astype(np.uint64))
+
+    @classmethod
+    def from_ints(cls, values: typing.Iterable[int]) -> Int128:
+        """Convert Python ints (raising ApproximatorError if exceeding 128 bits)."""
+        values = list(values)
+        if any(not -(2**127) <= value < 2**127 for value in values):
+            raise errors.ApproximatorError("Integer exceeds 128 bits")
+        return cls(
+            np.array([value >> 64 for value in values], dtype=np.int64),
+            np.array([value & (2**64 - 1) for value in values], dtype=np.uint64),
+        )
+
+    def to_ints(self) -> list[int]:
+        """Convert to Python ints."""
+        return [(int(hi) << 64) | int(lo) for hi, lo in zip(self.hi, self.lo)]
+
+    def to_int64(self) -> np.ndarray:
+        """Convert to single limbs (raising ApproximatorError if exceeding 64 bits)."""
+        value = self.lo.astype(np.int64)
+        if np.any(self.hi != value >> 63):
+            raise errors.ApproximatorError("Integer exceeds 64 bits")
+        return value
+
+    def to_float(self) -> np.ndarray:
+        """Convert to (rounded) floats."""
+        # (from magnitudes to avoid cancellation of limbs)
+        negative = self.hi < 0
+        magnitude = select(negative, -self, self)
+        return np.where(negative, -1.0, 1.0) * (np.ldexp(magnitude.hi.astype(np.float64), 64) + magnitude.lo)
+
+    def __len__(self) -> int:
+        return len(self.lo)
+
+    def __getitem__(self, key) -> Int128:
+        return Int128(self.hi[key], self.lo[key])
+
+    def __neg__(self) -> Int128:
+        lo = ~self.lo + np.uint64(1)
+        return Int128(~self.hi + (lo == 0), lo)
+
+    def __add__(self, other: Int128) -> Int128:
+        lo = self.lo + other.lo
+        # carry of low limbs (wrapped around)
+        return Int128(self.hi + other.hi + (lo < self.lo), lo)
+
+    def __sub__(self, other: Int128) -> Int128:
+        return self + -other
+
+    def __lshift__(self, shift: np.ndarray) -> Int128:
+        """Shift left by non-negative shifts below 128 (wrapping around)."""
+        shift = np.asarray(shift, dtype=np.uint64)
+        hi = self.hi.astype(np.uint64)
+        small = shift < 64
+        small_shift = np.where(small, shift, 0)
+        large_shift = np.where(small, 0, shift - np.uint64(64))
+        # bits carried from low to high limb (none for zero shifts)
+        carry = np.where(small_shift > 0, self.lo >> (np.uint64(64) - np.maximum(small_shift, 1)), 0)
+        return Int128(
+            np.where(small, (hi << small_shift) | carry, self.lo << large_shift).astype(np.int64),
+            np.where(small, self.lo << small_shift, 0).astype(np.uint64),
+        )
+
+    def __rshift__(self, shift: np.ndarray) -> Int128:
+        """Shift right (flooring) by non-negative shifts (saturating at 127)."""
+        shift = np.minimum(np.asarray(shift, dtype=np.uint64), 127)
+        small = shift < 64
+        small_shift = np.where(small, shift, 0)
+        large_shift = np.where(small, 0, shift - np.uint64(64))
+        # bits carried from high to low limb (none for zero shifts)
+        carry = np.where(
+            small_shift > 0, self.hi.astype(np.uint64) << (np.uint64(64) - np.maximum(small_shift, 1)), 0
+        ).astype(np.uint64)
+        return Int128(
+            np.where(small, self.hi >> small_shift.astype(np.int64), self.hi >> 63),
+            np.where(
+                small, (self.lo >> small_shift) | carry, (self.hi >> large_shift.astype(np.int64)).astype(np.uint64)
+            ),
+        )
+
+    def floordiv(self, divisor: np.ndarray | int) -> np.ndarray:
+        """
+        Floor-divide by positive divisors of at most 63 bits (raising ApproximatorError unless quotients fit a single
+        limb), estimating quotients in floating point and correcting them by exact remainders.
+        """
+        divisor = np.asarray(divisor, dtype=np.int64)
+        float_divisor = divisor.astype(np.float64)
+        # (absolute error of floats of negative numbers is at most 2^12 from rounding of the low limb)
+        estimate = np.floor((np.ldexp(self.hi.astype(np.float64), 64) + self.lo.astype(np.float64)) / float_divisor)
+        max_estimate = np.abs(estimate).max(initial=0)
+        if max_estimate >= INT64_BOUND:
+            raise errors.ApproximatorError("Quotient exceeds 64 bits")
+        quotient = estimate.astype(np.int64)
+        max_divisor = int(divisor.max(initial=1))
+        if max_estimate * max_divisor * 2.0**-50 + 2**13 + 4 * max_divisor < KERNEL_BOUND:
+            # remainders of estimates fit a single limb (computed exactly from the wrapped-around low limbs) s.t. the
+            # quotient is corrected by integer division
+            remainder = self.lo.view(np.int64) - quotient * divisor
+            return quotient + remainder // divisor
+        # remainders of estimates are within a few thousand divisors - correct in floating point once more
+        remainder = self - multiply(quotient, divisor)
+        correction = np.floor(remainder.to_float() / float_divisor).astype(np.int64)
+        quotient += correction
+        remainder = remainder - multiply(correction, divisor)
+        # remaining corrections by at most one divisor
+        below = remainder.hi < 0
+        quotient -= below
+        divisor = Int128.from_int64(np.broadcast_to(divisor, self.lo.shape))
+        remainder = select(below, remainder + divisor, remainder)
+        quotient += (remainder - divisor).hi >= 0
+        return quotient
+
+
+def multiply(a: np.ndarray, b: np.ndarray | int) -> Int128:
+    """Multiply single limbs exactly to double limbs."""
+    a = np.asarray(a, dtype=np.int64)
+    b = np.asarray(b, dtype=np.int64)
+    # low limb of (two's complement) product wraps around exactly
+    lo = (a * b).view(np.uint64)
+    # high limb of unsigned product (of two's complement limbs) from 32-bit halves
+    ua, ub = a.view(np.uint64), b.view(np.uint64)
+    a0, a1 = ua & MASK32, ua >> np.uint64(32)
+    b0, b1 = ub & MASK32, ub >> np.uint64(32)
+    middle = ((a0 * b0) >> np.uint64(32)) + a1 * b0
+    middle_lo, middle_hi = middle & MASK32, middle >> np.uint64(32)
+    hi = a1 * b1 + middle_hi + ((middle_lo + a0 * b1) >> np.uint64(32))
+    # signed high limb subtracts the other factor for each negative factor
+    hi = hi.view(np.int64) - np.where(a < 0, b, 0) - np.where(b < 0, a, 0)
+    return Int128(np.broadcast_to(hi, lo.shape), lo)
+
+
+def select(condition: np.ndarray, a: Int128, b: Int128) -> Int128:
+    """Select elements of a where condition holds, else of b."""
+    return Int128(np.where(condition, a.hi, b.hi), np.where(condition, a.lo, b.lo))
+
+
+class VectorizedBitShiftPadeApproximator:
+    """
+    Vectorized evaluation of a bit-shifted Padé approximator for arrays of (64-bit) fixed-point inputs, with kernel
+    intermediaries in single limbs and products in double limbs (validated to fit for all remainders upon creation).
+    """
+
+    __slots__ = ("approximator", "remainder_approximator", "remainder_bound")
+
+    def __init__(self, approximator: BitShiftPadeApproximator):
+        if not isinstance(approximator, BitShiftPadeApproximator):
+            raise errors.ApproximatorError(f"Vectorized evaluation not available for {approximator!r}")
+        if approximator.internal_decimals != approximator.decimals:
+            raise errors.ApproximatorError("Vectorized evaluation requires internal decimals equal to decimals")
+        self.approximator = approximator
+        self.remainder_approximator = approximator.remainder_approximator
+        # largest magnitude of remainders (between -0.5*log(2) and 0.5*log(2))
+        self.remainder_bound = max(approximator.log2half, approximator.log2 - approximator.log2half - 1)
+        self._validate()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.approximator!r})"
+
+    def _validate(self):
+        """Validate that kernel intermediaries fit in single limbs (and products in double limbs) for all remainders."""
+        pade = self.remainder_approximator
+        identity = pade.identity
+        bound = self.remainder_bound
+        # rescaled powers are bounded by the remainder (below 1) and terms by their coefficient times the remainder
+        products = [bound * c for c in pade.coefficients[1:]]
+        terms = [product // identity + 1 if pade.normalized else product for product in products]
+        even_bound = pade.constant + sum(terms[1::2])
+        odd_bound = sum(terms[0::2])
+        # denominator (and numerator) are positive and the quotient is at most numerator / denominator * identity
+        denominator_bound = pade.constant - odd_bound
+        numerator_bound = even_bound + odd_bound
+        # products with (fixed-point) coefficients of normalized approximators are rescaled from double limbs
+        single = [identity, numerator_bound, *([] if pade.normalized else products)]
+        double = [bound * bound, numerator_bound * identity, *(products if pade.normalized else [])]
+        if not (
+            denominator_bound > 0
+            and max(single) < KERNEL_BOUND
+            and max(double) < KERNEL_BOUND**2
+            and numerator_bound * identity // denominator_bound < KERNEL_BOUND
+        ):
+            raise errors.ApproximatorError(f"Intermediaries of {self.approximator!r} exceed two 64-bit limbs")
+
+    def approx(self, xs: np.ndarray) -> Int128:
+        """Approximate function values of array of fixed-point inputs (bit-identically to the scalar approximator)."""
+        approximator = self.approximator
+        xs = np.asarray(xs, dtype=np.int64)
+        if np.any(xs >= INT64_BOUND - approximator.log2half):
+            raise errors.ApproximatorError("Fixed-point input exceeds range reduction")
+        # find integer quotient s.t. remainder is between -0.5*log(2) and 0.5*log(2)
+        quotient = (xs + np.int64(approximator.log2half)) // np.int64(approximator.log2)
+        # (exact in wrapped-around single limbs since the remainder fits)
+        remainder = xs - quotient * np.int64(approximator.log2)
+        preshifted = self._approx_remainder(remainder)
+        # bitshift by quotient (saturating right shifts of positive values to zero)
+        right = Int128.from_int64(preshifted >> np.minimum(np.maximum(-quotient, 0), 63))
+        left_shift = np.maximum(quotient, 0)
+        left = Int128.from_int64(preshifted) << np.minimum(left_shift, 127)
+        # (positive outputs fit if shifting back recovers the preshifted value)
+        if np.any((left_shift > 126) | ((left >> left_shift).to_int64() != preshifted)):
+            raise errors.ApproximatorError("Fixed-point output exceeds 128 bits")
+        values = select(quotient < 0, right, left)
+        # short-circuit inputs underflowing to zero
+        underflow = xs <= approximator.underflow
+        return Int128(np.where(underflow, 0, values.hi), np.where(underflow, 0, values.lo).astype(np.uint64))
+
+    def _approx_remainder(self, x: np.ndarray) -> np.ndarray:
+        pade = self.remainder_approximator
+        identity = pade.identity
+        coefficients = pade.coefficients
+        # (mirrors PadeApproximator._accumulators)
+        even_accumulator = np.full_like(x, pade.constant)
+        if pade.normalized:
+            odd_accumulator = multiply(x, coefficients[1]).floordiv(identity)
+        else:
+            odd_accumulator = x * np.int64(coefficients[1])
+        x_pow = x
+        for i, c in enumerate(coefficients[2:]):
+            x_pow = multiply(x_pow, x).floordiv(identity)
+            if pade.normalized:
+                x_term = multiply(x_pow, c).floordiv(identity)
+            elif i < pade.order - 2:
+                x_term = x_pow * np.int64(c)
+            else:
+                x_term = x_pow
+            if i % 2:
+                odd_accumulator = odd_accumulator + x_term
+            else:
+                even_accumulator = even_accumulator + x_term
+        numerator = even_accumulator + odd_accumulator
+        denominator = even_accumulator - odd_accumulator
+        return multiply(numerator, identity).floordiv(denominator)
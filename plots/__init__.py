@@ -47,22 +47,32 @@ rc_context = mpl.rc_context(
 )
 
 
-def savefig(f: typing.Callable[[], Figure] | Figure, fname: typing.Optional[str] = None, *args, **kwargs):
-    # get path to .out dir
-    out_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), ".out")
-    if not os.path.exists(out_path):
-        os.makedirs(out_path)
-    # make figure if received callable
-    fig = f if isinstance(f, Figure) else f()
+# path to .out dir
+OUT_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), ".out")
+
+
+def savefig(
+    f: typing.Callable[[], Figure] | Figure,
+    fname: typing.Optional[str] = None,
+    *args,
+    key: typing.Optional[str] = None,
+    **kwargs,
+):
+    if not os.path.exists(OUT_PATH):
+        os.makedirs(OUT_PATH)
     # default to function name, else filename (ignoring ".py") of calling module
     default_fname = os.path.basename(inspect.stack()[1].filename[:-3]) if isinstance(f, Figure) else f.__name__
+    path = os.path.join(OUT_PATH, default_fname if fname is None else fname)
+    # skip stale-checked figures if saved from data with the same key
+    key_path = f"{path}.key"
+    if key is not None and os.path.exists(key_path) and os.path.exists(f"{path}.{mpl.rcParams['savefig.format']}"):
+        with open(key_path) as key_file:
+            if key_file.read() == key:
+                return
+    # make figure if received callable
+    fig = f if isinstance(f, Figure) else f()
     # save to .out/{filename}.pdf
-    fig.savefig(
-        os.path.join(
-            os.path.dirname(os.path.dirname(__file__)),
-            ".out",
-            default_fname if fname is None else fname,
-        ),
-        *args,
-        **kwargs,
-    )
+    fig.savefig(path, *args, **kwargs)
+    if key is not None:
+        with open(key_path, "w") as key_file:
+            key_file.write(key)
@@ -7,7 +7,7 @@ from matplotlib import ticker
 
 from expapprox.approximators import BitShiftPadeApproximator
 from expapprox.utils import float_range
-from plots import rc_context, savefig
+from plots import data, rc_context, savefig
 
 # parameters
 C = 100_000
@@ -36,9 +36,14 @@ BITS_INTERMEDIARY = BitShiftPadeApproximator(DECIMALS, ORDER).max_bits(INTERMEDI
 BITS_MULTIPLICATION = BITS_DEPOSIT + BITS_APPROX
 
 
+def threshold_tasks() -> list[data.Task]:
+    xs = float_range(0.02, 2 * X_UPPER, 0.01)
+    return [data.benchmark(BitShiftPadeApproximator(PLOT_DECIMALS, order), xs) for order in range(1, 5)]
+
+
 def threshold_plot():
-    stepsize = 0.01
-    xs = float_range(0.02, 2 * X_UPPER, stepsize)
+    xs = float_range(0.02, 2 * X_UPPER, 0.01)
+    results = data.load(threshold_tasks())
 
     f, ax = plt.subplots(1, 1, sharex=True)
 
@@ -52,8 +57,7 @@ def threshold_plot():
 
     for order in range(1, 5):
         # relative errors
-        approximator = BitShiftPadeApproximator(PLOT_DECIMALS, order)
-        ax.plot(xs, approximator.benchmark(xs), color=f"C{order}", label=order)
+        ax.plot(xs, results[order - 1], color=f"C{order}", label=order)
 
     ax.plot(
         [0, X_UPPER, X_UPPER],
@@ -68,6 +72,10 @@ def threshold_plot():
     return f
 
 
+def bits_tasks() -> list[data.Task]:
+    return [data.max_bits(BitShiftPadeApproximator(d, ORDER), INTERMEDIARY_TEST_RANGE) for d in range(1, 26)]
+
+
 def bits_plot():
     decimals = list(range(1, 26))
     approx_bits = [math.ceil(math.log2(10**d * (1 + RATE_ANNUAL) * mpmath.exp(BETA))) for d in decimals]
@@ -95,7 +103,7 @@ def bits_plot():
 
     # bits used for approximation across number of digits
     axs[1].set_title(f"Required bits (approximation)")
-    approximator_bits = [BitShiftPadeApproximator(d, ORDER).max_bits(INTERMEDIARY_TEST_RANGE) for d in decimals]
+    approximator_bits = [int(bits) for bits in data.load(bits_tasks())]
     axs[1].plot(decimals, approximator_bits, color=f"C0", label="Intermediary values")
     axs[1].plot(decimals, approx_bits, color=f"C1", label="Approximation")
     axs[1].plot(
@@ -110,8 +118,11 @@ def bits_plot():
 
 @rc_context
 def main():
-    savefig(threshold_plot)
-    savefig(bits_plot)
+    figures = {threshold_plot: threshold_tasks(), bits_plot: bits_tasks()}
+    # compute missing data of all figures in parallel before rendering (stale) figures
+    data.load([task for tasks in figures.values() for task in tasks])
+    for figure, tasks in figures.items():
+        savefig(figure, key=data.key(tasks))
 
 
 if __name__ == "__main__":
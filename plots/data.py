@@ -0,0 +1,118 @@
+import functools
+import hashlib
+import os
+import typing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+
+import mpmath
+import numpy as np
+
+import expapprox
+from expapprox.approximator import Approximator, FixedPointApproximator
+from plots import OUT_PATH
+
+CACHE_PATH = os.path.join(OUT_PATH, "cache")
+
+Kind = typing.Literal["benchmark", "values", "ref", "max_bits", "mean_operations"]
+
+
+@dataclass(frozen=True)
+class Task:
+    """Plot data computation for an approximator on a grid of inputs."""
+
+    kind: Kind
+    approximator: Approximator
+    xs: tuple[float, ...]
+    # mpmath decimals for evaluation (defaults to current mpmath decimals upon creation)
+    precision: int | None = None
+
+    def __post_init__(self):
+        # fix default precision s.t. it is part of the key and carried over to worker processes
+        if self.precision is None:
+            object.__setattr__(self, "precision", mpmath.mp.dps)
+
+    @property
+    def key(self) -> str:
+        """Hash of approximator specification, grid, precision and approximator code."""
+        digest = hashlib.sha256()
+        digest.update(f"{self.kind}:{self.approximator!r}:{self.precision}:{code_fingerprint()}".encode())
+        digest.update(np.asarray(self.xs, dtype=np.float64).tobytes())
+        return digest.hexdigest()
+
+    @property
+    def path(self) -> str:
+        return os.path.join(CACHE_PATH, f"{self.key}.npz")
+
+    def compute(self) -> np.ndarray:
+        with mpmath.workdps(self.precision):
+            if self.kind == "benchmark":
+                return np.array(self.approximator.benchmark(self.xs), dtype=np.float64)
+            if self.kind == "values":
+                return np.array([float(self.approximator.try_call(x)) for x in self.xs], dtype=np.float64)
+            if self.kind == "ref":
+                return np.array([float(self.approximator.ref(x)) for x in self.xs], dtype=np.float64)
+            if self.kind == "max_bits" and isinstance(self.approximator, FixedPointApproximator):
+                return np.array(self.approximator.max_bits(self.xs))
+            if self.kind == "mean_operations" and isinstance(self.approximator, FixedPointApproximator):
+                return np.array(self.approximator.mean_operations(self.xs))
+        raise ValueError(f"Invalid task {self.kind} for {self.approximator!r}")
+
+
+def benchmark(approximator: Approximator, xs: typing.Sequence[float], precision: int | None = None) -> Task:
+    return Task("benchmark", approximator, tuple(xs), precision)
+
+
+def values(approximator: Approximator, xs: typing.Sequence[float], precision: int | None = None) -> Task:
+    return Task("values", approximator, tuple(xs), precision)
+
+
+def ref(approximator: Approximator, xs: typing.Sequence[float], precision: int | None = None) -> Task:
+    return Task("ref", approximator, tuple(xs), precision)
+
+
+def max_bits(approximator: FixedPointApproximator, xs: typing.Sequence[float]) -> Task:
+    return Task("max_bits", approximator, tuple(xs))
+
+
+def mean_operations(approximator: FixedPointApproximator, xs: typing.Sequence[float]) -> Task:
+    return Task("mean_operations", approximator, tuple(xs))
+
+
+@functools.cache
+def code_fingerprint() -> str:
+    """Hash of the source code of the expapprox package (s.t. cached data is recomputed upon changes)."""
+    digest = hashlib.sha256()
+    root = os.path.dirname(expapprox.__file__)
+    for directory, subdirectories, files in sorted(os.walk(root)):
+        subdirectories.sort()
+        for file in sorted(files):
+            if file.endswith(".py"):
+                path = os.path.join(directory, file)
+                digest.update(os.path.relpath(path, root).encode())
+                with open(path, "rb") as f:
+                    digest.update(f.read())
+    return digest.hexdigest()
+
+
+def key(tasks: typing.Iterable[Task]) -> str:
+    """Combined hash of tasks."""
+    return hashlib.sha256("".join(task.key for task in tasks).encode()).hexdigest()
+
+
+def load(tasks: typing.Sequence[Task], workers: int | None = None) -> list[np.ndarray]:
+    """Load data of tasks from cache, computing (in parallel) and caching missing data."""
+    if not os.path.exists(CACHE_PATH):
+        os.makedirs(CACHE_PATH)
+    # compute each missing task once
+    missing = list({task.key: task for task in tasks if not os.path.exists(task.path)}.values())
+    if len(missing) <= 1 or workers == 1:
+        for task in missing:
+            np.savez_compressed(task.path, data=task.compute())
+    else:
+        with ProcessPoolExecutor(workers) as executor:
+            # cache results as they complete s.t. interrupted runs can be resumed
+            futures = {executor.submit(task.compute): task for task in missing}
+            for future in as_completed(futures):
+                np.savez_compressed(futures[future].path, data=future.result())
+    return [np.load(task.path)["data"] for task in tasks]
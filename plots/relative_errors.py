@@ -6,15 +6,32 @@ from matplotlib import ticker
 from expapprox.approximators import *
 from expapprox.approximators.minimax import *
 from expapprox.utils import float_range
-from plots import rc_context, savefig
+from plots import data, rc_context, savefig
 
 DECIMALS = 20
+# mpmath decimals for evaluating (floating-point) minimax approximators
+MINIMAX_PRECISION = 40
+
+
+def grid(start: float, end: float, stepsize: float) -> list[float]:
+    xs = float_range(start, end, stepsize)
+    return [x for x in xs if not (-stepsize < x < stepsize)]  # exclude e(0) = 1
+
+
+def relative_error_tasks(cls) -> list[data.Task]:
+    xs = grid(-5, 5, 0.002)
+    approximators = [cls(DECIMALS, order) for order in range(1, 4)]
+    return [
+        *[data.values(approximator, xs) for approximator in approximators],
+        *[data.benchmark(approximator, xs) for approximator in approximators],
+        data.ref(approximators[0], xs),
+    ]
 
 
 def relative_error_plot(cls, title: str):
-    stepsize = 0.002
-    xs = float_range(-5, 5, stepsize)
-    xs = [x for x in xs if not (-stepsize < x < stepsize)]  # exclude e(0) = 1
+    xs = grid(-5, 5, 0.002)
+    results = data.load(relative_error_tasks(cls))
+    values, errs, refs = results[:3], results[3:6], results[6]
 
     f, axs = plt.subplots(2, sharex=True, figsize=[7, 5])
     axs[0].xaxis.set_minor_locator(ticker.AutoMinorLocator(2))
@@ -31,32 +48,32 @@ def relative_error_plot(cls, title: str):
     axs[1].set_xlabel("$x$")
 
     for order in range(1, 4):
-        approximator = cls(DECIMALS, order)
         # value plot
-        axs[0].plot(xs, [approximator.try_call(x) for x in xs], color=f"C{order}", label=f"{order}")
+        axs[0].plot(xs, values[order - 1], color=f"C{order}", label=f"{order}")
         # relative error plot
-        errs = approximator.benchmark(xs)
-        axs[1].plot(xs, errs, color=f"C{order}")
+        axs[1].plot(xs, errs[order - 1], color=f"C{order}")
 
     # reference value
-    axs[0].plot(xs, [cls.ref(x) for x in xs], label="Reference", linestyle=":", color="C0", zorder=99)
+    axs[0].plot(xs, refs, label="Reference", linestyle=":", color="C0", zorder=99)
 
     axs[0].legend(title="Order")
 
     return f
 
 
-def pade_taylor_max_relative_errors_plot():
-    stepsize = 0.05
-    xs = float_range(-math.log(2) / 2, math.log(2) / 2, stepsize)
-    xs = [x for x in xs if not (-stepsize < x < stepsize)]  # exclude e(0) = 1
+def pade_taylor_max_relative_errors_tasks() -> list[data.Task]:
+    xs = grid(-math.log(2) / 2, math.log(2) / 2, 0.05)
+    return [
+        *[data.benchmark(TaylorApproximator(DECIMALS, order), xs) for order in range(1, 6)],
+        *[data.benchmark(PadeApproximator(DECIMALS, order), xs) for order in range(1, 6)],
+    ]
+
 
+def pade_taylor_max_relative_errors_plot():
     # compute max relative errors
-    taylor_errs: dict[int, float] = {}
-    pade_errs: dict[int, float] = {}
-    for order in range(1, 6):
-        taylor_errs[order] = max(TaylorApproximator(DECIMALS, order).benchmark(xs))
-        pade_errs[order] = max(PadeApproximator(DECIMALS, order).benchmark(xs))
+    results = data.load(pade_taylor_max_relative_errors_tasks())
+    taylor_errs: dict[int, float] = {order: results[order - 1].max() for order in range(1, 6)}
+    pade_errs: dict[int, float] = {order: results[order + 4].max() for order in range(1, 6)}
 
     f, ax = plt.subplots(1)
 
@@ -78,10 +95,22 @@ def pade_taylor_max_relative_errors_plot():
     return f
 
 
+def bitshift_comparison_tasks() -> list[data.Task]:
+    xs = grid(-5, 5, 0.002)
+    return [
+        data.benchmark(approximator, xs)
+        for order in range(1, 4)
+        for approximator in [
+            TaylorApproximator(DECIMALS, order),
+            PadeApproximator(DECIMALS, order),
+            BitShiftPadeApproximator(DECIMALS, order),
+        ]
+    ]
+
+
 def bitshift_comparison_plot():
-    stepsize = 0.002
-    xs = float_range(-5, 5, stepsize)
-    xs = [x for x in xs if not (-stepsize < x < stepsize)]  # exclude e(0) = 1
+    xs = grid(-5, 5, 0.002)
+    results = data.load(bitshift_comparison_tasks())
 
     f, axs = plt.subplots(3, 1, sharex=True, figsize=[7, 6])
     for ax in axs:
@@ -98,22 +127,33 @@ def bitshift_comparison_plot():
         ax.set_title(f"Relative errors (order {order})")
 
         # relative errors
-        ta = TaylorApproximator(DECIMALS, order)
-        pa = PadeApproximator(DECIMALS, order)
-        ba = BitShiftPadeApproximator(DECIMALS, order)
-        ax.plot(xs, ta.benchmark(xs), color=f"C{order}", label=f"Taylor")
-        ax.plot(xs, pa.benchmark(xs), color=f"C{order}", linestyle="--", label=f"Padé")
-        ax.plot(xs, ba.benchmark(xs), color=f"C{order}", linestyle=":", label=f"Bit-shifted Padé")
+        taylor_errs, pade_errs, bitshift_errs = results[3 * i : 3 * i + 3]
+        ax.plot(xs, taylor_errs, color=f"C{order}", label=f"Taylor")
+        ax.plot(xs, pade_errs, color=f"C{order}", linestyle="--", label=f"Padé")
+        ax.plot(xs, bitshift_errs, color=f"C{order}", linestyle=":", label=f"Bit-shifted Padé")
 
     axs[0].legend(title="Method")
 
     return f
 
 
+def minimax_comparison_tasks() -> list[data.Task]:
+    xs = grid(-math.log(2) / 2, math.log(2) / 2, 0.001)
+    return [
+        task
+        for order in range(1, 4)
+        for task in [
+            data.benchmark(TaylorApproximator(DECIMALS, order), xs),
+            data.benchmark(MinimaxPolynomialApproximator(order), xs),
+            data.benchmark(PadeApproximator(DECIMALS, order), xs),
+            data.benchmark(MinimaxRationalApproximator(order), xs),
+        ]
+    ]
+
+
 def minimax_comparison_plot():
-    stepsize = 0.001
-    xs = float_range(-math.log(2) / 2, math.log(2) / 2, stepsize)
-    xs = [x for x in xs if not (-stepsize < x < stepsize)]  # exclude e(0) = 1
+    xs = grid(-math.log(2) / 2, math.log(2) / 2, 0.001)
+    results = data.load(minimax_comparison_tasks())
 
     f, axs = plt.subplots(3, 2, sharex=True, figsize=[7, 6])
     for ax in axs.flatten():
@@ -129,10 +169,8 @@ def minimax_comparison_plot():
         ax.set_xlabel("$x$")
         ax.set_title(f"Order {order}")
         # relative errors
-        ta = TaylorApproximator(DECIMALS, order)
-        ra = MinimaxPolynomialApproximator(order)
-        ax.plot(xs, ta.benchmark(xs), color=f"C{order}", label=f"Taylor")
-        ax.plot(xs, ra.benchmark(xs), color=f"C{order}", linestyle=":", label=f"Minimax poly")
+        ax.plot(xs, results[4 * i], color=f"C{order}", label=f"Taylor")
+        ax.plot(xs, results[4 * i + 1], color=f"C{order}", linestyle=":", label=f"Minimax poly")
 
     # pade vs. minimax rational
     for i, ax in enumerate(axs[:, 1]):
@@ -142,10 +180,8 @@ def minimax_comparison_plot():
         ax.set_xlabel("$x$")
         ax.set_title(f"Order {order}")
         # relative errors
-        ta = PadeApproximator(DECIMALS, order)
-        ra = MinimaxRationalApproximator(order)
-        ax.plot(xs, ta.benchmark(xs), color=f"C{order}", label=f"Padé")
-        ax.plot(xs, ra.benchmark(xs), color=f"C{order}", linestyle=":", label=f"Minimax ratio")
+        ax.plot(xs, results[4 * i + 2], color=f"C{order}", label=f"Padé")
+        ax.plot(xs, results[4 * i + 3], color=f"C{order}", linestyle=":", label=f"Minimax ratio")
 
     f.suptitle("Relative errors")
     axs[0, 0].legend(title="Method", loc="lower right")
@@ -154,25 +190,27 @@ def minimax_comparison_plot():
     return f
 
 
-def minimax_max_relative_errors_plot():
-    stepsize = 0.05
-    xs = float_range(-math.log(2) / 2, math.log(2) / 2, stepsize)
-    xs = [x for x in xs if not (-stepsize < x < stepsize)]  # exclude e(0) = 1
-
-    # compute max relative errors
-    taylor_errs: dict[int, float] = {}
-    pade_errs: dict[int, float] = {}
-    minimax_poly_errs: dict[int, float] = {}
-    minimax_rat_errs: dict[int, float] = {}
+def minimax_max_relative_errors_tasks() -> list[data.Task]:
+    xs = grid(-math.log(2) / 2, math.log(2) / 2, 0.05)
+    return [
+        task
+        for order in range(1, 6)
+        for task in [
+            data.benchmark(TaylorApproximator(DECIMALS, order), xs),
+            data.benchmark(PadeApproximator(DECIMALS, order), xs),
+            data.benchmark(MinimaxPolynomialApproximator(order), xs, precision=MINIMAX_PRECISION),
+            data.benchmark(MinimaxRationalApproximator(order), xs, precision=MINIMAX_PRECISION),
+        ]
+    ]
 
-    import mpmath
 
-    for order in range(1, 6):
-        taylor_errs[order] = max(TaylorApproximator(DECIMALS, order).benchmark(xs))
-        pade_errs[order] = max(PadeApproximator(DECIMALS, order).benchmark(xs))
-        with mpmath.workdps(40):
-            minimax_poly_errs[order] = max(MinimaxPolynomialApproximator(order).benchmark(xs))
-            minimax_rat_errs[order] = max(MinimaxRationalApproximator(order).benchmark(xs))
+def minimax_max_relative_errors_plot():
+    # compute max relative errors
+    results = [errs.max() for errs in data.load(minimax_max_relative_errors_tasks())]
+    taylor_errs: dict[int, float] = {order: results[4 * order - 4] for order in range(1, 6)}
+    pade_errs: dict[int, float] = {order: results[4 * order - 3] for order in range(1, 6)}
+    minimax_poly_errs: dict[int, float] = {order: results[4 * order - 2] for order in range(1, 6)}
+    minimax_rat_errs: dict[int, float] = {order: results[4 * order - 1] for order in range(1, 6)}
 
     f, ax = plt.subplots(1)
 
@@ -206,12 +244,18 @@ def pade_relative_errors():
 
 @rc_context
 def main():
-    savefig(taylor_relative_errors)
-    savefig(pade_relative_errors)
-    savefig(bitshift_comparison_plot)
-    savefig(pade_taylor_max_relative_errors_plot)
-    savefig(minimax_comparison_plot)
-    savefig(minimax_max_relative_errors_plot)
+    figures = {
+        taylor_relative_errors: relative_error_tasks(TaylorApproximator),
+        pade_relative_errors: relative_error_tasks(PadeApproximator),
+        bitshift_comparison_plot: bitshift_comparison_tasks(),
+        pade_taylor_max_relative_errors_plot: pade_taylor_max_relative_errors_tasks(),
+        minimax_comparison_plot: minimax_comparison_tasks(),
+        minimax_max_relative_errors_plot: minimax_max_relative_errors_tasks(),
+    }
+    # compute missing data of all figures in parallel before rendering (stale) figures
+    data.load([task for tasks in figures.values() for task in tasks])
+    for figure, tasks in figures.items():
+        savefig(figure, key=data.key(tasks))
 
 
 if __name__ == "__main__":
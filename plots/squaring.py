@@ -0,0 +1,75 @@
+import matplotlib.pyplot as plt
+
+from expapprox.approximator import FixedPointApproximator
+from expapprox.approximators import BitShiftPadeApproximator, BitShiftSquaringPadeApproximator
+from expapprox.utils import float_range
+from plots import data, rc_context, savefig
+
+DECIMALS = 20
+
+
+def grid() -> list[float]:
+    stepsize = 0.01
+    xs = float_range(-5, 5, stepsize)
+    return [x for x in xs if not (-stepsize < x < stepsize)]  # exclude e(0) = 1
+
+
+def approximators() -> list[list[FixedPointApproximator]]:
+    return [
+        # bit-shifted Padé across orders
+        [BitShiftPadeApproximator(DECIMALS, order) for order in range(1, 7)],
+        # bit-shifted argument-halving Padé across number of halvings (per order)
+        *[
+            [BitShiftSquaringPadeApproximator(DECIMALS, order, halvings) for halvings in range(0, 6)]
+            for order in (1, 2, 3)
+        ],
+    ]
+
+
+def squaring_comparison_tasks() -> list[data.Task]:
+    xs = grid()
+    return [
+        task
+        for group in approximators()
+        for approximator in group
+        for task in [
+            data.benchmark(approximator, xs),
+            data.mean_operations(approximator, xs),
+            data.max_bits(approximator, xs),
+        ]
+    ]
+
+
+def squaring_comparison_plot():
+    results = iter(data.load(squaring_comparison_tasks()))
+
+    f, axs = plt.subplots(1, 2, sharex=True, figsize=[7, 3])
+    for ax in axs:
+        ax.set_xscale("log")
+        ax.invert_xaxis()
+        ax.set_xlabel("Maximal relative error")
+
+    # titles and labels
+    axs[0].set_title("Operations per approximation")
+    axs[1].set_title("Required bits (approximation)")
+
+    for i, group in enumerate(approximators()):
+        errs, operations, bits = zip(*[(next(results).max(), next(results), next(results)) for _ in group])
+        style = {"color": "C0", "marker": "o"} if i == 0 else {"color": f"C{i}", "linestyle": "--"}
+        axs[0].plot(errs, operations, label="Bit-shifted Padé" if i == 0 else f"Squaring ({i})", **style)
+        axs[1].plot(errs, bits, **style)
+
+    axs[0].legend(title="Method (order)", loc="upper left")
+
+    return f
+
+
+@rc_context
+def main():
+    tasks = squaring_comparison_tasks()
+    data.load(tasks)
+    savefig(squaring_comparison_plot, key=data.key(tasks))
+
+
+if __name__ == "__main__":
+    main()
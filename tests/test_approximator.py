@@ -1,3 +1,7 @@
+import math
+import subprocess
+import sys
+
 import pytest
 
 from expapprox import errors
@@ -40,3 +44,32 @@ def test_to_float():
 
 def test_benchmark():
     assert MockApproximator(3).benchmark([1.0, 1.5, 2.0, 2.5]) == [0.0, 0.5, 1.0, 1.5]
+
+
+def test_benchmark_fixed():
+    assert MockApproximator(3).benchmark_fixed([1000, 1500, 2000, 2500]) == [0.0, 0.5, 1.0, 1.5]
+
+
+def test_adaptive_benchmark():
+    # reference values without built-in float counterpart are computed by mpmath
+    assert MockApproximator(3).benchmark([1.0, 1.5, 2.0, 2.5], adaptive=True) == [0.0, 0.5, 1.0, 1.5]
+
+
+def test_to_fixed_float_path():
+    # built-in float conversion matches mpmath conversion at double precision
+    import mpmath
+
+    xs = [(-1) ** i * (i * 0.7319) ** 3 / 7 for i in range(1000)] + [1e-300, 2**60 + 1, -(2**70) - 3]
+    for decimals in [0, 3, 10, 16, 25]:
+        approximator = MockApproximator(decimals)
+        for x in xs:
+            assert approximator.to_fixed(x) == math.floor(mpmath.mpf(x) * approximator.identity)
+
+
+def test_import_without_mpmath():
+    # integer evaluation core is importable and usable without importing mpmath
+    statement = (
+        "import sys; from expapprox.approximators import BitShiftPadeApproximator; "
+        "a = BitShiftPadeApproximator(16, 3); a.approx(a.to_fixed(1.5)); assert 'mpmath' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", statement], check=True)
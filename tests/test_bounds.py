@@ -0,0 +1,55 @@
+import math
+
+import pytest
+
+from expapprox import errors
+from expapprox.approximators import (
+    BitShiftPadeApproximator,
+    BitShiftSquaringPadeApproximator,
+    PadeApproximator,
+    TableApproximator,
+    TaylorApproximator,
+)
+from expapprox.approximators.minimax import MinimaxPolynomialApproximator, MinimaxRationalApproximator
+from expapprox.bounds import error_bound
+from expapprox.utils import float_range
+
+DECIMALS = 20
+LOG2HALF = math.log(2) / 2
+
+
+@pytest.mark.parametrize(
+    "approximator, lower, upper",
+    [
+        *[(TaylorApproximator(DECIMALS, order), -LOG2HALF, LOG2HALF) for order in (1, 4, 8)],
+        *[(PadeApproximator(DECIMALS, order), -1, 1) for order in (1, 3, 5)],
+        *[(PadeApproximator(DECIMALS, order, normalized=True), -1, 1) for order in (3, 5)],
+        *[(TaylorApproximator(DECIMALS, order, normalized=True), -LOG2HALF, LOG2HALF) for order in (4, 8)],
+        *[(BitShiftPadeApproximator(DECIMALS, order), -5, 5) for order in (1, 3, 6)],
+        *[(BitShiftSquaringPadeApproximator(DECIMALS, 3, halvings), -5, 5) for halvings in (2, 4)],
+        *[(BitShiftPadeApproximator(DECIMALS, 6, internal_decimals=internal), -5, 5) for internal in (14, 25)],
+        *[(MinimaxPolynomialApproximator(order), -0.3, 0.3) for order in (2, 5)],
+        *[(MinimaxRationalApproximator(order), -0.3, 0.3) for order in (2, 5)],
+        (TableApproximator(DECIMALS, 0, 0.25, 64, 2), 0, 0.25),
+    ],
+)
+def test_bounds(approximator, lower: float, upper: float):
+    # bounds hold and are within two orders of magnitude of sampled errors
+    bound = error_bound(approximator, lower, upper)
+    max_error = max(approximator.benchmark(float_range(lower, upper, (upper - lower) / 200)))
+    assert max_error <= bound <= 100 * max_error
+
+
+def test_unbounded():
+    # Padé approximator beyond critical point and bit-shifted approximator underflowing to zero
+    assert error_bound(PadeApproximator(DECIMALS, 1), -1, 2) == math.inf
+    assert error_bound(BitShiftPadeApproximator(4, 3), -20, 0) >= 1
+
+
+def test_invalid_domains():
+    with pytest.raises(errors.ApproximatorError):
+        error_bound(TaylorApproximator(DECIMALS, 3), 1, -1)
+    with pytest.raises(errors.ApproximatorDomainError):
+        error_bound(MinimaxPolynomialApproximator(3), -1, 1)
+    with pytest.raises(errors.ApproximatorDomainError):
+        error_bound(TableApproximator(DECIMALS, 0, 0.25, 16), 0, 0.5)
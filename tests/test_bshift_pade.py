@@ -5,6 +5,7 @@ import pytest
 
 from expapprox import errors
 from expapprox.approximators import BitShiftPadeApproximator
+from expapprox.approximators.bshift import choose_internal_decimals, fixed_log2
 from expapprox.approximators.pade import PadeApproximator
 from expapprox.utils import float_range
 
@@ -29,6 +30,17 @@ def test_log2_precision():
                 assert approximator.log2 == approximator.to_fixed(mpmath.log(2))
 
 
+def test_fixed_log2():
+    # test that integer computation of log(2) matches high-precision floored reference values
+    for decimals in range(0, 200, 7):
+        with mpmath.workdps(decimals + 20):
+            assert fixed_log2(10**decimals) == int(mpmath.floor(mpmath.log(2) * 10**decimals))
+    # (and binary identities up to thousands of decimals)
+    for bits in [1, 64, 1000, 10000]:
+        with mpmath.workdps(bits // 3 + 20):
+            assert fixed_log2(1 << bits) == int(mpmath.floor(mpmath.log(2) * 2**bits))
+
+
 def test_constants():
     # test that high-order approximator produces expected approximations of known constants
     approximator = BitShiftPadeApproximator(DECIMALS, 10)
@@ -89,3 +101,93 @@ def test_errors():
         errs = BitShiftPadeApproximator(DECIMALS, order).benchmark(xs)
         err_bound = 4 / math.factorial(order + 1)
         assert all(err < err_bound for err in errs)
+
+
+def test_adaptive_errors():
+    # adaptive-precision relative errors match full-precision relative errors, for errors far above and close to the
+    # fixed-point precision
+    xs = [x for x in float_range(-2, 2, 0.05) if abs(x) > 0.01]
+    for approximator in [BitShiftPadeApproximator(24, 2), BitShiftPadeApproximator(24, 10)]:
+        adaptive_errs = approximator.benchmark(xs, adaptive=True)
+        with mpmath.workdps(4 * approximator.decimals):
+            ref_errs = [float(abs(approximator.try_call(x) - mpmath.exp(x)) / mpmath.exp(x)) for x in xs]
+        assert adaptive_errs == [pytest.approx(err, rel=1e-4) for err in ref_errs]
+
+
+def test_underflow():
+    # test that inputs at or below the underflow threshold short-circuit to the fully evaluated approximation (zero)
+    approximator = BitShiftPadeApproximator(DECIMALS, 3)
+    underflow = approximator.underflow
+    assert underflow is not None
+    xs = range(underflow - 100, underflow + 1)
+    assert [approximator.approx(x) for x in xs] == [0] * len(xs)
+    approximator.underflow = None
+    assert [approximator.approx(x) for x in xs] == [0] * len(xs)
+
+
+def test_internal_decimals():
+    # test that outputs at internal decimals chosen for small outputs match exact fixed-point values
+    decimals = 20
+    internal_decimals = choose_internal_decimals(decimals, upper=-20)
+    assert internal_decimals == decimals - 8 + 2
+    approximator = BitShiftPadeApproximator(decimals, 9, internal_decimals=internal_decimals)
+    assert repr(approximator) == (
+        f"BitShiftPadeApproximator(decimals=20, order=9, internal_decimals={internal_decimals})"
+    )
+    assert approximator.remainder_approximator.decimals == internal_decimals
+    xs = float_range(-40, -20, 0.1)
+    assert approximator.max_bits(xs) < BitShiftPadeApproximator(decimals, 9).max_bits(xs)
+    with mpmath.workdps(decimals + 20):
+        for x in xs:
+            x = approximator.to_fixed(x)
+            ref = int(mpmath.floor(mpmath.exp(mpmath.mpf(x) / approximator.identity) * approximator.identity))
+            assert abs(approximator.approx(x) - ref) <= 1
+    # higher internal precision retains relative errors for large outputs (dominated by flooring of inputs and log(2))
+    approximator = BitShiftPadeApproximator(DECIMALS, 10, internal_decimals=DECIMALS + 5)
+    xs = float_range(0, 20, 0.1)
+    errs = approximator.benchmark(xs)
+    assert max(errs) == pytest.approx(max(BitShiftPadeApproximator(DECIMALS, 10).benchmark(xs)), 0.1)
+    assert approximator.underflow == BitShiftPadeApproximator(DECIMALS, 10).underflow
+
+
+def test_choose_internal_decimals():
+    assert choose_internal_decimals(DECIMALS) == DECIMALS
+    assert choose_internal_decimals(DECIMALS, upper=0) == DECIMALS + 2
+    assert choose_internal_decimals(DECIMALS, error=1e-6) == 8
+    # both constraints hold (whichever needs more decimals)
+    assert choose_internal_decimals(DECIMALS, upper=-100, error=1e-6) == 8
+    assert choose_internal_decimals(DECIMALS, upper=0, error=1e-6) == DECIMALS + 2
+    assert choose_internal_decimals(DECIMALS, upper=-100) == 0
+    with pytest.raises(errors.ApproximatorError):
+        choose_internal_decimals(DECIMALS, error=2)
+    with pytest.raises(errors.ApproximatorError):
+        BitShiftPadeApproximator(DECIMALS, 3, internal_decimals=-1)
+
+
+def test_pair():
+    # test that paired approximations match separate approximations of both signs (up to rounding of remainders)
+    for internal_decimals in [None, 14]:
+        approximator = BitShiftPadeApproximator(DECIMALS, 10, internal_decimals=internal_decimals)
+        for x in float_range(-20, 20, 0.05):
+            x = approximator.to_fixed(x)
+            positive, negative = approximator.approx_pair(x)
+            assert positive == approximator.approx(x)
+            assert abs(negative - approximator.approx(-x)) <= max(1, negative >> 30)
+            cosh, sinh = approximator.approx_hyperbolic(x)
+            float_x = float(approximator.to_float(x))
+            assert approximator.to_float(cosh) == pytest.approx(math.cosh(float_x), rel=1e-8, abs=1e-9)
+            assert approximator.to_float(sinh) == pytest.approx(math.sinh(float_x), rel=1e-8, abs=1e-9)
+
+
+def test_first_overflow():
+    # test that a configuration fits the word size of its peak bit width (and overflows below it)
+    approximator = BitShiftPadeApproximator(16, 3)
+    xs = float_range(-30, 30, 0.1)
+    bits = approximator.max_bits(xs)
+    assert approximator.first_overflow(xs, bits) is None
+    x, overflow = approximator.first_overflow(xs, bits - 1)
+    assert approximator.to_fixed(-30) <= x <= approximator.to_fixed(30)
+    assert not -(2 ** (bits - 2)) <= overflow.value < 2 ** (bits - 2)
+    # signed inputs are not representable as unsigned integers
+    x, overflow = approximator.first_overflow(xs, bits, unsigned=True)
+    assert x == approximator.to_fixed(-30) and overflow.name == "operand"
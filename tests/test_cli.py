@@ -0,0 +1,78 @@
+import math
+import struct
+from fractions import Fraction
+
+import pytest
+
+from expapprox import errors
+from expapprox.approximators import BitShiftPadeApproximator, PadeApproximator
+from expapprox.cli import INT64_ERROR, main, parse_spec
+from expapprox.utils import float_range
+
+XS = float_range(-5, 5, 0.01)
+
+
+def test_parse_spec():
+    approximator = parse_spec("BitShiftPadeApproximator(decimals=16, order=3)")
+    assert repr(approximator) == "BitShiftPadeApproximator(decimals=16, order=3)"
+    assert repr(parse_spec(repr(approximator))) == repr(approximator)
+    assert repr(parse_spec("PadeApproximator(10, 2)")) == "PadeApproximator(decimals=10, order=2)"
+    for spec in ["PadeApproximator(10", "Foo(1)", "MinimaxPolynomialApproximator(3)", "PadeApproximator(x, 1)"]:
+        with pytest.raises(errors.ApproximatorError):
+            parse_spec(spec)
+
+
+def test_text(tmp_path):
+    # text inputs are converted exactly to fixed-point numbers and outputs written exactly (NaN if invalid)
+    approximator = PadeApproximator(10, 3)
+    (tmp_path / "in.txt").write_text("".join(f"{x}\n" for x in XS) + "foo\n")
+    main([repr(approximator), str(tmp_path / "in.txt"), "-o", str(tmp_path / "out.txt"), "--chunk-size", "100"])
+    lines = (tmp_path / "out.txt").read_text().splitlines()
+    assert len(lines) == len(XS) + 1
+    for x, line in zip(XS, lines):
+        fixed = math.floor(Fraction(str(x)) * approximator.identity)
+        if approximator.in_domain(fixed):
+            assert Fraction(line) * approximator.identity == approximator.approx(fixed)
+        else:
+            assert line == "nan"
+    assert lines[-1] == "nan"
+
+
+def test_csv(tmp_path):
+    approximator = BitShiftPadeApproximator(10, 3)
+    (tmp_path / "in.csv").write_text("i,x\n" + "".join(f"{i},{x}\n" for i, x in enumerate(XS)))
+    main([repr(approximator), str(tmp_path / "in.csv"), "-o", str(tmp_path / "out.csv"), "--input-format", "csv"])
+    # first column by default (with header row as invalid input)
+    assert (tmp_path / "out.csv").read_text().splitlines()[:2] == ["i,nan", "0,1.0000000000"]
+    main(
+        [repr(approximator), str(tmp_path / "in.csv"), "-o", str(tmp_path / "out.csv")]
+        + ["--input-format", "csv", "--column", "x"]
+    )
+    rows = [line.split(",") for line in (tmp_path / "out.csv").read_text().splitlines()]
+    assert [float(x) for x, _ in rows] == XS
+    assert [float(value) for _, value in rows] == [pytest.approx(float(approximator(x))) for x in XS]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_binary(tmp_path, workers: int):
+    # binary fixed-point inputs (memory-mapped) match direct evaluation
+    approximator = PadeApproximator(10, 3)
+    xs = [approximator.to_fixed(x) for x in XS]
+    (tmp_path / "in.bin").write_bytes(struct.pack(f"<{len(xs)}q", *xs))
+    main(
+        [repr(approximator), str(tmp_path / "in.bin"), "-o", str(tmp_path / "out.bin"), "--input-format", "int64"]
+        + ["--chunk-size", "64", "--workers", str(workers)]
+    )
+    values = struct.unpack(f"<{len(xs)}q", (tmp_path / "out.bin").read_bytes())
+    for x, value in zip(xs, values):
+        expected = approximator.try_approx(x)
+        assert value == (INT64_ERROR if math.isnan(expected) else approximator.approx(x))
+    # float64 outputs
+    main(
+        [repr(approximator), str(tmp_path / "in.bin"), "-o", str(tmp_path / "out.bin")]
+        + ["--input-format", "int64", "--output-format", "float64"]
+    )
+    values = struct.unpack(f"<{len(xs)}d", (tmp_path / "out.bin").read_bytes())
+    assert [value for value in values if not math.isnan(value)] == [
+        approximator.approx(x) / approximator.identity for x in xs if approximator.in_domain(x)
+    ]
@@ -0,0 +1,36 @@
+import math
+
+import pytest
+
+from expapprox import errors
+from expapprox.approximators import BitShiftPadeApproximator, PadeApproximator, TaylorApproximator
+from expapprox.approximators.minimax import MinimaxPolynomialApproximator
+from expapprox.compare import compare
+from expapprox.utils import float_range
+
+DECIMALS = 20
+XS = [x for x in float_range(-0.3, 0.3, 0.01) if abs(x) > 0.005]
+APPROXIMATORS = [
+    TaylorApproximator(DECIMALS, 3),
+    PadeApproximator(DECIMALS, 3),
+    BitShiftPadeApproximator(DECIMALS - 4, 3),
+    MinimaxPolynomialApproximator(3),
+]
+
+
+def test_invalid_comparison():
+    with pytest.raises(errors.ApproximatorError):
+        compare([], XS)
+    with pytest.raises(errors.ApproximatorError):
+        compare([PadeApproximator(DECIMALS, 3), PadeApproximator(DECIMALS, 3)], XS)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_compare(workers: int):
+    # columns of shared reference values match individual benchmarks
+    table = compare(APPROXIMATORS, XS, workers=workers)
+    assert list(table) == ["x", "reference", *(repr(approximator) for approximator in APPROXIMATORS)]
+    assert table["x"] == XS
+    assert table["reference"] == [pytest.approx(math.exp(x)) for x in XS]
+    for approximator in APPROXIMATORS:
+        assert table[repr(approximator)] == [pytest.approx(err, rel=1e-6) for err in approximator.benchmark(XS)]
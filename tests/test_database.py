@@ -0,0 +1,107 @@
+import pytest
+
+from expapprox import errors
+from expapprox.approximators import PadeApproximator, TaylorApproximator
+from expapprox.database import ResultDatabase, grid_hash
+from expapprox.utils import float_range
+
+XS = float_range(0, 0.25, 0.01)
+
+
+def test_invalid_sweep():
+    with ResultDatabase() as database:
+        with pytest.raises(errors.ApproximatorError):
+            database.sweep(PadeApproximator(16, 3), [])
+        with pytest.raises(errors.ApproximatorError):
+            database.sweep(PadeApproximator(16, 3), XS, chunk_size=0)
+
+
+def test_grid_hash():
+    assert grid_hash(XS) == grid_hash(list(XS))
+    assert grid_hash(XS) != grid_hash(XS[::-1])
+    assert grid_hash([0.0]) != grid_hash([-0.0])
+
+
+def test_sweep():
+    # test that summaries agree with benchmarks and max bits of approximators
+    approximator = PadeApproximator(16, 3)
+    with ResultDatabase() as database:
+        assert database.summary(approximator, XS) is None
+        summary = database.sweep(approximator, XS, bits=True, chunk_size=7)
+        errs = approximator.benchmark(XS)
+        assert summary.method == "PadeApproximator" and summary.decimals == 16 and summary.order == 3
+        assert (summary.lower, summary.upper, summary.size, summary.failures) == (0, 0.25, len(XS), 0)
+        assert summary.max_error == max(errs)
+        assert summary.mean_error == pytest.approx(sum(errs) / len(errs))
+        assert summary.max_bits == approximator.max_bits(XS)
+        assert database.summary(repr(approximator), XS) == summary
+        assert [x for x, _, _ in database.series(approximator, 0, 0.1)] == [x for x in XS if x <= 0.1]
+
+
+def test_skip_stored():
+    # test that stored points are not recomputed (even for other grids including them)
+    approximator = TaylorApproximator(16, 4)
+    with ResultDatabase() as database:
+        database.sweep(approximator, XS)
+        database.connection.execute("UPDATE series SET error = 1 WHERE x = 0.1")
+        assert database.sweep(approximator, XS).max_error == 1
+        extended = float_range(0, 0.5, 0.01)
+        summary = database.sweep(approximator, extended)
+        assert summary.max_error == 1 and summary.size == len(extended)
+        assert len(database.series(approximator, 0, 0.5)) == len(extended)
+        # points without max bits are recomputed if requested
+        summary = database.sweep(approximator, XS, bits=True)
+        assert summary.max_error == max(approximator.benchmark(XS))
+        assert summary.max_bits == approximator.max_bits(XS)
+
+
+def test_failures():
+    # test that failed approximations are counted (beyond the critical point of the Padé approximator)
+    approximator = PadeApproximator(16, 1)
+    xs = float_range(0, 4, 0.5)
+    with ResultDatabase() as database:
+        summary = database.sweep(approximator, xs, bits=True)
+        assert summary.failures == sum(x >= 2 for x in xs)
+        assert summary.max_error == max(approximator.benchmark(xs[:4]))
+        assert database.smallest_bits(1, 0, 4) is None
+        assert database.smallest_bits(1, 0, 1.5) is not None
+
+
+def test_smallest_bits():
+    approximators = [PadeApproximator(16, order) for order in range(2, 6)]
+    with ResultDatabase() as database:
+        for approximator in approximators:
+            database.sweep(approximator, XS, bits=True)
+        # untracked bits are excluded
+        database.sweep(TaylorApproximator(16, 9), XS)
+        candidates = [a for a in approximators if max(a.benchmark(XS)) < 1e-12]
+        expected = min(candidates, key=lambda a: (a.max_bits(XS), max(a.benchmark(XS))))
+        assert database.smallest_bits(1e-12, 0, 0.25) == (
+            repr(expected),
+            expected.max_bits(XS),
+            max(expected.benchmark(XS)),
+        )
+        assert database.smallest_bits(1e-30, 0, 0.25) is None
+        assert database.smallest_bits(1e-12, 1, 2) is None
+        assert len(database.summaries()) == 5
+        assert [s.order for s in database.summaries(method="PadeApproximator")] == [2, 3, 4, 5]
+        assert [s.spec for s in database.summaries(order=9, decimals=16)] == [repr(TaylorApproximator(16, 9))]
+
+
+def test_smallest_bits_coverage():
+    # test that specs without sweeps covering the interval are not ranked by their few stored inputs
+    with ResultDatabase() as database:
+        database.sweep(PadeApproximator(16, 7), XS, bits=True)
+        database.sweep(PadeApproximator(16, 4), [0.0], bits=True)
+        assert database.smallest_bits(1e-14, 0, 0.25)[0] == repr(PadeApproximator(16, 7))
+        assert database.smallest_bits(1e-14, 0, 0)[0] == repr(PadeApproximator(16, 4))
+
+
+def test_persistence(tmp_path):
+    path = tmp_path / "results.sqlite"
+    approximator = PadeApproximator(16, 3)
+    with ResultDatabase(path) as database:
+        summary = database.sweep(approximator, XS)
+    with ResultDatabase(path) as database:
+        assert database.summary(approximator, XS) == summary
+        assert len(database.series(approximator, 0, 0.25)) == len(XS)
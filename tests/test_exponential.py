@@ -1,5 +1,6 @@
 import math
 
+import mpmath
 import pytest
 
 from expapprox.approximator import ExponentialApproximator
@@ -24,3 +25,13 @@ def test_ref():
         assert approximator.ref(math.log(abs(float_x))) == pytest.approx(abs(float_x))
         # reference (mpmath) is close to built-in math exponential
         assert approximator.ref(float_x) == pytest.approx(math.exp(float_x))
+
+
+def test_ref_float():
+    approximator = MockApproximator()
+
+    for float_x in [-1.2, -0.2, 0.005, -0.231, -5.4, 0.12, 0.93, 8.2]:
+        assert approximator.ref_float(float_x) == math.exp(float_x)
+    # overflowing and non-built-in numbers are unavailable
+    assert approximator.ref_float(1000.0) is None
+    assert approximator.ref_float(mpmath.mpf(1)) is None
@@ -0,0 +1,50 @@
+import mpmath
+import pytest
+
+from expapprox import errors
+from expapprox.approximator import relative_error
+from expapprox.approximators import BitShiftPadeApproximator
+from expapprox.incremental import IncrementalExponential
+
+DECIMALS = 16
+ORDER = 6
+# conservative relative error bound for order-6 bit-shifted Padé at 16 decimals
+ERROR = 1e-14
+
+
+@pytest.fixture
+def approximator():
+    return BitShiftPadeApproximator(DECIMALS, ORDER)
+
+
+def test_invalid_budget(approximator: BitShiftPadeApproximator):
+    with pytest.raises(errors.ApproximatorError):
+        IncrementalExponential(approximator, ERROR, ERROR / 2)
+    with pytest.raises(errors.ApproximatorError):
+        IncrementalExponential(approximator, ERROR, ERROR).advance(1)
+
+
+def test_bound(approximator: BitShiftPadeApproximator):
+    # accumulated error bound holds for a monotone stream of inputs
+    evaluator = IncrementalExponential(approximator, ERROR, 1e-12)
+    step = approximator.to_fixed(0.001)
+    xs = [i * step for i in range(1000)]
+    with mpmath.workdps(DECIMALS + 10):
+        for x, value in zip(xs, evaluator.stream(xs)):
+            assert evaluator.x == x
+            assert evaluator.bound <= evaluator.budget
+            assert relative_error(approximator.to_float(value), mpmath.exp(mpmath.mpf(x) / 10**DECIMALS)) <= (
+                evaluator.bound
+            )
+    # only a fraction of inputs required full approximations
+    assert 1 < evaluator.resyncs < len(xs) // 10
+    # single step is cached
+    assert len(evaluator.steps.cache) == 1
+
+
+def test_resync(approximator: BitShiftPadeApproximator):
+    # budget equal to approximator error bound forces a full approximation for every input
+    evaluator = IncrementalExponential(approximator, ERROR, ERROR)
+    xs = list(range(0, 10**DECIMALS, 10**DECIMALS // 100))
+    assert list(evaluator.stream(xs)) == [approximator.approx(x) for x in xs]
+    assert evaluator.resyncs == len(xs)
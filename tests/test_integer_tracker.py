@@ -1,7 +1,7 @@
 import pytest
 
 from expapprox import errors
-from expapprox.tracker import IntegerTracker
+from expapprox.tracker import FixedWidthTracker, IntegerTracker, Overflow
 
 
 @pytest.fixture
@@ -87,3 +87,51 @@ def test_propagation(tracker: IntegerTracker):
         # check that tracker aligns with "manually" computed intermediary values
         assert tracker.min_int == running_min
         assert tracker.max_int == running_max
+
+
+def test_operations(tracker: IntegerTracker):
+    x = tracker.int(3)
+    assert tracker.operations == 0
+    y = (x + 1) * 2 // 3
+    assert tracker.operations == 3
+    # comparisons are not counted
+    y < x
+    assert tracker.operations == 3
+
+
+def test_fixed_width():
+    # test that results exceeding the word size raise (reporting the first overflowing operation)
+    with FixedWidthTracker(8) as tracker:
+        x = tracker.int(100)
+        x -= 100
+        x -= 100
+        assert x == -100 and tracker.bits == 8
+        with pytest.raises(errors.IntegerOverflowError):
+            x - 29
+        assert tracker.first_overflow == Overflow(3, "sub", (-100, 29), -129)
+        assert tracker.overflows == 1
+    # operands must be representable
+    with FixedWidthTracker(8, unsigned=True) as tracker:
+        with pytest.raises(errors.IntegerOverflowError):
+            tracker.int(-1)
+        assert tracker.first_overflow == Overflow(0, "operand", (-1,), -1)
+    with pytest.raises(errors.IntegerTrackerError):
+        FixedWidthTracker(0)
+
+
+def test_fixed_width_wrap():
+    # test that results wrap around like fixed-width integers (in two's complement if signed)
+    with FixedWidthTracker(8, wrap=True) as tracker:
+        x = tracker.int(100)
+        y = x + 100
+        assert y == -56
+        assert 3 * y == 88
+        assert tracker.first_overflow == Overflow(1, "add", (100, 100), 200)
+        assert tracker.overflows == 2
+    with FixedWidthTracker(8, unsigned=True, wrap=True) as tracker:
+        x = tracker.int(3)
+        assert x - 5 == 254
+        # (300 wraps around to 44)
+        assert divmod(x * 100, 7) == (6, 2)
+        assert tracker.overflows == 2
+        assert tracker.bits == 8
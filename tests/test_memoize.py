@@ -0,0 +1,77 @@
+import pytest
+
+from expapprox import errors
+from expapprox.approximators import BitShiftPadeApproximator
+from expapprox.memoize import MemoizedApproximator
+from expapprox.tracker import IntegerTracker
+from expapprox.utils import float_range
+
+DECIMALS = 10
+XS = float_range(-2, 2, 0.1)
+
+
+def test_invalid_limits():
+    with pytest.raises(errors.ApproximatorError):
+        MemoizedApproximator(BitShiftPadeApproximator(DECIMALS, 3), maxsize=0)
+    with pytest.raises(errors.ApproximatorError):
+        MemoizedApproximator(BitShiftPadeApproximator(DECIMALS, 3), maxbytes=0)
+
+
+def test_results():
+    # memoized results match wrapped approximator on both misses and hits
+    approximator = BitShiftPadeApproximator(DECIMALS, 3)
+    memoized = MemoizedApproximator(approximator)
+    for _ in range(2):
+        for x in XS:
+            assert memoized(x) == approximator(x)
+    assert memoized.misses == len(XS)
+    assert memoized.hits == len(XS)
+    assert memoized.benchmark(XS) == approximator.benchmark(XS)
+
+
+def test_lru_eviction():
+    memoized = MemoizedApproximator(BitShiftPadeApproximator(DECIMALS, 3), maxsize=2)
+    memoized.approx(1)
+    memoized.approx(2)
+    # refresh 1 s.t. 2 is least-recently used
+    memoized.approx(1)
+    memoized.approx(3)
+    assert list(memoized.cache) == [1, 3]
+    assert memoized.evictions == 1
+    assert (memoized.hits, memoized.misses) == (1, 3)
+
+
+def test_memory_limit():
+    memoized = MemoizedApproximator(BitShiftPadeApproximator(DECIMALS, 3), maxsize=None, maxbytes=200)
+    for x in range(100):
+        memoized.approx(x)
+    assert 0 < memoized.nbytes <= 200
+    assert memoized.evictions == 100 - len(memoized.cache)
+
+
+def test_warm():
+    memoized = MemoizedApproximator(BitShiftPadeApproximator(DECIMALS, 3))
+    memoized.warm(XS)
+    assert (memoized.hits, memoized.misses) == (0, 0)
+    for x in XS:
+        memoized(x)
+    assert memoized.hit_rate == 1.0
+    # int inputs are warmed as when called (and fixed-point inputs by warm_fixed)
+    memoized = MemoizedApproximator(BitShiftPadeApproximator(DECIMALS, 3))
+    memoized.warm([1, -2])
+    memoized.warm_fixed([7])
+    memoized(1)
+    memoized(-2)
+    memoized.approx(7)
+    assert (memoized.hits, memoized.misses) == (3, 0)
+
+
+def test_tracker():
+    # tracked integers bypass the cache and register all intermediary values
+    approximator = BitShiftPadeApproximator(DECIMALS, 3)
+    memoized = MemoizedApproximator(approximator)
+    memoized.warm(XS)
+    assert memoized.max_bits(XS) == approximator.max_bits(XS)
+    with IntegerTracker() as tracker:
+        memoized.approx(tracker.int(approximator.to_fixed(1.0)))
+        assert tracker.max_int is not None and tracker.max_int > approximator.to_fixed(1.0)
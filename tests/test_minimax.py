@@ -1,7 +1,14 @@
+import json
 import math
 
+import mpmath
+import pytest
+
+from expapprox import errors
 from expapprox.approximators import PadeApproximator, TaylorApproximator
-from expapprox.approximators.minimax import MinimaxPolynomialApproximator, MinimaxRationalApproximator
+from expapprox.approximators.minimax import MinimaxPolynomialApproximator, MinimaxRationalApproximator, remez
+from expapprox.approximators.minimax.polynomial import MINIMAX_POLY
+from expapprox.approximators.minimax.rational import MINIMAX_RATIONAL
 from expapprox.utils import float_range
 
 DECIMALS = 10
@@ -22,3 +29,107 @@ def test_rational():
         minimax_rel_err = MinimaxRationalApproximator(order).benchmark(XS)
         pade_rel_err = PadeApproximator(DECIMALS, order).benchmark(XS)
         assert max(minimax_rel_err) < max(pade_rel_err)
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    # isolate cached coefficients
+    monkeypatch.setenv(remez.CACHE_DIR_VARIABLE, str(tmp_path))
+    return tmp_path
+
+
+def max_error(p_coefficients, q_coefficients, interval) -> mpmath.mpf:
+    with mpmath.workdps(50):
+        p_coefficients = [mpmath.mpf(c) for c in p_coefficients]
+        q_coefficients = [mpmath.mpf(c) for c in q_coefficients]
+        lower, upper = (mpmath.mpf(x) for x in interval)
+        xs = [lower + (upper - lower) * i / 1000 for i in range(1001)]
+        return max(
+            abs(mpmath.exp(x) - mpmath.polyval(p_coefficients, x) / mpmath.polyval(q_coefficients, x)) for x in xs
+        )
+
+
+def test_remez_polynomial():
+    # test that generated coefficients agree with the tabulated coefficients (up to their double precision)
+    for order, coefficients in MINIMAX_POLY.items():
+        generated = remez.minimax_polynomial(order, digits=20, cache=False)
+        assert len(generated) == order + 1
+        assert all(abs(float(c) - float(g)) < 1e-11 for c, g in zip(coefficients, generated))
+
+
+def test_remez_rational():
+    # test that generated coefficients are at least as accurate as the tabulated coefficients (which are limited by
+    # double precision for higher orders)
+    interval = (-math.log(2) / 2, math.log(2) / 2)
+    for order, (p_coefficients, q_coefficients) in MINIMAX_RATIONAL.items():
+        p_generated, q_generated = remez.minimax_rational(order, digits=20, cache=False)
+        assert len(p_generated) == len(q_generated) == order + 1 and p_generated[0] == "1.0"
+        error = max_error(p_coefficients, q_coefficients, interval)
+        assert max_error(p_generated, q_generated, interval) < error * (1 + 1e-6)
+
+
+def test_remez_equioscillation():
+    # test that the error equioscillates on (at least) N + 2 or 2N + 2 points with the maximal magnitude (also on wide
+    # intervals and intervals on which the exponential function is large)
+    for interval, alternations, p_coefficients, q_coefficients in [
+        (("-0.01", "0.03"), 9, remez.minimax_polynomial(8, ("-0.01", "0.03"), digits=40), ["1"]),
+        (("-0.01", "0.03"), 9, *remez.minimax_rational(4, ("-0.01", "0.03"), digits=40)),
+        ((100, 101), 3, remez.minimax_polynomial(2, (100, 101)), ["1"]),
+        ((-2, 2), 5, *remez.minimax_rational(2, (-2, 2))),
+        ((-5, 5), 5, *remez.minimax_rational(2, (-5, 5))),
+        ((0, 10), 3, *remez.minimax_rational(1, (0, 10))),
+    ]:
+        with mpmath.workdps(60):
+            lower, upper = (mpmath.mpf(x) for x in interval)
+            xs = [lower + (upper - lower) * i / 2000 for i in range(2001)]
+            p, q = [mpmath.mpf(c) for c in p_coefficients], [mpmath.mpf(c) for c in q_coefficients]
+            errs = [mpmath.exp(x) - mpmath.polyval(p, x) / mpmath.polyval(q, x) for x in xs]
+        level = max(abs(err) for err in errs)
+        # signs of errors near the maximal magnitude alternate
+        signs = [mpmath.sign(err) for err in errs if abs(err) > level * (1 - 1e-3)]
+        assert sum(a != b for a, b in zip(signs, signs[1:])) >= alternations
+
+
+def test_invalid_remez():
+    with pytest.raises(errors.ApproximatorError):
+        remez.minimax_polynomial(0)
+    with pytest.raises(errors.ApproximatorError):
+        remez.minimax_rational(2, digits=0)
+    with pytest.raises(errors.ApproximatorError):
+        remez.minimax_rational(2, interval=(0.1, -0.1))
+    # singular systems (of repeated reference points)
+    with pytest.raises(errors.ApproximatorError):
+        remez._solve("polynomial", 2, [mpmath.mpf(0)] * 4)
+    with pytest.raises(errors.ApproximatorError):
+        remez._solve("rational", 1, [mpmath.mpf(0)] * 4)
+
+
+def test_cache(cache_dir):
+    # test that coefficients are cached on disk per configuration
+    coefficients = remez.minimax_polynomial(3, interval=(-0.1, 0.1), digits=20)
+    (path,) = cache_dir.iterdir()
+    assert json.loads(path.read_text())["coefficients"] == list(coefficients)
+    # cached coefficients are loaded (rather than recomputed)
+    record = json.loads(path.read_text())
+    record["coefficients"][0] = "0.5"
+    path.write_text(json.dumps(record))
+    assert remez.minimax_polynomial(3, interval=(-0.1, 0.1), digits=20)[0] == "0.5"
+    assert remez.minimax_polynomial(3, interval=(-0.1, 0.1), digits=20, cache=False) == coefficients
+    # other configurations are cached separately
+    remez.minimax_polynomial(3, interval=(-0.1, 0.1), digits=21)
+    remez.minimax_rational(3, interval=(-0.1, 0.1), digits=20)
+    assert len(list(cache_dir.iterdir())) == 3
+
+
+def test_generated_approximators():
+    # test that approximators of untabulated orders and intervals use generated coefficients
+    polynomial = MinimaxPolynomialApproximator(7)
+    rational = MinimaxRationalApproximator(7)
+    assert repr(polynomial) == "MinimaxPolynomialApproximator(order=7)"
+    assert max(polynomial.benchmark(XS)) < max(MinimaxPolynomialApproximator(6).benchmark(XS))
+    assert max(rational.benchmark(XS)) < 1e-15
+    # coefficients for reduced intervals
+    xs = float_range(-0.01, 0.01, 0.001)
+    reduced = MinimaxPolynomialApproximator(3, interval=(-0.01, 0.01), digits=20)
+    assert repr(reduced) == "MinimaxPolynomialApproximator(order=3, interval=(-0.01, 0.01), digits=20)"
+    assert max(reduced.benchmark(xs)) < max(MinimaxPolynomialApproximator(3).benchmark(xs))
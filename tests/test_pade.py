@@ -1,9 +1,11 @@
 import math
 
+import mpmath
 import pytest
 
 from expapprox import errors
 from expapprox.approximators import PadeApproximator
+from expapprox.approximators.pade import CRITICAL_POINT_SCAN, _smallest_non_positive
 from expapprox.utils import float_range
 
 DECIMALS = 10
@@ -75,3 +77,114 @@ def test_errors():
         errs = PadeApproximator(DECIMALS, order).benchmark(xs)
         err_bound = 4 / math.factorial(order + 1)
         assert all(err < err_bound for err in errs)
+
+
+def test_precomputed_critical_points():
+    # test that evaluation fails at the precomputed critical point (and masks inputs without raising)
+    for order in [1, 3, 5, 9]:
+        approximator = PadeApproximator(CP_DECIMALS, order)
+        cp = approximator.critical_point
+        assert approximator.domain() == (None, cp - 1)
+        assert approximator.in_domain(cp - 1) and not approximator.in_domain(cp)
+        even_accumulator, odd_accumulator = approximator._accumulators(cp)
+        assert even_accumulator <= odd_accumulator
+        assert math.isnan(approximator.try_approx(cp))
+    assert PadeApproximator(CP_DECIMALS, 1).critical_point == PadeApproximator(CP_DECIMALS, 1).to_fixed(2)
+    assert PadeApproximator(CP_DECIMALS, 3).critical_point == PadeApproximator(CP_DECIMALS, 3).to_fixed(4.6444)
+    # denominators of even order have no real roots (but may be rounded to zero at low decimals)
+    assert PadeApproximator(CP_DECIMALS, 2).domain() == (None, None)
+    assert PadeApproximator(1, 8).critical_point == 103
+    # high orders end the domain after the scanned inputs (without a failure among them)
+    approximator = PadeApproximator(CP_DECIMALS, 15)
+    for x in range(approximator.critical_point - CRITICAL_POINT_SCAN, approximator.critical_point):
+        approximator.approx(x)
+
+
+@pytest.mark.parametrize(
+    "decimals,order,normalized", [(8, 9, False), (2, 9, False), (8, 7, False), (8, 7, True), (5, 5, False)]
+)
+def test_exact_critical_points(decimals, order, normalized):
+    # test that evaluation succeeds for all inputs below the critical point (in spite of rounding errors)
+    approximator = PadeApproximator(decimals, order, normalized=normalized)
+    cp = approximator.critical_point
+    for x in range(max(0, cp - 20000), cp):
+        approximator.approx(x)
+    with pytest.raises(errors.ApproximatorDomainError):
+        approximator._approx(cp, approximator.identity, approximator.constant, approximator.coefficients)
+
+
+def test_smallest_non_positive():
+    # coefficients in increasing order of powers
+    assert _smallest_non_positive([35, -12, 1]) == 5
+    assert _smallest_non_positive([36, -12, 1]) == 6
+    assert _smallest_non_positive([-1, 1]) == 0
+    assert _smallest_non_positive([3, -1]) == 3
+    assert _smallest_non_positive([1, 0, 1]) is None
+    assert _smallest_non_positive([10**30 + 1, -(2 * 10**15), 1]) is None
+
+
+def test_invalid_backend():
+    with pytest.raises(errors.ApproximatorError):
+        PadeApproximator(DECIMALS, 3, backend="foo")
+
+
+def test_backend():
+    # test that approximations on the gmpy2 backend are identical built-in ints
+    pytest.importorskip("gmpy2")
+    for decimals in [DECIMALS, 100]:
+        approximator = PadeApproximator(decimals, 7)
+        gmpy2_approximator = PadeApproximator(decimals, 7, backend="gmpy2")
+        assert repr(gmpy2_approximator) == f"PadeApproximator(decimals={decimals}, order=7, backend='gmpy2')"
+        for x in float_range(-9, 9, 0.01):
+            x = approximator.to_fixed(x)
+            if approximator.in_domain(x):
+                value = gmpy2_approximator.approx(x)
+                assert type(value) is int and value == approximator.approx(x)
+        assert gmpy2_approximator.max_bits([1.0]) == approximator.max_bits([1.0])
+
+
+def test_normalized():
+    # test that normalized coefficients reduce the bit width of intermediaries at comparable errors
+    xs = float_range(-0.35, 0.35, 0.01)
+    for order in [2, 3, 5, 7]:
+        approximator = PadeApproximator(16, order)
+        normalized_approximator = PadeApproximator(16, order, normalized=True)
+        assert repr(normalized_approximator) == f"PadeApproximator(decimals=16, order={order}, normalized=True)"
+        assert normalized_approximator.max_bits(xs) < approximator.max_bits(xs)
+        errs = approximator.benchmark(xs)
+        normalized_errs = normalized_approximator.benchmark(xs)
+        assert all(normalized_err < 2 * err + 1e-15 for err, normalized_err in zip(errs, normalized_errs))
+    # coefficients vanishing at low decimals fail
+    with pytest.raises(errors.ApproximatorError):
+        PadeApproximator(CP_DECIMALS, 5, normalized=True)
+
+
+def test_normalized_critical_points():
+    # test that evaluation fails at the precomputed critical point for normalized coefficients
+    for order in [1, 3, 5, 7]:
+        approximator = PadeApproximator(DECIMALS, order, normalized=True)
+        cp = approximator.critical_point
+        even_accumulator, odd_accumulator = approximator._accumulators(cp)
+        assert even_accumulator <= odd_accumulator
+        assert approximator.in_domain(cp - 1) and not approximator.in_domain(cp)
+
+
+def test_pair():
+    # test that paired approximations match separate approximations of both signs
+    approximator = PadeApproximator(16, 7)
+    with mpmath.workdps(40):
+        for x in float_range(-0.35, 0.35, 0.01):
+            x = approximator.to_fixed(x)
+            assert approximator.approx_pair(x) == (approximator.approx(x), approximator.approx(-x))
+            # hyperbolic functions are exact up to flooring (well within the truncation error)
+            cosh, sinh = approximator.approx_hyperbolic(x)
+            assert cosh == int(mpmath.floor(mpmath.cosh(mpmath.mpf(x) / approximator.identity) * approximator.identity))
+            assert sinh == int(mpmath.floor(mpmath.sinh(mpmath.mpf(x) / approximator.identity) * approximator.identity))
+    # either sign at or above the critical point fails
+    approximator = PadeApproximator(CP_DECIMALS, 3)
+    for x in [approximator.critical_point, -approximator.critical_point]:
+        with pytest.raises(errors.ApproximatorDomainError):
+            approximator.approx_pair(x)
+        with pytest.raises(errors.ApproximatorDomainError):
+            approximator.approx_hyperbolic(x)
+    approximator.approx_pair(1 - approximator.critical_point)
@@ -0,0 +1,64 @@
+import pytest
+
+from expapprox import errors
+from expapprox.approximator import FixedPointExponentialApproximator
+from expapprox.approximators import PadeApproximator
+from expapprox.profiler import Profiler
+from expapprox.utils import float_range
+
+DECIMALS = 10
+XS = float_range(-6, 6, 0.01)
+
+
+class NegativeDomainApproximator(FixedPointExponentialApproximator):
+    def approx(self, x: int) -> int:
+        if x < 0:
+            raise errors.ApproximatorDomainError()
+        return x
+
+
+def test_profiler():
+    # stages of benchmarks are counted and timed without changing results
+    approximator = PadeApproximator(DECIMALS, 3)
+    errs = approximator.benchmark(XS)
+    with Profiler(approximator) as profiler:
+        assert approximator.benchmark(XS) == errs
+    assert approximator.__class__ is PadeApproximator
+    in_domain = sum(approximator.in_domain(approximator.to_fixed(x)) for x in XS)
+    assert profiler.stages["to_fixed"].calls == len(XS)
+    assert profiler.stages["ref"].calls == len(XS)
+    assert profiler.stages["relative_error"].calls == len(XS)
+    assert profiler.stages["approx"].calls == profiler.stages["to_float"].calls == in_domain
+    assert profiler.masked == len(XS) - in_domain > 0
+    assert profiler.exceptions == 0
+    assert 0 < sum(statistics.time for statistics in profiler.stages.values()) <= profiler.time
+    # calls outside of the context are not profiled
+    approximator(1.0)
+    assert profiler.stages["approx"].calls == in_domain
+
+
+def test_exceptions():
+    # exceptions swallowed by try_call are counted by type
+    approximator = NegativeDomainApproximator(DECIMALS)
+    with Profiler(approximator) as profiler:
+        approximator.benchmark(XS)
+    negatives = sum(x < 0 for x in XS)
+    assert profiler.stages["approx"].exceptions == {"ApproximatorDomainError": negatives}
+    rows = {row["stage"]: row for row in profiler.export()}
+    assert rows["approx"]["exceptions"] == rows["approx"]["exceptions.ApproximatorDomainError"] == negatives
+    assert rows["approx"]["approximator"] == repr(approximator)
+    assert "ApproximatorDomainError" in profiler.report()
+
+
+def test_reentry():
+    approximator = PadeApproximator(DECIMALS, 3)
+    profiler = Profiler(approximator)
+    with profiler:
+        with pytest.raises(errors.ApproximatorError):
+            profiler.__enter__()
+    # profilers accumulate over repeated contexts
+    with profiler:
+        approximator(1.0)
+    with profiler:
+        approximator(1.0)
+    assert profiler.stages["approx"].calls == 2
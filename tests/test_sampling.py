@@ -0,0 +1,78 @@
+import statistics
+
+import pytest
+
+from expapprox import errors
+from expapprox.approximators import PadeApproximator
+from expapprox.approximators.minimax import MinimaxPolynomialApproximator
+from expapprox.sampling import MIN_TAIL_SAMPLES, ErrorSampler, _t_quantile
+from expapprox.utils import float_range
+
+APPROXIMATOR = PadeApproximator(12, 3)
+
+
+def test_invalid_sampler():
+    for kwargs in [
+        dict(lower=1, upper=-1),
+        dict(quantiles=[1.5]),
+        dict(quantiles=[0.5, 1.0]),
+        dict(quantiles=[0.0]),
+        dict(replications=1),
+        dict(batch=0),
+        dict(confidence=1.0),
+    ]:
+        with pytest.raises(errors.ApproximatorError):
+            ErrorSampler(APPROXIMATOR, **{"lower": -0.3, "upper": 0.3, **kwargs})
+    # estimates require samples
+    with pytest.raises(errors.ApproximatorError):
+        ErrorSampler(APPROXIMATOR, -0.3, 0.3).estimates()
+
+
+def test_points():
+    sampler = ErrorSampler(APPROXIMATOR, -0.3, 0.3)
+    lower, upper = APPROXIMATOR.to_fixed(-0.3), APPROXIMATOR.to_fixed(0.3)
+    width = upper - lower + 1
+    # first 2^k points of the (unshifted or shifted) sequence are evenly spaced over the fixed-point inputs
+    for shift in [0, *sampler.shifts]:
+        xs = sorted(sampler.points(0, 64, shift))
+        assert all(lower <= x <= upper for x in xs)
+        assert {b - a for a, b in zip(xs, xs[1:])} <= {width // 64, width // 64 + 1}
+    # inputs of other approximators are floats
+    xs = ErrorSampler(MinimaxPolynomialApproximator(3), -0.3, 0.3).points(0, 4)
+    assert xs == pytest.approx([-0.3, 0.0, -0.15, 0.15])
+
+
+def test_t_quantile():
+    assert _t_quantile(0.975, 1) == pytest.approx(12.7062, rel=1e-5)
+    assert _t_quantile(0.975, 7) == pytest.approx(2.3646, rel=1e-4)
+    assert _t_quantile(0.975, 10**6) == pytest.approx(statistics.NormalDist().inv_cdf(0.975), rel=1e-5)
+
+
+def test_reproducible():
+    # test that estimates are identical for identical seeds (and differ otherwise)
+    estimates = ErrorSampler(APPROXIMATOR, -0.3, 0.3, seed=1).run(max_samples=128)
+    assert ErrorSampler(APPROXIMATOR, -0.3, 0.3, seed=1).run(max_samples=128) == estimates
+    assert ErrorSampler(APPROXIMATOR, -0.3, 0.3, seed=2).run(max_samples=128) != estimates
+
+
+def test_estimates():
+    # test that converged estimates agree with statistics of a dense grid of inputs
+    sampler = ErrorSampler(APPROXIMATOR, -0.3, 0.3, quantiles=[0.5, 0.95])
+    estimates = sampler.run(rtol=0.02)
+    assert sampler.samples < 1 << 16 and sampler.failures == 0
+    assert sampler.samples * 0.05 >= MIN_TAIL_SAMPLES
+    assert list(estimates) == ["mean", "q0.5", "q0.95"]
+    errs = sorted(APPROXIMATOR.benchmark(float_range(-0.3, 0.3, 0.0001)))
+    references = [statistics.fmean(errs), statistics.median(errs), errs[round(0.95 * (len(errs) - 1))]]
+    for estimate, reference in zip(estimates.values(), references):
+        assert estimate.converged(0.02)
+        assert estimate.lower <= estimate.value <= estimate.upper
+        assert estimate.value == pytest.approx(reference, rel=0.05)
+
+
+def test_max_samples():
+    # test that sampling stops at the maximal number of samples (without converging)
+    sampler = ErrorSampler(APPROXIMATOR, -0.3, 0.3, batch=32)
+    estimates = sampler.run(rtol=1e-9, max_samples=80)
+    assert sampler.samples == 80
+    assert not all(estimate.converged(1e-9) for estimate in estimates.values())
@@ -0,0 +1,89 @@
+import asyncio
+import math
+
+import pytest
+
+from expapprox import errors
+from expapprox.approximators import BitShiftPadeApproximator, PadeApproximator
+from expapprox.server import EvaluationClient, EvaluationServer
+from expapprox.utils import float_range
+
+DECIMALS = 16
+XS = float_range(-5, 5, 0.01)
+
+
+def test_invalid_server():
+    approximator = BitShiftPadeApproximator(DECIMALS, 3)
+    with pytest.raises(errors.ApproximatorError):
+        EvaluationServer(approximator, max_batch=0)
+    with pytest.raises(errors.ApproximatorError):
+        EvaluationServer(approximator, max_delay=-1)
+    with pytest.raises(errors.ApproximatorError):
+        EvaluationServer(approximator, workers=0)
+
+
+def test_batching():
+    # concurrent requests are coalesced into batches and match direct evaluation
+    approximator = BitShiftPadeApproximator(DECIMALS, 3)
+
+    async def run():
+        async with EvaluationServer(approximator, max_batch=64, max_delay=0.01) as server:
+            await server.start()
+            values = await asyncio.gather(*(server.evaluate(x) for x in XS))
+            return values, server.stats()
+
+    values, stats = asyncio.run(run())
+    with approximator.workdps:
+        assert values == [float(approximator(x)) for x in XS]
+    assert stats["requests"] == len(XS)
+    assert stats["max_batch_size"] == 64
+    assert stats["batches"] < len(XS) / 10
+    assert 0 < stats["p50_latency"] <= stats["p99_latency"]
+    assert stats["queue_depth"] == 0
+
+
+def test_close():
+    # requests queued (or partially batched) when closing are evaluated rather than left unresolved
+    approximator = BitShiftPadeApproximator(DECIMALS, 3)
+
+    async def run():
+        server = EvaluationServer(approximator, max_batch=4, max_delay=60)
+        await server.start()
+        futures = [server.submit(x) for x in XS[:10]]
+        # let the batcher collect a partial batch (waiting for further requests) and queue requests without yielding
+        await asyncio.sleep(0.01)
+        futures += [server.submit(x) for x in XS[10:13]]
+        await server.close()
+        assert all(future.done() for future in futures)
+        return [future.result() for future in futures], server.stats()
+
+    values, stats = asyncio.run(run())
+    with approximator.workdps:
+        assert values == [float(approximator(x)) for x in XS[:13]]
+    assert stats["requests"] == 13 and stats["max_batch_size"] == 4
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_client(workers: int):
+    # clients pipeline inputs over connections and receive answers in order (NaN on error)
+    approximator = PadeApproximator(DECIMALS, 3)
+
+    async def run():
+        async with EvaluationServer(approximator, workers=workers) as server:
+            host, port = await server.start()
+            clients = [await EvaluationClient.connect(host, port) for _ in range(4)]
+            values = await asyncio.gather(*(client.evaluate(XS) for client in clients))
+            stats = await clients[0].stats()
+            for client in clients:
+                await client.close()
+            return values, stats
+
+    values, stats = asyncio.run(run())
+    with approximator.workdps:
+        expected = [float(approximator.try_call(x)) for x in XS]
+    for client_values in values:
+        assert len(client_values) == len(XS)
+        for value, expected_value in zip(client_values, expected):
+            assert value == expected_value or math.isnan(value) and math.isnan(expected_value)
+    assert any(math.isnan(value) for value in expected)
+    assert stats["requests"] == 4 * len(XS)
@@ -0,0 +1,87 @@
+import math
+import timeit
+
+import mpmath
+import pytest
+
+from expapprox import errors
+from expapprox.approximators import BinarySplittingApproximator
+from expapprox.tracker import IntegerTracker
+from expapprox.utils import fixed_range, float_range
+
+
+def test_invalid_tables():
+    with pytest.raises(errors.ApproximatorError):
+        BinarySplittingApproximator(20, -1)
+    # (tables must leave bits of the working precision to the series)
+    with pytest.raises(errors.ApproximatorError):
+        BinarySplittingApproximator(20, 13)
+    BinarySplittingApproximator(20, 0)
+    BinarySplittingApproximator(20, 12)
+
+
+def test_constants():
+    approximator = BinarySplittingApproximator(10)
+
+    assert approximator(0.0) == pytest.approx(1.0)
+    assert approximator(1.0) == pytest.approx(math.e)
+    assert approximator(-1.0) == pytest.approx(1 / math.e)
+
+
+@pytest.mark.parametrize("decimals", [5, 20, 100, 1000])
+@pytest.mark.parametrize("tables", [None, 0, 4])
+def test_precision(decimals: int, tables: int | None):
+    # test that approximations are within 1 ulp of the exact fixed-point values (for outputs at most e)
+    approximator = BinarySplittingApproximator(decimals, tables, backend="int")
+    identity = approximator.identity
+    with mpmath.workdps(decimals + 30):
+        for x in [*range(-20 * identity, identity, identity // 7 + 1), identity, 1, -1]:
+            ref = int(mpmath.floor(mpmath.exp(mpmath.mpf(x) / identity) * identity))
+            assert abs(approximator.approx(x) - ref) <= 1
+
+
+def test_errors():
+    # relative errors are bounded by the decimals for outputs of any magnitude above 1
+    approximator = BinarySplittingApproximator(12)
+    errs = approximator.benchmark(float_range(0, 50, 0.37))
+    assert max(errs) < 1e-11
+
+
+def test_backend():
+    # test that approximations on the gmpy2 backend are identical to built-in ints
+    pytest.importorskip("gmpy2")
+    approximator = BinarySplittingApproximator(200, backend="int")
+    gmpy2_approximator = BinarySplittingApproximator(200, backend="gmpy2")
+    assert repr(gmpy2_approximator) == "BinarySplittingApproximator(decimals=200, tables=5, backend='gmpy2')"
+    for x in range(-3 * approximator.identity, 3 * approximator.identity, approximator.identity // 3 + 7):
+        value = gmpy2_approximator.approx(x)
+        assert type(value) is int
+        assert value == approximator.approx(x)
+    # (tracked integers are not converted to the backend)
+    assert gmpy2_approximator.max_bits([0.5, 3.3]) == approximator.max_bits([0.5, 3.3])
+
+
+def test_max_bits():
+    # test that tracked integers are evaluated as is (on any backend) s.t. bits of intermediaries are tracked
+    approximator = BinarySplittingApproximator(50, backend="int")
+    x = approximator.to_fixed(3.3)
+    with IntegerTracker() as tracker:
+        value = approximator.approx(tracker.int(x))
+    assert isinstance(value, tracker.int) and value == approximator.approx(x)
+    assert approximator.max_bits([3.3]) == tracker.bits > approximator.precision
+
+
+@pytest.mark.parametrize("decimals", [500, 1000, 2000, 5000])
+def test_faster_than_mpmath(decimals: int):
+    # benchmark evaluations on the gmpy2 backend against mpmath at the same precision on inputs in
+    # [-log(2)/2, log(2)/2] (by minimal times of interleaved repeats, see benchmarks/splitting.py)
+    pytest.importorskip("gmpy2")
+    approximator = BinarySplittingApproximator(decimals, backend="gmpy2")
+    xs = list(fixed_range("-0.34", "0.34", "0.05", decimals))
+    with mpmath.workdps(decimals):
+        mpfs = [mpmath.mpf(x) / approximator.identity for x in xs]
+        times, mpmath_times = [], []
+        for _ in range(5):
+            times.append(timeit.timeit(lambda: [approximator.approx(x) for x in xs], number=1))
+            mpmath_times.append(timeit.timeit(lambda: [mpmath.exp(x) for x in mpfs], number=1))
+    assert min(times) < min(mpmath_times)
@@ -0,0 +1,86 @@
+import math
+
+import mpmath
+import pytest
+
+from expapprox import errors
+from expapprox.approximators import (
+    BitShiftPadeApproximator,
+    BitShiftSquaringPadeApproximator,
+    PadeApproximator,
+    SquaringPadeApproximator,
+)
+from expapprox.utils import float_range
+
+DECIMALS = 20
+XS = [x for x in float_range(-5, 5, 0.05) if abs(x) > 0.01]
+
+
+def test_invalid_halvings():
+    with pytest.raises(errors.ApproximatorError):
+        SquaringPadeApproximator(DECIMALS, 3, -1)
+    # no halvings works
+    SquaringPadeApproximator(DECIMALS, 3, 0)
+
+
+def test_no_halvings():
+    # squaring approximators without halvings match their remainder approximators
+    squaring = SquaringPadeApproximator(DECIMALS, 3, 0)
+    bitshift_squaring = BitShiftSquaringPadeApproximator(DECIMALS, 3, 0)
+    approximator = PadeApproximator(DECIMALS, 3)
+    bitshift_approximator = BitShiftPadeApproximator(DECIMALS, 3)
+    for x in XS:
+        x = approximator.to_fixed(x)
+        if abs(x) < approximator.to_fixed(2):
+            assert squaring.approx(x) == approximator.approx(x)
+        assert bitshift_squaring.approx(x) == bitshift_approximator.approx(x)
+
+
+def test_constants():
+    approximator = SquaringPadeApproximator(DECIMALS, 3, 4)
+
+    assert approximator(0.0) == pytest.approx(1.0)
+    assert approximator(1.0) == pytest.approx(math.e)
+    assert approximator(-1.0) == pytest.approx(1 / math.e)
+
+
+def test_halvings():
+    # halvings decrease errors of low-order bit-shifted approximators (at the cost of bits of internal decimals)
+    errs = [max(BitShiftSquaringPadeApproximator(DECIMALS, 2, m).benchmark(XS)) for m in range(4)]
+    assert errs == sorted(errs, reverse=True)
+    bits = [BitShiftSquaringPadeApproximator(DECIMALS, 2, m).max_bits(XS) for m in range(4)]
+    assert bits == sorted(bits)
+
+
+@pytest.mark.parametrize("halvings", [0, 4, 6])
+def test_internal_precision(halvings):
+    # halving at internal precision keeps the low bits of inputs s.t. errors stay within a few units in the last place
+    approximator = SquaringPadeApproximator(DECIMALS, 10, halvings)
+    assert approximator.internal_decimals == DECIMALS + math.ceil(halvings * math.log10(2))
+    x = approximator.to_fixed(1.0)
+    values = [approximator.approx(x + i) for i in range(2**halvings)]
+    assert values == sorted(set(values))
+    with mpmath.workdps(2 * DECIMALS):
+        for i, value in enumerate(values):
+            assert abs(value - mpmath.exp(mpmath.mpf(x + i) / approximator.identity) * approximator.identity) < 8
+
+
+def test_equal_accuracy():
+    # order-4 with 2 halvings is as accurate as order-6 bit-shifted Padé using fewer bits
+    squaring = BitShiftSquaringPadeApproximator(DECIMALS, 4, 2)
+    approximator = BitShiftPadeApproximator(DECIMALS, 6)
+    assert max(squaring.benchmark(XS)) < 10 * max(approximator.benchmark(XS))
+    assert squaring.max_bits(XS) < approximator.max_bits(XS)
+    assert squaring.mean_operations(XS) < approximator.mean_operations(XS)
+
+
+def test_domain():
+    # squaring approximators are valid up to the critical point of their remainder approximators scaled by 2^m (and
+    # rescaled from internal decimals)
+    approximator = SquaringPadeApproximator(DECIMALS, 3, 4)
+    cp = approximator.remainder_approximator.critical_point
+    upper = ((cp << 4) - 1) // 10 ** (approximator.internal_decimals - DECIMALS)
+    assert approximator.domain() == (None, upper)
+    approximator.approx(upper)
+    with pytest.raises(errors.ApproximatorDomainError):
+        approximator.approx(upper + 1)
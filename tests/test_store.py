@@ -0,0 +1,67 @@
+import math
+
+import numpy as np
+import pytest
+
+from expapprox import errors
+from expapprox.approximators import BitShiftPadeApproximator, PadeApproximator
+from expapprox.store import MASKED, OK, OVERFLOW, PENDING, create_store, inputs, join, open_store, outputs, split, sweep
+from expapprox.utils import FloatRange
+
+DECIMALS = 20
+XS = FloatRange(-6, 6, 0.01)
+
+
+def test_limbs():
+    for value in [0, 1, -1, 2**63, -(2**63) - 1, 2**127 - 1, -(2**127)]:
+        assert join(*split(value)) == value
+    assert split(2**127) is None
+
+
+def test_create(tmp_path):
+    store = create_store(tmp_path / "store.npy", 10)
+    assert (store["status"] == PENDING).all()
+    store[3]["error"] = 0.5
+    store.flush()
+    reopened = open_store(tmp_path / "store.npy")
+    assert reopened[3]["error"] == 0.5
+    with pytest.raises(ValueError):
+        reopened[0]["error"] = 1.0
+    np.save(tmp_path / "other.npy", np.zeros(3))
+    with pytest.raises(errors.ApproximatorError):
+        open_store(tmp_path / "other.npy")
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_sweep(tmp_path, workers: int):
+    # results of sweeps (in disjoint chunks) match benchmarks
+    approximator = PadeApproximator(DECIMALS, 3)
+    store = sweep(tmp_path / "store.npy", approximator, XS, workers=workers, chunk_size=100)
+    assert len(store) == len(XS)
+    assert store["x"].tolist() == list(XS)
+    errs = approximator.benchmark(XS)
+    assert [err if math.isfinite(err) else None for err in store["error"]] == [
+        err if math.isfinite(err) else None for err in errs
+    ]
+    fixed = [approximator.to_fixed(x) for x in XS]
+    assert inputs(store) == fixed
+    for x, output, status in zip(fixed, outputs(store), store["status"]):
+        if approximator.in_domain(x):
+            assert status == OK and output == approximator.approx(x)
+        else:
+            assert status == MASKED
+
+
+def test_bits(tmp_path):
+    approximator = BitShiftPadeApproximator(DECIMALS, 3)
+    xs = XS[:50]
+    store = sweep(tmp_path / "store.npy", approximator, xs, bits=True)
+    assert store["bits"].max() == approximator.max_bits(list(xs))
+    assert store["bits"].tolist() == [approximator.max_bits([x]) for x in xs]
+
+
+def test_overflow(tmp_path):
+    approximator = BitShiftPadeApproximator(DECIMALS, 3)
+    store = sweep(tmp_path / "store.npy", approximator, [1.0, 100.0])
+    assert store["status"].tolist() == [OK, OVERFLOW]
+    assert store["error"][1] < 1e-10
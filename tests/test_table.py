@@ -0,0 +1,85 @@
+import math
+
+import pytest
+
+from expapprox import errors
+from expapprox.approximators import BitShiftPadeApproximator, TableApproximator
+from expapprox.utils import float_range
+
+DECIMALS = 16
+UPPER = 0.25
+XS = [*float_range(0, UPPER, 0.001), UPPER]
+
+
+def test_invalid_configuration():
+    with pytest.raises(errors.ApproximatorError):
+        TableApproximator(DECIMALS, 0, UPPER, 1)
+    with pytest.raises(errors.ApproximatorError):
+        TableApproximator(DECIMALS, UPPER, 0, 16)
+    with pytest.raises(errors.ApproximatorError):
+        TableApproximator(DECIMALS, 0, UPPER, 16, source=BitShiftPadeApproximator(DECIMALS - 1, 3))
+
+
+def test_domain():
+    approximator = TableApproximator(DECIMALS, 0, UPPER, 16)
+    approximator.approx(approximator.lower)
+    approximator.approx(approximator.upper)
+    with pytest.raises(errors.ApproximatorDomainError):
+        approximator.approx(approximator.lower - 1)
+    with pytest.raises(errors.ApproximatorDomainError):
+        approximator.approx(approximator.upper + 1)
+    # inputs outside of the domain are masked without raising
+    assert approximator.domain() == (approximator.lower, approximator.upper)
+    assert math.isnan(approximator.try_approx(approximator.upper + 1))
+
+
+def test_knots():
+    # tabulated values are returned exactly at knots
+    approximator = TableApproximator(DECIMALS, 0, UPPER, 16)
+    for i, value in enumerate(approximator.table):
+        x = approximator.lower + i * approximator.spacing
+        if x <= approximator.upper:
+            assert approximator.approx(x) == value
+
+
+def test_certificate():
+    # relative errors are below the certificate, which decreases with the number of knots and correction order
+    certificates = []
+    for knots, order in [(16, 1), (64, 1), (64, 2), (256, 3)]:
+        approximator = TableApproximator(DECIMALS, 0, UPPER, knots, order)
+        assert max(approximator.benchmark(XS)) <= approximator.certificate
+        certificates.append(approximator.certificate)
+    assert certificates == sorted(certificates, reverse=True)
+
+
+def test_underflowing_certificate():
+    # certificate is infinite if tabulated values underflow (and finite bounds hold for small tabulated values)
+    approximator = TableApproximator(DECIMALS, -40, 0, 16)
+    assert min(approximator.table) == 0 and approximator.certificate == math.inf
+    approximator = TableApproximator(DECIMALS, -35, 0, 16)
+    assert max(approximator.benchmark(float_range(-35, 0, 0.01))) <= approximator.certificate < math.inf
+
+
+def test_source():
+    # table from bit-shifted Padé approximator has certificate bounded by its errors
+    source = BitShiftPadeApproximator(DECIMALS, 3)
+    approximator = TableApproximator(DECIMALS, 0, UPPER, 64, 3, source=source)
+    assert max(approximator.benchmark(XS)) <= approximator.certificate
+    # certificate exceeds the errors of the source at the knots only by (small) truncation and rounding errors
+    knot_xs = [approximator.to_float(approximator.lower + i * approximator.spacing) for i in range(64)]
+    source_error = max(source.benchmark(knot_xs))
+    assert source_error <= approximator.certificate <= 1.01 * source_error
+
+
+def test_persistence(tmp_path):
+    approximator = TableApproximator(DECIMALS, 0, UPPER, 64, 2)
+    path = str(tmp_path / "table.bin")
+    approximator.save(path)
+    loaded = TableApproximator.load(path)
+    assert repr(loaded) == repr(approximator)
+    assert loaded.certificate == approximator.certificate
+    assert list(loaded.table) == list(approximator.table)
+    assert all(loaded.approx(approximator.to_fixed(x)) == approximator.approx(approximator.to_fixed(x)) for x in XS)
+    with pytest.raises(IndexError):
+        loaded.table[len(approximator.table)]
+    assert math.isnan(loaded.try_call(2 * UPPER))
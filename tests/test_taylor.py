@@ -49,3 +49,44 @@ def test_errors():
         errs = TaylorApproximator(DECIMALS, order).benchmark(xs)
         err_bound = 4 / math.factorial(order + 1)
         assert all(err < err_bound for err in errs)
+
+
+def test_invalid_backend():
+    with pytest.raises(errors.ApproximatorError):
+        TaylorApproximator(DECIMALS, 3, backend="foo")
+
+
+def test_backend():
+    # test that approximations on the gmpy2 backend are identical built-in ints
+    pytest.importorskip("gmpy2")
+    for decimals in [DECIMALS, 100]:
+        approximator = TaylorApproximator(decimals, 8)
+        gmpy2_approximator = TaylorApproximator(decimals, 8, backend="gmpy2")
+        assert repr(gmpy2_approximator) == f"TaylorApproximator(decimals={decimals}, order=8, backend='gmpy2')"
+        for x in float_range(-3, 3, 0.01):
+            x = approximator.to_fixed(x)
+            value = gmpy2_approximator.approx(x)
+            assert type(value) is int and value == approximator.approx(x)
+        # tracked integers are evaluated as built-in ints
+        assert gmpy2_approximator.max_bits([1.0]) == approximator.max_bits([1.0])
+
+
+def test_auto_backend():
+    # test that the gmpy2 backend is chosen automatically beyond its crossover decimals (if installed)
+    assert TaylorApproximator(DECIMALS, 3, backend="auto").backend == "int"
+    pytest.importorskip("gmpy2")
+    assert TaylorApproximator(100, 3, backend="auto").backend == "gmpy2"
+
+
+def test_normalized():
+    # test that normalized Horner terms reduce the bit width of intermediaries at comparable errors
+    xs = float_range(-1, 1, 0.05)
+    for order in [1, 3, 6, 10, 14]:
+        approximator = TaylorApproximator(16, order)
+        normalized_approximator = TaylorApproximator(16, order, normalized=True)
+        assert repr(normalized_approximator) == f"TaylorApproximator(decimals=16, order={order}, normalized=True)"
+        assert normalized_approximator.max_bits(xs) <= approximator.max_bits(xs)
+        errs = approximator.benchmark(xs)
+        normalized_errs = normalized_approximator.benchmark(xs)
+        assert all(normalized_err < 2 * err + 1e-15 for err, normalized_err in zip(errs, normalized_errs))
+    assert TaylorApproximator(16, 10, normalized=True).max_bits(xs) < TaylorApproximator(16, 10).max_bits(xs)
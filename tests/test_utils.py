@@ -1,6 +1,6 @@
 import pytest
 
-from expapprox.utils import float_range, int_range
+from expapprox.utils import FloatRange, IntRange, LazyRange, fixed_range, float_range, int_range
 
 
 def test_int_range():
@@ -33,3 +33,43 @@ def test_float_range():
         pytest.approx(0.3),
         pytest.approx(0.35),
     ]
+
+
+def test_lazy_ranges():
+    # lazy ranges match eager ranges
+    assert IntRange(-3, 2, 2) == int_range(-3, 2, 2)
+    assert FloatRange(0.1, 0.35, 0.05) == float_range(0.1, 0.35, 0.05)
+    # length, indexing and slicing without materializing
+    xs = IntRange(0, 10**18, 3)
+    assert len(xs) == 10**18 // 3 + 1
+    assert xs[-1] == 10**18 - 1
+    assert xs[10:20:5] == [30, 45]
+    assert len(xs[::2]) == (len(xs) + 1) // 2
+
+
+def test_abstract_lazy_range():
+    # lazy ranges missing a hook fail upon creation
+    class ValueRange(LazyRange[int]):
+        def value(self, i: int) -> int:
+            return i
+
+    with pytest.raises(TypeError):
+        ValueRange(0, 9, 1, 10)
+
+
+def test_chunks():
+    xs = FloatRange(-1, 1, 0.01)
+    chunks = list(xs.chunks(64))
+    assert [len(chunk) for chunk in chunks] == [64, 64, 64, 9]
+    assert [x for chunk in chunks for x in chunk] == float_range(-1, 1, 0.01)
+    # arrays match elementwise
+    assert [x for array in xs.arrays(64) for x in array.tolist()] == float_range(-1, 1, 0.01)
+    assert IntRange(0, 21, 5).array().tolist() == [0, 5, 10, 15, 20]
+    assert IntRange(0, 10**20, 10**19).array().tolist() == int_range(0, 10**20, 10**19)
+
+
+def test_fixed_range():
+    # exact fixed-point grid without floating-point rounding
+    xs = fixed_range("0.1", "0.35", "0.05", 20)
+    assert list(xs) == [10**19 + i * 5 * 10**18 for i in range(6)]
+    assert fixed_range(-1, 1, "0.25", 2) == [-100, -75, -50, -25, 0, 25, 50, 75, 100]
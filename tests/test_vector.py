@@ -0,0 +1,107 @@
+import random
+
+import numpy as np
+import pytest
+
+from expapprox import errors
+from expapprox.approximators import BitShiftPadeApproximator, PadeApproximator
+from expapprox.vector import Int128, VectorizedBitShiftPadeApproximator, multiply
+
+N = 1000
+
+
+def random_ints(bits: int, n: int = N) -> list[int]:
+    return [random.randint(-(2 ** (bits - 1)), 2 ** (bits - 1) - 1) for _ in range(n)]
+
+
+@pytest.mark.parametrize("bits", [10, 63, 64, 100, 126])
+def test_int128(bits: int):
+    # test that limb arithmetic is identical to Python ints
+    random.seed(bits)
+    a, b = random_ints(bits), random_ints(bits)
+    a_limbs, b_limbs = Int128.from_ints(a), Int128.from_ints(b)
+    assert a_limbs.to_ints() == a
+    assert (-a_limbs).to_ints() == [-x for x in a]
+    assert (a_limbs + b_limbs).to_ints() == [x + y for x, y in zip(a, b)]
+    assert (a_limbs - b_limbs).to_ints() == [x - y for x, y in zip(a, b)]
+    right_shifts = [random.randint(0, 127) for _ in a]
+    assert (a_limbs >> np.array(right_shifts)).to_ints() == [x >> k for x, k in zip(a, right_shifts)]
+    left_shifts = [random.randint(0, 127 - bits) for _ in a]
+    assert (a_limbs << np.array(left_shifts)).to_ints() == [x << k for x, k in zip(a, left_shifts)]
+    assert all(abs(float(x) - y) <= abs(x) * 2**-52 for x, y in zip(a, a_limbs.to_float()))
+
+
+def test_int128_conversion():
+    with pytest.raises(errors.ApproximatorError):
+        Int128.from_ints([2**127])
+    assert Int128.from_ints([-(2**127), 2**127 - 1]).to_ints() == [-(2**127), 2**127 - 1]
+    assert Int128.from_ints([-(2**63), 2**63 - 1]).to_int64().tolist() == [-(2**63), 2**63 - 1]
+    with pytest.raises(errors.ApproximatorError):
+        Int128.from_ints([2**63]).to_int64()
+
+
+def test_multiply():
+    random.seed(0)
+    a, b = random_ints(64), random_ints(64)
+    # include extreme limbs
+    a += [-(2**63), -(2**63), 2**63 - 1, 0]
+    b += [-(2**63), 2**63 - 1, 2**63 - 1, -1]
+    assert multiply(np.array(a), np.array(b)).to_ints() == [x * y for x, y in zip(a, b)]
+    # scalar factors broadcast
+    assert multiply(np.array(a), 3).to_ints() == [3 * x for x in a]
+
+
+@pytest.mark.parametrize("divisor_bits", [2, 20, 40, 63])
+def test_floordiv(divisor_bits: int):
+    random.seed(divisor_bits)
+    divisors = [random.randint(1, 2 ** (divisor_bits - 1)) for _ in range(N)]
+    dividends = [random.randint(-(2**62) * d, 2**62 * d) for d in divisors]
+    quotients = Int128.from_ints(dividends).floordiv(np.array(divisors))
+    assert quotients.tolist() == [x // d for x, d in zip(dividends, divisors)]
+    # quotients exceeding a single limb fail
+    with pytest.raises(errors.ApproximatorError):
+        Int128.from_ints([2**100]).floordiv(3)
+
+
+@pytest.mark.parametrize(
+    "approximator",
+    [
+        BitShiftPadeApproximator(16, 1),
+        BitShiftPadeApproximator(16, 3),
+        BitShiftPadeApproximator(16, 3, normalized=True),
+        BitShiftPadeApproximator(10, 4, normalized=True),
+    ],
+)
+def test_identical(approximator: BitShiftPadeApproximator):
+    # test that vectorized approximations are bit-identical to the scalar approximations
+    vectorized = VectorizedBitShiftPadeApproximator(approximator)
+    assert repr(vectorized) == f"VectorizedBitShiftPadeApproximator({approximator!r})"
+    random.seed(approximator.decimals)
+    identity = approximator.identity
+    xs = [random.randint(-50 * identity, 50 * identity) for _ in range(N)]
+    # include boundaries of range reduction and underflow
+    for k in range(-5, 6):
+        boundary = k * approximator.log2 - approximator.log2half
+        xs += [boundary - 1, boundary, boundary + 1]
+    xs += [0, 1, -1, approximator.underflow, approximator.underflow + 1, -(2**63)]
+    assert vectorized.approx(np.array(xs)).to_ints() == [approximator.approx(x) for x in xs]
+
+
+def test_invalid_approximator():
+    # non-bit-shifted approximators, internal decimals and intermediaries exceeding two limbs fail
+    with pytest.raises(errors.ApproximatorError):
+        VectorizedBitShiftPadeApproximator(PadeApproximator(16, 3))
+    with pytest.raises(errors.ApproximatorError):
+        VectorizedBitShiftPadeApproximator(BitShiftPadeApproximator(14, 3, internal_decimals=16))
+    with pytest.raises(errors.ApproximatorError):
+        VectorizedBitShiftPadeApproximator(BitShiftPadeApproximator(16, 5))
+
+
+def test_overflow():
+    approximator = BitShiftPadeApproximator(16, 3)
+    vectorized = VectorizedBitShiftPadeApproximator(approximator)
+    # outputs beyond 128 bits fail (and inputs beyond range reduction)
+    with pytest.raises(errors.ApproximatorError):
+        vectorized.approx(np.array([60 * approximator.identity]))
+    with pytest.raises(errors.ApproximatorError):
+        vectorized.approx(np.array([2**63 - 1]))